@@ -45,3 +45,32 @@ def test_compute_bscores(monkeypatch, tmp_path):
     assert df.loc[0, "edge_density"] == 0.2
     assert df.loc[0, "fragmentation"] == 0.2
     assert df.loc[0, "msa"] == 0.5
+
+
+def test_metrics_result_from_dict():
+    res = MetricsResult.from_dict(
+        {
+            "intactness": "0.5",
+            "shannon": 1,
+            "fragmentation": {"edge_density": 0.2, "normalised_density": 0.3},
+        }
+    )
+    assert res.intactness == 0.5
+    assert res.shannon == 1.0
+    assert res.fragmentation.normalised_density == 0.3
+    assert res.msa == 0.0
+
+
+def test_weights_from_yaml_cache_invalidates_on_change(tmp_path):
+    import os
+
+    path = tmp_path / "w.yaml"
+    path.write_text("intactness: 2\n")
+    first = WeightsConfig.from_yaml(path)
+    second = WeightsConfig.from_yaml(str(path))
+    assert second == first and second is not first
+
+    path.write_text("intactness: 3\n")
+    st = path.stat()
+    os.utime(path, (st.st_atime, st.st_mtime + 5))
+    assert WeightsConfig.from_yaml(path).intactness == 3.0
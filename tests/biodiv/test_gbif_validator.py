@@ -121,6 +121,11 @@ def test_occurrence_density():
     assert dens == 2.0
 
 
+def test_occurrence_densities_vectorised():
+    dens = OccurrenceService.occurrence_densities_km2([2, 3, 4], [1.0, 0.0, 2.0])
+    assert dens.tolist() == [2.0, 0.0, 2.0]
+
+
 def test_fetch_occurrences_with_shapely(monkeypatch):
     def fake_gbif(**_k):
         return {"results": _fake_records(2)}
@@ -1,3 +1,4 @@
+import pytest
 import pandas as pd
 from verdesat.analytics.engine import AnalyticsEngine
 from verdesat.analytics.timeseries import TimeSeries
@@ -11,3 +12,19 @@ def test_compute_trend():
     df_trend = trend.to_dataframe()
     assert not df_trend.empty
     assert list(df_trend.columns) == ["id", "date", "trend"]
+
+
+def test_compute_trend_matches_linear_fit():
+    from verdesat.analytics.trend import compute_trend
+
+    dates = pd.to_datetime(["2020-01-01", "2020-01-11", "2020-01-21", "2020-01-31"])
+    df = pd.DataFrame(
+        {
+            "id": [2, 2, 2, 2, 1],
+            "date": list(dates) + [dates[0]],
+            "mean_ndvi": [0.0, 1.0, None, 3.0, 0.4],
+        }
+    )
+    out = compute_trend(df).to_dataframe()
+    assert out["id"].tolist() == [1, 2, 2, 2]
+    assert out["trend"].tolist() == pytest.approx([0.4, 0.0, 1.0, 3.0], abs=1e-9)
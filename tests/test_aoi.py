@@ -129,3 +129,79 @@ def test_from_file_and_from_gdf(tmp_path, monkeypatch):
     aois = AOI.from_file(str(fp), id_col="id")
     assert len(aois) == 1
     assert aois[0].static_props["id"] == 5
+
+
+def test_from_geojson_prefers_fresh_parquet_sibling(tmp_path):
+    import os
+    import geopandas as gpd
+
+    gj_path = tmp_path / "aoi.geojson"
+    gj_path.write_text(
+        json.dumps(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "type": "Feature",
+                        "properties": {"id": 1},
+                        "geometry": mapping(Polygon([(0, 0), (1, 0), (1, 1)])),
+                    }
+                ],
+            }
+        )
+    )
+    gdf = gpd.GeoDataFrame(
+        {"id": [7, 8]},
+        geometry=[Polygon([(0, 0), (1, 0), (1, 1)]), Polygon([(5, 5), (6, 5), (6, 6)])],
+        crs="EPSG:4326",
+    )
+    pq_path = tmp_path / "aoi.parquet"
+    gdf.to_parquet(pq_path, write_covering_bbox=True)
+
+    # The sibling is only read when asked for.
+    assert [a.static_props["id"] for a in AOI.from_geojson(str(gj_path))] == [1]
+    ids = [
+        a.static_props["id"]
+        for a in AOI.from_geojson(str(gj_path), prefer_parquet=True)
+    ]
+    assert ids == [7, 8]
+    subset = AOI.from_parquet(str(pq_path), bbox=(4, 4, 7, 7))
+    assert [a.static_props["id"] for a in subset] == [8]
+
+    # A GeoJSON edited after the sibling was written wins again.
+    st = pq_path.stat()
+    os.utime(gj_path, (st.st_atime, st.st_mtime + 5))
+    stale = AOI.from_geojson(str(gj_path), prefer_parquet=True)
+    assert [a.static_props["id"] for a in stale] == [1]
+
+
+def test_from_geojson_caches_until_file_changes(tmp_path):
+    import os
+
+    fp = tmp_path / "cached.geojson"
+
+    def _write(pid):
+        feat = {
+            "type": "Feature",
+            "properties": {"id": pid},
+            "geometry": mapping(Polygon([(0, 0), (1, 0), (1, 1)])),
+        }
+        fp.write_text(json.dumps({"type": "FeatureCollection", "features": [feat]}))
+
+    _write(1)
+    first = AOI.from_geojson(str(fp))
+    first[0].static_props["id"] = 99
+    second = AOI.from_geojson(str(fp))
+    assert second[0].static_props["id"] == 1
+    assert second[0] is not first[0]
+
+    from verdesat.geo.aoi import _load_aois
+
+    hits = _load_aois.cache_info().hits
+    AOI.from_geojson(os.path.join(str(tmp_path), ".", "cached.geojson"))
+    assert _load_aois.cache_info().hits == hits + 1
+
+    _write(2)
+    st = fp.stat()
+    os.utime(fp, (st.st_atime, st.st_mtime + 5))
+    assert AOI.from_geojson(str(fp))[0].static_props["id"] == 2
@@ -156,6 +156,43 @@ def test_palette_dropped_when_gamma(tmp_export_dir, monkeypatch):
     assert "palette" not in params and params["gamma"] == [0.7]
 
 
+def test_palette_names_resolved_to_hex(tmp_export_dir):
+    from verdesat.visualization._chips_config import ChipsConfig
+
+    base = dict(
+        collection="C",
+        start="2020-01-01",
+        end="2020-12-31",
+        period="ME",
+        chip_type="ndvi",
+        scale=30,
+        buffer=0,
+        buffer_percent=None,
+        min_val=None,
+        max_val=None,
+        gamma=None,
+        percentile_low=None,
+        percentile_high=None,
+        fmt="png",
+        out_dir="chips",
+        mask_clouds=True,
+    )
+
+    def _palette(arg):
+        return ChipsConfig.from_cli(palette_arg=arg, **base).palette
+
+    assert _palette("white-green") == ("ffffff", "008000")
+    assert _palette("#abcdef, Red") == ("#abcdef", "ff0000")
+    assert _palette(" blue ,, green ") == ("0000ff", "008000")
+    assert _palette(None) is None
+
+    exporter = ChipExporter(
+        ee_manager=MagicMock(), out_dir=str(tmp_export_dir), fmt="png"
+    )
+    params = exporter._build_viz_params(["NDVI"], 0, 1, 10, "ffffff,008000", None)
+    assert params["palette"] == "ffffff,008000"
+
+
 # -------------------------------------------------------------------
 # 4) Identifier sanitization
 # -------------------------------------------------------------------
@@ -207,3 +244,185 @@ def test_export_one_sanitizes_aoi_id(
     assert dest == str(out_path)
     assert out_path.exists()
     assert out_path.read_bytes() == b"PNGDATA"
+
+
+# -------------------------------------------------------------------
+# 5) HTTP 429 responses are retried with backoff
+# -------------------------------------------------------------------
+def test_download_retries_rate_limited(tmp_export_dir, monkeypatch):
+    class _FakeResp:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.content = b"PNGDATA"
+
+        def raise_for_status(self):
+            return None
+
+    statuses = iter([429, 429, 200])
+    monkeypatch.setattr(
+        "verdesat.visualization.chips.requests",
+        types.SimpleNamespace(get=lambda *_a, **_k: _FakeResp(next(statuses))),
+        raising=False,
+    )
+    sleeps = []
+    monkeypatch.setattr("verdesat.visualization.chips.time.sleep", sleeps.append)
+
+    exporter = ChipExporter(
+        ee_manager=MagicMock(), out_dir=str(tmp_export_dir), fmt="png"
+    )
+    assert exporter._download("https://example.test/chip") == b"PNGDATA"
+    assert sleeps == [1.0, 2.0]
+
+
+# -------------------------------------------------------------------
+# 6) AOI bounding boxes are fetched in one batched getInfo call
+# -------------------------------------------------------------------
+def test_region_bboxes_batches_and_skips_per_chip_lookup(
+    tmp_export_dir, dummy_img, monkeypatch
+):
+    class _FakeResp:
+        status_code = 200
+        content = b"PNGDATA"
+
+        def raise_for_status(self):
+            return None
+
+    monkeypatch.setattr(
+        "verdesat.visualization.chips.requests",
+        types.SimpleNamespace(get=lambda *_a, **_k: _FakeResp()),
+        raising=False,
+    )
+    monkeypatch.setattr("verdesat.visualization.chips.ee.List", list)
+
+    aois = []
+    for pid in (1, 2):
+        aoi = MagicMock()
+        aoi.static_props = {"id": pid}
+        aois.append(aoi)
+
+    exporter = ChipExporter(
+        ee_manager=MagicMock(), out_dir=str(tmp_export_dir), fmt="png"
+    )
+    exporter.ee_manager.safe_get_info.return_value = [
+        {"coordinates": [[[0, 0], [1, 0], [1, 2], [0, 2]]]},
+        {"coordinates": [[[5, 5], [6, 5], [6, 6], [5, 6]]]},
+    ]
+    bboxes = exporter.region_bboxes(aois, buffer_m=0)
+    assert bboxes == [[0, 0, 1, 2], [5, 5, 6, 6]]
+    assert exporter.ee_manager.safe_get_info.call_count == 1
+
+    exporter.export_one(
+        img=dummy_img,
+        aoi=aois[0],
+        date_str="2024-01-01",
+        com_type="RGB",
+        bands=["red"],
+        palette=None,
+        scale=30,
+        buffer_m=0,
+        gamma=None,
+        min_val=0,
+        max_val=1,
+        region_bbox=bboxes[0],
+    )
+    assert exporter.ee_manager.safe_get_info.call_count == 1
+    assert (tmp_export_dir / "RGB_1_2024-01-01.png").exists()
+
+
+# -------------------------------------------------------------------
+# 7) GeoTIFF downloads are always converted to COG locally
+# -------------------------------------------------------------------
+def test_export_one_geotiff_converts_to_cog_locally(tmp_export_dir, monkeypatch):
+    class _FakeResp:
+        status_code = 200
+        content = b"TIFFDATA"
+
+        def raise_for_status(self):
+            return None
+
+    monkeypatch.setattr(
+        "verdesat.visualization.chips.requests",
+        types.SimpleNamespace(get=lambda *_a, **_k: _FakeResp()),
+        raising=False,
+    )
+    converted = []
+    monkeypatch.setattr(
+        "verdesat.visualization.chips.convert_to_cog",
+        lambda path, **k: converted.append((path, k["geometry"])),
+    )
+
+    dummy_aoi = MagicMock()
+    dummy_aoi.static_props = {"id": 1}
+    exporter = ChipExporter(
+        ee_manager=MagicMock(), out_dir=str(tmp_export_dir), fmt="geotiff"
+    )
+    img = MagicMock()
+    clipped = img.clip.return_value
+    clipped.getDownloadURL.return_value = "https://example.test/tif"
+
+    dest = exporter.export_one(
+        img=img,
+        aoi=dummy_aoi,
+        date_str="2024-01-01",
+        com_type="NDVI",
+        bands=["NDVI"],
+        palette=None,
+        scale=30,
+        buffer_m=0,
+        gamma=None,
+        min_val=0,
+        max_val=1,
+        region_bbox=[0, 0, 1, 1],
+    )
+
+    assert dest == str(tmp_export_dir / "NDVI_1_2024-01-01.tif")
+    assert converted == [(dest, dummy_aoi.geometry)]
+    assert clipped.getDownloadURL.call_args[0][0]["format"] == "GEOTIFF"
+
+
+# -------------------------------------------------------------------
+# 8) Composites without a timestamp are skipped, not fatal
+# -------------------------------------------------------------------
+def test_chip_service_skips_composites_without_time(tmp_export_dir, monkeypatch):
+    from verdesat.visualization import chips as chips_mod
+    from verdesat.visualization._chips_config import ChipsConfig
+
+    monkeypatch.setattr(chips_mod.ee, "FeatureCollection", MagicMock())
+    monkeypatch.setattr(chips_mod.ee, "Image", MagicMock())
+    monkeypatch.setattr(chips_mod.ee, "Reducer", MagicMock())
+    monkeypatch.setattr(
+        chips_mod.AnalyticsEngine, "build_composites", MagicMock(), raising=False
+    )
+    monkeypatch.setattr(
+        ChipExporter, "region_bboxes", lambda self, aois, buffer: [None] * len(aois)
+    )
+    exported = []
+    monkeypatch.setattr(
+        ChipExporter,
+        "export_one",
+        lambda self, **kw: exported.append(kw["date_str"]),
+    )
+
+    manager = MagicMock()
+    manager.safe_get_info.return_value = [1704067200000, None, 1706745600000]
+    aoi = MagicMock()
+    aoi.static_props = {"id": 1}
+    aoi.geometry.__geo_interface__ = {"type": "Point", "coordinates": [0, 0]}
+    config = ChipsConfig(
+        collection_id="C",
+        start="2024-01-01",
+        end="2024-02-29",
+        period="ME",
+        chip_type="ndvi",
+        scale=30,
+        buffer=0,
+        buffer_percent=None,
+        min_val=None,
+        max_val=None,
+        gamma=None,
+        percentile_low=None,
+        percentile_high=None,
+        out_dir=str(tmp_export_dir),
+    )
+    chips_mod.ChipService(manager, MagicMock()).run([aoi], config)
+    assert exported == ["2024-01-01", "2024-02-01"]
@@ -1,5 +1,6 @@
 import json
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import geopandas as gpd
 from click.testing import CliRunner
@@ -7,6 +8,8 @@ from unittest.mock import MagicMock
 
 from verdesat.core.cli import cli
 from verdesat.core.storage import LocalFS
+from verdesat.ingestion.base import BaseDataIngestor
+from verdesat.ingestion.eemanager import ee_manager
 
 
 def test_timeseries_value_col_passed(tmp_path, monkeypatch, dummy_aoi):
@@ -29,13 +32,23 @@ def test_timeseries_value_col_passed(tmp_path, monkeypatch, dummy_aoi):
             calls["freq"] = freq
             return pd.DataFrame({"id": [1], "date": [start_date], value_col: [0.5]})
 
+        download_timeseries_batch = BaseDataIngestor.download_timeseries_batch
+
     monkeypatch.setattr(
         "verdesat.services.timeseries.create_ingestor",
-        lambda backend, sensor, ee_manager_instance=None, logger=None: DummyIngestor(),
+        lambda backend, sensor, ee_manager_instance=None, logger=None, **kw: (
+            calls.update(manager=ee_manager_instance, **kw) or DummyIngestor()
+        ),
+    )
+    monkeypatch.setattr(
+        "verdesat.ingestion.eemanager.EarthEngineManager.initialize",
+        lambda self, high_volume=None, force=False: calls.update(
+            high_volume=high_volume
+        ),
     )
     monkeypatch.setattr(
         "verdesat.services.timeseries.AOI.from_geojson",
-        lambda path, id_col: [dummy_aoi],
+        lambda path, id_col, **_: [dummy_aoi],
     )
     monkeypatch.setattr(
         "verdesat.services.timeseries.SensorSpec.from_collection_id", lambda cid: None
@@ -60,10 +73,22 @@ def test_timeseries_value_col_passed(tmp_path, monkeypatch, dummy_aoi):
             "evi",
             "--value-col",
             "mean_evi",
+            "--output",
+            str(tmp_path / "ts.parquet"),
+            "--tile-scale",
+            "4",
         ],
     )
     assert result.exit_code == 0
     assert calls["value_col"] == "mean_evi"
+    assert calls["high_volume"] is True
+    assert calls["manager"] is ee_manager
+    assert calls["tile_scale"] == 4
+    assert pd.read_parquet(tmp_path / "ts.parquet")["mean_evi"].tolist() == [0.5]
+
+    params = {p.name: p for p in cli.commands["download"].commands["timeseries"].params}
+    assert params["n_jobs"].opts == ["--workers", "-w"]
+    assert params["n_jobs"].default == 8
 
 
 def test_landcover_cli(monkeypatch, tmp_path):
@@ -151,6 +176,15 @@ def test_bscore_cli(tmp_path):
     assert result.exit_code == 0
     assert result.output.strip()
 
+    # Click opens the file itself, so metrics can also be piped via stdin.
+    piped = runner.invoke(
+        cli,
+        ["bscore", "compute", "-", "--weights", str(weights_path)],
+        input=json.dumps(metrics),
+    )
+    assert piped.exit_code == 0
+    assert piped.output == result.output
+
 
 def test_bscore_geojson_cli(monkeypatch, tmp_path):
     called = {}
@@ -217,15 +251,17 @@ def test_validate_occurrence_density_cli(monkeypatch, tmp_path, dummy_aoi):
             return gpd.GeoDataFrame({"geometry": [dummy_aoi.geometry]}, crs="EPSG:4326")
 
         @staticmethod
-        def occurrence_density_km2(_gdf, _area):
+        def occurrence_densities_km2(counts, areas):
             svc["density"] = True
-            return 0.5
+            return np.full(len(counts), 0.5)
 
     monkeypatch.setattr(
         "verdesat.core.cli.OccurrenceService", lambda logger=None: DummyService()
     )
     monkeypatch.setattr(
-        "verdesat.core.cli.AOI.from_geojson", lambda p, id_col: [dummy_aoi]
+        "verdesat.core.cli.AOI.from_geojson",
+        lambda p, id_col, prefer_parquet: svc.update(prefer=prefer_parquet)
+        or [dummy_aoi],
     )
     monkeypatch.setattr(
         pd.DataFrame,
@@ -239,9 +275,17 @@ def test_validate_occurrence_density_cli(monkeypatch, tmp_path, dummy_aoi):
     out = tmp_path / "dens.csv"
     result = runner.invoke(
         cli,
-        ["validate", "occurrence-density", str(geojson), "--output", str(out)],
+        [
+            "--prefer-parquet",
+            "validate",
+            "occurrence-density",
+            str(geojson),
+            "--output",
+            str(out),
+        ],
     )
     assert result.exit_code == 0
+    assert svc["prefer"] is True
     assert svc["fetch"] == 1
     assert svc.get("density")
     assert out.exists()
@@ -284,3 +328,297 @@ def test_msa_cli(monkeypatch, tmp_path):
     assert result.exit_code == 0
     assert called["geojson"] == str(geojson)
     assert called["dataset_uri"] == "s3://bucket/file.tif"
+
+
+def test_plot_skips_when_up_to_date(monkeypatch, tmp_path):
+    datafile = tmp_path / "ts.csv"
+    datafile.write_text("id,date,mean_ndvi\n1,2020-01-01,0.5\n")
+    out = tmp_path / "plot.html"
+    out.write_text("html")
+    calls = []
+    monkeypatch.setattr(
+        "verdesat.visualization.visualizer.Visualizer.plot_timeseries_html",
+        lambda self, *a, **k: calls.append(a),
+    )
+
+    runner = CliRunner()
+    args = ["visualize", "plot", "-d", str(datafile), "-o", str(out)]
+    assert runner.invoke(cli, args).exit_code == 0
+    assert len(calls) == 1
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0
+    assert "Up to date" in result.output
+    assert len(calls) == 1
+
+    # Different options rebuild even though the output is newer.
+    assert runner.invoke(cli, args + ["--agg-freq", "ME"]).exit_code == 0
+    assert len(calls) == 2
+    result = runner.invoke(cli, args + ["--agg-freq", "ME"])
+    assert "Up to date" in result.output
+
+    result = runner.invoke(cli, args + ["--agg-freq", "ME", "--force"])
+    assert result.exit_code == 0
+    assert len(calls) == 3
+
+
+def test_report_reports_all_missing_paths(tmp_path):
+    geojson = tmp_path / "aoi.geojson"
+    geojson.write_text("{}")
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "report",
+            str(geojson),
+            str(tmp_path / "ts.csv"),
+            str(tmp_path / "ts.html"),
+            "-d",
+            str(tmp_path),
+            "-c",
+            str(tmp_path / "chips"),
+        ],
+    )
+    assert result.exit_code == 2
+    assert "timeseries_csv" in result.output
+    assert "timeseries_html" in result.output
+    assert "chips_dir" in result.output
+    assert "geojson=" not in result.output
+
+
+def test_animate_skips_unchanged_inputs(monkeypatch, tmp_path):
+    images = tmp_path / "chips"
+    images.mkdir()
+    (images / "NDVI_1_2020-01-01.png").write_bytes(b"png")
+    gifs = tmp_path / "gifs"
+    calls = []
+
+    def _make_gifs(self, **kw):
+        calls.append(kw)
+        gifs.mkdir(exist_ok=True)
+        (gifs / "1__png.gif").write_bytes(b"gif")
+
+    monkeypatch.setattr(
+        "verdesat.visualization.visualizer.Visualizer.make_gifs_per_site", _make_gifs
+    )
+
+    runner = CliRunner()
+    args = ["visualize", "animate", str(images), "-o", str(gifs)]
+    assert runner.invoke(cli, args).exit_code == 0
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0
+    assert "Up to date" in result.output
+    assert len(calls) == 1
+
+    (images / "NDVI_1_2020-02-01.png").write_bytes(b"png")
+    assert runner.invoke(cli, args).exit_code == 0
+    assert len(calls) == 2
+
+    # Deleted GIFs are rebuilt even though the inputs did not change.
+    (gifs / "1__png.gif").unlink()
+    assert runner.invoke(cli, args).exit_code == 0
+    assert len(calls) == 3
+
+
+def test_chips_skips_unchanged_inputs(monkeypatch, tmp_path):
+    geojson = tmp_path / "aoi.geojson"
+    geojson.write_text('{"type": "FeatureCollection", "features": []}')
+    out_dir = tmp_path / "chips"
+    calls = []
+
+    class DummyIngestor:
+        def download_chips(self, aois, config):
+            calls.append(config.palette)
+            out_dir.mkdir(exist_ok=True)
+            (out_dir / "NDVI_1_2020-01-01.png").write_bytes(b"png")
+
+    monkeypatch.setattr("verdesat.core.cli.AOI.from_geojson", lambda *a, **k: [])
+    monkeypatch.setattr(
+        "verdesat.ingestion.sensorspec.SensorSpec.from_collection_id",
+        lambda cid: None,
+    )
+    monkeypatch.setattr(
+        "verdesat.ingestion.create_ingestor", lambda *a, **k: DummyIngestor()
+    )
+
+    runner = CliRunner()
+    args = ["download", "chips", str(geojson), "-o", str(out_dir)]
+    assert runner.invoke(cli, args).exit_code == 0
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    assert "up to date" in result.output
+    assert len(calls) == 1
+
+    assert runner.invoke(cli, [*args, "--palette", "white-green"]).exit_code == 0
+    (out_dir / "NDVI_1_2020-01-01.png").unlink()
+    assert runner.invoke(cli, [*args, "--palette", "white-green"]).exit_code == 0
+    assert (
+        runner.invoke(cli, [*args, "--palette", "white-green", "--force"]).exit_code
+        == 0
+    )
+    assert len(calls) == 4
+
+
+def test_run_spec_chains_commands(tmp_path):
+    csv = tmp_path / "ts.csv"
+    csv.write_text(
+        "id,date,mean_ndvi\n1,2020-01-01,0.1\n1,2020-01-15,0.3\n1,2020-02-01,0.5\n"
+    )
+    monthly = tmp_path / "monthly.csv"
+    trend = tmp_path / "trend.csv"
+    spec = tmp_path / "pipeline.yaml"
+    spec.write_text(
+        "steps:\n"
+        f"  - stats aggregate: {{input_csv: '{csv}', freq: ME, output: '{monthly}'}}\n"
+        f"  - stats trend: {{input_csv: '{monthly}', output: '{trend}'}}\n"
+    )
+
+    result = CliRunner().invoke(cli, ["run", str(spec)])
+    assert result.exit_code == 0, result.output
+    assert len(pd.read_csv(monthly)) == 2
+    assert trend.exists()
+
+    spec.write_text("steps:\n  - stats nope: {}\n")
+    result = CliRunner().invoke(cli, ["run", str(spec)])
+    assert result.exit_code == 2
+    assert "Unknown pipeline step" in result.output
+
+    # Values go through Click: paths are checked and numbers converted.
+    spec.write_text(
+        f"steps:\n  - stats trend: {{input_csv: '{tmp_path / 'missing.csv'}'}}\n"
+    )
+    result = CliRunner().invoke(cli, ["run", str(spec)])
+    assert result.exit_code == 2
+    assert "does not exist" in result.output
+
+    series = tmp_path / "series.csv"
+    dates = pd.date_range("2020-01-31", periods=8, freq="ME")
+    pd.DataFrame(
+        {"id": 1, "date": dates, "mean_ndvi": [0.1, 0.5, 0.2, 0.6] * 2}
+    ).to_csv(series, index=False)
+    decomp = tmp_path / "decomp"
+    spec.write_text(
+        "steps:\n"
+        f"  - stats decompose: {{input_csv: '{series}', output_dir: '{decomp}',"
+        " period: '2', plot: 'no', jobs: 1}\n"
+    )
+    result = CliRunner().invoke(cli, ["run", str(spec)])
+    assert result.exit_code == 0, result.output
+    assert (decomp / "1_decomposition.csv").exists()
+    assert not (decomp / "1_decomposition.png").exists()
+
+    spec.write_text(f"steps:\n  - stats trend: {{input_csv: '{csv}', bogus: 1}}\n")
+    result = CliRunner().invoke(cli, ["run", str(spec)])
+    assert result.exit_code == 2
+    assert "bogus" in result.output
+
+
+def test_validate_occurrence_density_single_query(monkeypatch, tmp_path):
+    from shapely.geometry import Point, box
+    from verdesat.geo.aoi import AOI
+
+    aois = [AOI(box(0, 0, 1, 1), {"id": 1}), AOI(box(5, 5, 6, 6), {"id": 2})]
+    fetched = []
+
+    class DummyService:
+        def fetch_occurrences(self, geom, start_year=2000):
+            fetched.append(geom)
+            pts = [Point(0.5, 0.5), Point(0.2, 0.2), Point(5.5, 5.5)]
+            return gpd.GeoDataFrame({"geometry": pts}, crs="EPSG:4326")
+
+        occurrence_densities_km2 = staticmethod(lambda counts, _areas: counts)
+
+    monkeypatch.setattr(
+        "verdesat.core.cli.OccurrenceService", lambda logger=None: DummyService()
+    )
+    monkeypatch.setattr(
+        "verdesat.core.cli.AOI.from_geojson", lambda p, id_col, **_: aois
+    )
+
+    geojson = tmp_path / "aoi.geojson"
+    geojson.write_text("{}")
+    out = tmp_path / "dens.csv"
+    result = CliRunner().invoke(
+        cli,
+        ["validate", "occurrence-density", str(geojson), "-o", str(out)]
+        + ["--single-query"],
+    )
+    assert result.exit_code == 0, result.output
+    assert len(fetched) == 1
+    assert pd.read_csv(out)["density"].tolist() == [2, 1]
+
+
+def test_decompose_parallel_matches_sequential(tmp_path, monkeypatch):
+    dates = pd.date_range("2020-01-31", periods=36, freq="ME")
+    months = np.arange(36)
+    df = pd.concat(
+        pd.DataFrame(
+            {
+                "id": pid,
+                "date": dates,
+                "mean_ndvi": 0.5 + 0.1 * np.sin(months * np.pi / 6) + 0.01 * pid,
+            }
+        )
+        for pid in (1, 2, 3)
+    )
+    csv = tmp_path / "ts.csv"
+    df.to_csv(csv, index=False)
+
+    monkeypatch.setattr("verdesat.core.cli._DECOMPOSE_MIN_PARALLEL", 1)
+    runner = CliRunner()
+    outputs = {}
+    for jobs in ("1", "2"):
+        out_dir = tmp_path / f"jobs{jobs}"
+        result = runner.invoke(
+            cli,
+            [
+                "stats",
+                "decompose",
+                str(csv),
+                "--output-dir",
+                str(out_dir),
+                "--no-plot",
+                "--jobs",
+                jobs,
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        outputs[jobs] = {p.name: p.read_text() for p in out_dir.iterdir()}
+    assert sorted(outputs["1"]) == [f"{i}_decomposition.csv" for i in (1, 2, 3)]
+    assert outputs["1"] == outputs["2"]
+
+    from verdesat.analytics.stats import compute_summary_stats
+
+    pq_dir = tmp_path / "pq"
+    args = ["stats", "decompose", str(csv), "-o", str(pq_dir), "--no-plot"]
+    result = runner.invoke(cli, [*args, "--format", "parquet"])
+    assert result.exit_code == 0, result.output
+    assert [p.name for p in pq_dir.iterdir()] == ["decomposition.parquet"]
+    from_csv = compute_summary_stats(str(csv), decomp_dir=str(tmp_path / "jobs1"))
+    from_pq = compute_summary_stats(str(csv), decomp_dir=str(pq_dir))
+    pd.testing.assert_frame_equal(from_csv.to_dataframe(), from_pq.to_dataframe())
+
+    # A per-site CSV newer than the parquet means the parquet is stale.
+    import os
+    import shutil
+
+    newer = pq_dir / "1_decomposition.csv"
+    shutil.copy(tmp_path / "jobs1" / "1_decomposition.csv", newer)
+    mtime = (pq_dir / "decomposition.parquet").stat().st_mtime + 5
+    os.utime(newer, (mtime, mtime))
+    mixed = compute_summary_stats(str(csv), decomp_dir=str(pq_dir)).to_dataframe()
+    amp = mixed.set_index("Site ID")["Seasonal Amplitude"]
+    assert (
+        amp[1] == from_csv.to_dataframe().set_index("Site ID")["Seasonal Amplitude"][1]
+    )
+    assert amp[[2, 3]].isna().all()
+
+
+def test_cli_import_defers_earth_engine():
+    import subprocess
+    import sys
+
+    code = "import sys, verdesat.core.cli; print(type(sys.modules['ee']).__name__)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "_LazyModule"
@@ -49,6 +49,51 @@ def test_download_timeseries_no_aggregation(
     assert df.iloc[0]["mean_ndvi"] == 0.5
 
 
+def test_download_timeseries_batch_one_request_per_group(
+    dummy_aoi, dummy_sensor, _dummy_ee_manager, monkeypatch
+):
+    """AOIs are grouped into one chunked request and returned in AOI order."""
+    from verdesat.geo.aoi import AOI
+
+    calls = []
+
+    def fake_chunks(self, start, end, chunk_freq, **kwargs):
+        batched = isinstance(kwargs["aoi"], list)
+        group = kwargs["aoi"] if batched else [kwargs["aoi"]]
+        calls.append(len(group))
+        rows = [
+            (pos, aoi.static_props["id"], date, 0.1 * pos)
+            for date in ("2020-01-02", "2020-01-01")
+            for pos, aoi in reversed(list(enumerate(group)))
+        ]
+        df = pd.DataFrame(rows, columns=["_aoi", "id", "date", "mean_ndvi"])
+        df["date"] = pd.to_datetime(df["date"])
+        if not batched:
+            df = df.drop(columns="_aoi").sort_values("date")
+        return df
+
+    monkeypatch.setattr(
+        "verdesat.ingestion.downloader.EarthEngineDownloader.download_with_chunks",
+        fake_chunks,
+    )
+    aois = [AOI(dummy_aoi.geometry, {"id": pid}) for pid in (7, 3, 5)]
+    di = EarthEngineIngestor(sensor=dummy_sensor, aois_per_request=2)
+    frames = di.download_timeseries_batch(
+        aois, "2020-01-01", "2020-01-02", 30, "ndvi", value_col="mean_ndvi"
+    )
+
+    assert calls == [2, 1]
+    assert [f["id"].unique().tolist() for f in frames] == [[7], [3], [5]]
+    df = pd.concat(frames, ignore_index=True)
+    assert list(df.columns) == ["id", "date", "mean_ndvi"]
+    assert df["id"].tolist() == [7, 7, 3, 3, 5, 5]
+    assert (
+        df.groupby("id", sort=False)["date"]
+        .apply(lambda d: d.is_monotonic_increasing)
+        .all()
+    )
+
+
 def test_download_timeseries_with_aggregation(
     dummy_aoi, dummy_sensor, _dummy_ee_manager, monkeypatch
 ):
@@ -39,6 +39,22 @@ def test_download_with_chunks_retries_and_combines(monkeypatch):
     assert len(df) == 3
 
 
+def test_download_with_chunks_waits_on_rate_limiter(monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda _: None)
+
+    class CountingLimiter:
+        calls = 0
+
+        def wait(self) -> None:
+            self.calls += 1
+
+    dler = DummyDownloader()
+    dler.rate_limiter = CountingLimiter()
+    dler.download_with_chunks("2020-01-01", "2020-01-04", "2D")
+    # Three chunks plus one retry, each a separate request.
+    assert dler.rate_limiter.calls == 4
+
+
 def test_earth_engine_downloader_builds_dataframe(monkeypatch, dummy_aoi):
     class FakeCollection:
         def map(self, func):  # pragma: no cover - behaviour is trivial
@@ -81,3 +97,56 @@ def test_earth_engine_downloader_builds_dataframe(monkeypatch, dummy_aoi):
     assert list(df.columns) == ["id", "date", "mean_ndvi"]
     assert df.iloc[0]["mean_ndvi"] == 0.5
     assert pd.api.types.is_datetime64_any_dtype(df["date"])
+
+
+def test_earth_engine_downloader_batches_aois(monkeypatch, dummy_aoi):
+    class FakeCollection:
+        def map(self, func):  # pragma: no cover - behaviour is trivial
+            return self
+
+        def flatten(self):  # pragma: no cover - behaviour is trivial
+            return self
+
+        def getInfo(self):
+            return {
+                "features": [
+                    {"properties": {"_aoi": 1, "id": 9, "date": "2020-01-01"}},
+                    {
+                        "properties": {
+                            "_aoi": 0,
+                            "id": 1,
+                            "date": "2020-01-01",
+                            "mean": 0.5,
+                        }
+                    },
+                ]
+            }
+
+    class FakeEE:
+        def initialize(self):  # pragma: no cover - trivial
+            return None
+
+        def get_image_collection(self, *args, **kwargs):  # pragma: no cover
+            return FakeCollection()
+
+    monkeypatch.setattr(
+        "verdesat.ingestion.downloader.mask_collection", lambda coll, sensor: coll
+    )
+    monkeypatch.setattr("ee.Geometry", lambda geojson: geojson)  # type: ignore[attr-defined]
+    features = []
+    monkeypatch.setattr(
+        "ee.Feature", lambda geom, props: features.append(props) or props
+    )  # type: ignore[attr-defined]
+    monkeypatch.setattr("ee.FeatureCollection", lambda feats: feats)  # type: ignore[attr-defined]
+
+    class DummySensor:
+        collection_id = "dummy"
+
+    dler = EarthEngineDownloader(DummySensor(), ee_manager=FakeEE())
+    df = dler.download_chunk(
+        "2020-01-01", "2020-01-02", [dummy_aoi, dummy_aoi], 10, "ndvi", None
+    )
+    assert [f["_aoi"] for f in features] == [0, 1]
+    assert list(df.columns) == ["_aoi", "id", "date", "mean_ndvi"]
+    assert df["_aoi"].tolist() == [1, 0]
+    assert df["mean_ndvi"].isna().tolist() == [True, False]
@@ -6,12 +6,20 @@ Tests for EarthEngineManager: initialization and get_image_collection behavior.
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from verdesat.ingestion.eemanager import EarthEngineManager, ee_manager
 import json
 import ee
 from google.oauth2.credentials import Credentials
 
 
+@pytest.fixture(autouse=True)
+def fresh_ee_session(monkeypatch):
+    """Start every test without a remembered Earth Engine session."""
+    monkeypatch.setattr(EarthEngineManager, "_session", None)
+
+
 def test_initialize_does_not_raise():
     """Ensure initialize() calls ee.Initialize() without error."""
     ee_manager.project = None
@@ -64,3 +72,70 @@ def test_initialize_with_env_token(monkeypatch):
 
     assert isinstance(captured.get("creds"), Credentials)
     monkeypatch.delenv("EARTHENGINE_TOKEN", raising=False)
+
+
+def test_initialize_high_volume_endpoint(monkeypatch):
+    """initialize(high_volume=True) should target the high-volume endpoint."""
+    monkeypatch.delenv("EARTHENGINE_TOKEN", raising=False)
+    captured = {}
+
+    def fake_initialize(creds=None, project=None, opt_url=None):
+        captured["opt_url"] = opt_url
+
+    monkeypatch.setattr(ee, "Initialize", fake_initialize)
+    mgr = EarthEngineManager()
+    mgr.initialize()
+    assert captured["opt_url"] is None
+
+    mgr.initialize(high_volume=True)
+    assert captured["opt_url"] == EarthEngineManager.HIGH_VOLUME_URL
+
+
+def test_initialize_reuses_session(monkeypatch):
+    """Repeated initialize() calls only hit ee.Initialize when settings change."""
+    monkeypatch.delenv("EARTHENGINE_TOKEN", raising=False)
+    calls = []
+    monkeypatch.setattr(ee, "Initialize", lambda *a, **k: calls.append(k))
+    mgr = EarthEngineManager(project="p1")
+    mgr.initialize()
+    mgr.initialize()
+    assert len(calls) == 1
+
+    mgr.initialize(high_volume=True)
+    mgr.project = "p2"
+    mgr.initialize(high_volume=True)
+    mgr.initialize(high_volume=True, force=True)
+    assert [c.get("project") for c in calls] == ["p1", "p1", "p2", "p2"]
+
+
+def test_initialize_session_is_shared_across_managers(monkeypatch):
+    monkeypatch.delenv("EARTHENGINE_TOKEN", raising=False)
+    calls = []
+    monkeypatch.setattr(ee, "Initialize", lambda *a, **k: calls.append(k))
+    first, second = EarthEngineManager(project="p1"), EarthEngineManager(project="p1")
+    first.initialize()
+    second.initialize()
+    assert len(calls) == 1
+
+    # Another project re-initializes the process, so the first must too.
+    EarthEngineManager(project="p2").initialize()
+    first.initialize()
+    assert [c.get("project") for c in calls] == ["p1", "p2", "p1"]
+
+
+def test_high_volume_session_serves_standard_managers(monkeypatch):
+    """Alternating endpoints upgrade once instead of re-initializing each time."""
+    monkeypatch.delenv("EARTHENGINE_TOKEN", raising=False)
+    calls = []
+    monkeypatch.setattr(ee, "Initialize", lambda *a, **k: calls.append(k))
+    standard = EarthEngineManager(project="p1")
+    high_volume = EarthEngineManager(project="p1", high_volume=True)
+    for _ in range(3):
+        standard.initialize()
+        high_volume.initialize()
+    standard.initialize(force=True)
+    assert [c.get("opt_url") for c in calls] == [
+        None,
+        EarthEngineManager.HIGH_VOLUME_URL,
+        EarthEngineManager.HIGH_VOLUME_URL,
+    ]
@@ -5,6 +5,7 @@ import pandas as pd
 from types import SimpleNamespace
 
 from verdesat.core.pipeline import ReportPipeline
+from verdesat.core.utils import RateLimiter
 from verdesat.geo.aoi import AOI
 from verdesat.ingestion.base import BaseDataIngestor
 from verdesat.visualization.visualizer import Visualizer
@@ -84,3 +85,46 @@ def test_report_pipeline_run(tmp_path):
     assert os.path.exists(report_path)
     assert ingestor.timeseries_calls
     assert viz.report_called
+
+
+def test_report_pipeline_run_inside_event_loop(tmp_path):
+    import asyncio
+
+    aoi = AOI(Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]), {"id": 1})
+    ingestor = DummyIngestor()
+    pipeline = ReportPipeline([aoi], ingestor, DummyViz())
+
+    async def _caller():
+        # e.g. a notebook cell or an async web handler
+        sync_path = pipeline.run("2020-01-01", "2020-01-31", str(tmp_path / "a"))
+        async_path = await pipeline.run_async(
+            "2020-01-01", "2020-01-31", str(tmp_path / "b")
+        )
+        return sync_path, async_path
+
+    paths = asyncio.run(_caller())
+    assert all(os.path.exists(p) for p in paths)
+    assert len(ingestor.chip_calls) == 4
+
+
+def test_report_pipeline_concurrent_downloads_keep_aoi_order(tmp_path):
+    square = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+    aois = [AOI(square, {"id": i}) for i in (1, 2, 3)]
+    ingestor = DummyIngestor()
+    pipeline = ReportPipeline(aois, ingestor, DummyViz(), concurrency=3)
+    df = pipeline._download_timeseries("2020-01-01", "2020-01-31", "ndvi", "mean_ndvi")
+    assert df["id"].tolist() == [1, 2, 3]
+    assert len(ingestor.timeseries_calls) == 3
+
+
+def test_report_pipeline_shares_rate_limiter_with_chips(tmp_path):
+    class RecordingIngestor(DummyIngestor):
+        def download_chips(self, aois, config, storage=None) -> None:
+            self.chip_calls.append(config.rate_limiter)
+
+    aoi = AOI(Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]), {"id": 1})
+    ingestor = RecordingIngestor()
+    limiter = RateLimiter(1000.0)
+    pipeline = ReportPipeline([aoi], ingestor, DummyViz(), rate_limiter=limiter)
+    pipeline.run("2020-01-01", "2020-01-31", str(tmp_path))
+    assert ingestor.chip_calls == [limiter, limiter]
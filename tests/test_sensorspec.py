@@ -122,6 +122,10 @@ def test_compute_index_expression(temp_index_and_sensor_specs, monkeypatch):
             """Simulate ee.Image.rename."""
             return self
 
+    # Exercise the expression path rather than normalizedDifference.
+    monkeypatch.delitem(
+        idx_mod.INDEX_REGISTRY["ndvi"], "normalized_difference", raising=False
+    )
     fake_img = FakeImage()
     spec = SensorSpec.from_collection_id("NASA/HLS/HLSL30/v002")
 
@@ -132,3 +136,43 @@ def test_compute_index_expression(temp_index_and_sensor_specs, monkeypatch):
     # Since select() returns fake_img, both aliases map to the same FakeImage
     assert recorded["bands"]["NIR"] is fake_img
     assert recorded["bands"]["RED"] is fake_img
+
+
+def test_from_collection_id_returns_independent_instances():
+    from verdesat.ingestion.sensorspec import _cached_spec
+
+    _cached_spec.cache_clear()
+    first = SensorSpec.from_collection_id("NASA/HLS/HLSL30/v002")
+    first.bands["nir"] = "changed"
+    first.fmask_exclude.append(32)
+    second = SensorSpec.from_collection_id("NASA/HLS/HLSL30/v002")
+    assert second is not first
+    assert second.bands["nir"] != "changed"
+    assert 32 not in second.fmask_exclude
+    assert _cached_spec.cache_info().hits == 1
+
+
+def test_compute_index_uses_normalized_difference():
+    """Plain ratio indices go through ee.Image.normalizedDifference."""
+    calls = []
+
+    class FakeImage:
+        """Record normalizedDifference calls; fail on expression()."""
+
+        def select(self, *bands):
+            return self
+
+        def normalizedDifference(self, bands):  # pylint: disable=invalid-name
+            calls.append(bands)
+            return self
+
+        def expression(self, *args):
+            raise AssertionError("expression() should not be used")
+
+        def rename(self, name):
+            calls.append(name)
+            return self
+
+    spec = SensorSpec.from_collection_id("NASA/HLS/HLSL30/v002")
+    spec.compute_index(FakeImage(), "NDWI")
+    assert calls == [["green", "nir"], "ndwi"]
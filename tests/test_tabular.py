@@ -0,0 +1,250 @@
+import pandas as pd
+
+from verdesat.core import tabular
+from verdesat.core.tabular import write_csv
+
+
+def test_write_csv_keeps_plain_dates(tmp_path):
+    df = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "date": pd.to_datetime(["2020-01-01", "2020-02-01"]),
+            "mean_ndvi": [0.5, None],
+        }
+    )
+    out = tmp_path / "out.csv"
+    write_csv(df, str(out))
+
+    assert "2020-01-01" in out.read_text()
+    assert "00:00:00" not in out.read_text()
+    loaded = pd.read_csv(out, parse_dates=["date"])
+    pd.testing.assert_frame_equal(loaded, df)
+
+
+def test_write_csv_falls_back_to_pandas(tmp_path, monkeypatch):
+    monkeypatch.setattr(tabular, "pa", None)
+    out = tmp_path / "out.csv"
+    write_csv(pd.Series([1, 2], name="x"), str(out))
+    assert out.read_text().splitlines() == ["x", "1", "2"]
+
+
+def test_write_csv_mixed_types_fall_back(tmp_path, monkeypatch):
+    def _raise(df):
+        raise TypeError("mixed")
+
+    monkeypatch.setattr(tabular, "_arrow_table", _raise)
+    out = tmp_path / "out.csv"
+    write_csv(pd.DataFrame({"x": [1, "a"]}), str(out))
+    assert out.read_text().splitlines() == ["x", "1", "a"]
+
+
+def test_read_table_parses_dates_for_csv_and_parquet(tmp_path):
+    from verdesat.core.tabular import read_table
+
+    csv = tmp_path / "ts.csv"
+    csv.write_text("id,date,mean_ndvi\n1,2020-01-01,0.5\n1,2020-02-01,\n")
+    df = read_table(csv)
+    assert df["date"].dtype == "datetime64[ns]"
+    assert df["mean_ndvi"].isna().sum() == 1
+
+    pq = tmp_path / "ts.parquet"
+    df.to_parquet(pq)
+    projected = read_table(pq, columns=["date", "mean_ndvi"])
+    assert list(projected.columns) == ["date", "mean_ndvi"]
+    assert projected["date"].dtype == "datetime64[ns]"
+
+
+def test_write_table_dispatches_on_suffix(tmp_path):
+    from verdesat.core.tabular import read_table, write_table
+
+    df = pd.DataFrame({"id": [1], "date": pd.to_datetime(["2020-01-01"])})
+    write_table(df, str(tmp_path / "out.parquet"))
+    write_table(df, str(tmp_path / "out.csv"))
+    assert read_table(tmp_path / "out.parquet").equals(read_table(tmp_path / "out.csv"))
+
+
+def test_fast_io_can_be_disabled(tmp_path, monkeypatch):
+    from verdesat.core.tabular import read_table
+
+    def _boom(*_a, **_k):
+        raise AssertionError("pyarrow reader used")
+
+    monkeypatch.setenv("VERDESAT_FAST_IO", "0")
+    monkeypatch.setattr(tabular.pa_csv, "read_csv", _boom)
+    csv = tmp_path / "ts.csv"
+    csv.write_text("id,date\n1,2020-01-01\n")
+    assert read_table(csv)["date"].dtype == "datetime64[ns]"
+
+
+def test_read_table_remote_uri_uses_arrow_filesystem(tmp_path, monkeypatch):
+    import pyarrow.fs as pa_fs
+    from verdesat.core.tabular import read_table
+
+    df = pd.DataFrame({"id": [1], "date": ["2020-01-01"], "mean_ndvi": [0.5]})
+    df.to_parquet(tmp_path / "ts.parquet")
+    df.to_csv(tmp_path / "ts.csv", index=False)
+    seen = []
+
+    def fake_fs(uri):
+        seen.append(uri)
+        return pa_fs.LocalFileSystem(), str(tmp_path / uri.rsplit("/", 1)[-1])
+
+    monkeypatch.setattr(tabular, "_remote_filesystem", fake_fs)
+    for name in ("ts.parquet", "ts.csv"):
+        out = read_table(f"r2://bucket/{name}", columns=["date", "mean_ndvi"])
+        assert list(out.columns) == ["date", "mean_ndvi"]
+        assert out["date"].dtype == "datetime64[ns]"
+    assert seen == ["r2://bucket/ts.parquet", "r2://bucket/ts.csv"]
+
+    monkeypatch.undo()
+    monkeypatch.delenv("R2_ENDPOINT", raising=False)
+    try:
+        read_table("r2://bucket/ts.csv")
+    except ValueError as exc:
+        assert "R2_ENDPOINT" in str(exc)
+    else:  # pragma: no cover - defensive
+        raise AssertionError("expected ValueError")
+
+
+def test_table_writer_appends_chunks(tmp_path):
+    from verdesat.core.tabular import TableWriter, read_table
+
+    chunks = [
+        pd.DataFrame({"id": [1], "date": pd.to_datetime(["2020-01-01"]), "v": [0.1]}),
+        pd.DataFrame(),
+        pd.DataFrame({"v": [0.2], "id": [2], "date": pd.to_datetime(["2020-02-01"])}),
+    ]
+    for name in ("ts.csv", "ts.parquet"):
+        path = str(tmp_path / name)
+        with TableWriter(path) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        assert writer.rows == 2
+        out = read_table(path)
+        assert list(out.columns) == ["id", "date", "v"]
+        assert out["id"].tolist() == [1, 2]
+        assert out["v"].tolist() == [0.1, 0.2]
+
+    empty = tmp_path / "empty.csv"
+    empty.write_text("stale")
+    TableWriter(str(empty)).close()
+    assert empty.read_text().strip() == ""
+
+
+def test_table_writer_empty_chunk_keeps_header(tmp_path):
+    from verdesat.core.tabular import TableWriter, read_table
+
+    cols = ["id", "date", "mean_ndvi"]
+    for name in ("ts.csv", "ts.parquet"):
+        path = str(tmp_path / name)
+        with TableWriter(path) as writer:
+            writer.write(pd.DataFrame(columns=cols))
+        assert writer.rows == 0
+        out = read_table(path)
+        assert list(out.columns) == cols
+        assert out.empty
+    assert (tmp_path / "ts.csv").read_text().strip() == "id,date,mean_ndvi"
+
+
+def test_table_writer_reuses_one_csv_writer(tmp_path, monkeypatch):
+    from verdesat.core.tabular import TableWriter, read_table
+
+    opened = []
+    real = tabular.pa_csv.CSVWriter
+
+    def _writer(*args, **kwargs):
+        opened.append(args)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(tabular.pa_csv, "CSVWriter", _writer)
+    path = str(tmp_path / "ts.csv")
+    with TableWriter(path) as writer:
+        for pid in (1, 2):
+            writer.write(pd.DataFrame({"id": [pid], "v": [pid / 10]}))
+        # Types drifting mid-stream fall back to a per-chunk write.
+        writer.write(pd.DataFrame({"id": [3], "v": [None]}))
+        writer.write(pd.DataFrame({"id": [4], "v": [0.4]}))
+    assert len(opened) == 1
+    out = read_table(path)
+    assert out["id"].tolist() == [1, 2, 3, 4]
+    assert out["v"].isna().tolist() == [False, False, True, False]
+
+
+def test_write_csv_matches_pandas_bytes(tmp_path):
+    import numpy as np
+    from verdesat.core.tabular import TableWriter
+
+    def _dates(values):
+        return pd.to_datetime(values, format="ISO8601")
+
+    frames = [
+        pd.DataFrame(
+            {
+                "id": [1, 2],
+                "date": _dates(["2020-01-01", "2020-02-01"]),
+                "mean_ndvi": [0.5, None],
+                "gapfilled": [True, False],
+            }
+        ),
+        pd.DataFrame({"name": ["a,b", 'q"t', "", None], "v": [1, 2, 3, 4]}),
+        pd.DataFrame({"name": ["", None, "plain"], "v": [1, 2, 3]}),
+        pd.DataFrame(
+            {
+                "a": _dates(["2024-01-01 12:30:00", None]),
+                "b": _dates(["2024-01-01 12:30:00.5", "2024-01-02"]),
+                "c": _dates(["2024-01-01", "2024-01-02"]).tz_localize("UTC"),
+            }
+        ),
+        pd.DataFrame(
+            {
+                "f": [1.0, 1e-5, 1e16, 123456789012345.0, -0.0, np.nan],
+                "g": np.arange(6, dtype="float32") / 10,
+                "i": pd.array([1, None, 3, 4, 5, 6], dtype="Int64"),
+            }
+        ),
+        pd.DataFrame({"id": [1, np.nan], "b": [True, None], "n": [None, None]}),
+        pd.DataFrame({"x": [1.5, np.nan]}),
+        pd.DataFrame({"a b": [1], "c,d": [2]}),
+    ]
+    for i, df in enumerate(frames):
+        out = tmp_path / f"{i}.csv"
+        write_csv(df, str(out))
+        assert out.read_bytes() == df.to_csv(index=False).encode(), i
+
+    chunks = [frames[0], frames[0].assign(id=[3, 4], mean_ndvi=[0.25, 1.0])]
+    out = tmp_path / "chunks.csv"
+    with TableWriter(str(out)) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    expected = pd.concat(chunks).to_csv(index=False).encode()
+    assert out.read_bytes() == expected
+
+
+def test_table_writer_keeps_first_chunk_datetime_format(tmp_path):
+    from verdesat.core.tabular import TableWriter
+
+    chunks = [
+        pd.DataFrame({"id": [1], "date": pd.to_datetime(["2024-01-01"])}),
+        pd.DataFrame({"id": [2], "date": pd.to_datetime(["2024-01-02 12:00:00"])}),
+        pd.DataFrame({"id": [3], "date": pd.to_datetime([None])}),
+    ]
+    out = tmp_path / "dates.csv"
+    with TableWriter(str(out)) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    assert out.read_text().splitlines() == [
+        "id,date",
+        "1,2024-01-01",
+        "2,2024-01-02",
+        "3,",
+    ]
+
+    out = tmp_path / "stamps.csv"
+    with TableWriter(str(out)) as writer:
+        for chunk in reversed(chunks[:2]):
+            writer.write(chunk)
+    assert out.read_text().splitlines() == [
+        "id,date",
+        "2,2024-01-02 12:00:00",
+        "1,2024-01-01 00:00:00",
+    ]
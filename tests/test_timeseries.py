@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from verdesat.analytics.timeseries import TimeSeries
 
@@ -37,3 +38,140 @@ def test_decompose():
     res = ts.decompose(period=12)
     assert 1 in res
     assert res[1].trend is not None
+
+
+def test_decompose_aligned_matches_per_polygon(monkeypatch):
+    from verdesat.analytics import timeseries as ts_mod
+
+    dates = pd.date_range("2020-01-01", periods=36, freq="ME")
+    rng = np.random.default_rng(0)
+    df = pd.concat(
+        pd.DataFrame({"id": pid, "date": dates, "mean_ndvi": rng.random(36) + 0.1})
+        for pid in (3, 1, 2)
+    )
+    ts = TimeSeries.from_dataframe(df, index="ndvi")
+    for model in ("additive", "multiplicative"):
+        fast = ts.decompose(period=12, model=model)
+        with monkeypatch.context() as m:
+            m.setattr(ts_mod, "_decompose_aligned", lambda *a: None)
+            slow = ts.decompose(period=12, model=model)
+        assert list(fast) == list(slow) == [1, 2, 3]
+        for pid, res in slow.items():
+            for name in ("observed", "trend", "seasonal", "resid"):
+                np.testing.assert_allclose(
+                    getattr(fast[pid], name).to_numpy(),
+                    getattr(res, name).to_numpy(),
+                )
+            assert fast[pid].trend.index.equals(res.trend.index)
+
+
+def test_download_timeseries_parallel_keeps_aoi_order(monkeypatch):
+    from types import SimpleNamespace
+
+    from verdesat.services import timeseries as svc
+
+    aois = [SimpleNamespace(static_props={"id": i}) for i in range(7)]
+
+    groups = []
+
+    class DummyIngestor:
+        def download_timeseries_batch(self, group, start, end, scale, index, col, *_):
+            groups.append(len(group))
+            return [
+                pd.DataFrame({"id": [pid], "date": [start], col: [pid / 10]})
+                for pid in (aoi.static_props["id"] for aoi in group)
+            ]
+
+    monkeypatch.setattr(svc.AOI, "from_geojson", lambda path, id_col, **_: aois)
+    monkeypatch.setattr(svc.SensorSpec, "from_collection_id", lambda cid: None)
+    monkeypatch.setattr(svc, "create_ingestor", lambda *a, **k: DummyIngestor())
+
+    df = svc.download_timeseries("aoi.geojson", n_jobs=3, aois_per_request=3)
+    assert df["id"].tolist() == list(range(7))
+    # Worker tasks follow the request groups, not the worker count.
+    assert sorted(groups) == [1, 3, 3]
+
+
+def test_decomposition_frame_matches_components():
+    from verdesat.analytics.timeseries import decomposition_frame
+
+    dates = pd.date_range("2020-01-01", periods=24, freq="ME")
+    df = pd.concat(
+        [
+            pd.DataFrame({"id": 1, "date": dates, "mean_ndvi": range(24)}),
+            pd.DataFrame({"id": 2, "date": dates[:-1], "mean_ndvi": range(23)}),
+        ]
+    )
+    res = TimeSeries.from_dataframe(df, index="ndvi").decompose(period=6)
+    out = decomposition_frame(res)
+    assert list(out.columns) == ["id", "date", "observed", "trend", "seasonal", "resid"]
+    part = out[out["id"] == 2]
+    assert len(part) == 23
+    np.testing.assert_array_equal(part["trend"].to_numpy(), res[2].trend.to_numpy())
+    assert decomposition_frame({}).empty
+
+
+def test_aggregate_monthly_keeps_empty_months():
+    df = pd.DataFrame(
+        {
+            "id": [2, 1, 1, 1],
+            "date": ["2020-02-10", "2020-01-05", "2020-01-20", "2020-03-02"],
+            "mean_ndvi": [0.9, 0.2, 0.4, 0.6],
+        }
+    )
+    out = TimeSeries.from_dataframe(df, index="ndvi").aggregate("ME").df
+    assert out["id"].tolist() == [1, 1, 1, 2]
+    assert out["date"].dt.strftime("%Y-%m-%d").tolist() == [
+        "2020-01-31",
+        "2020-02-29",
+        "2020-03-31",
+        "2020-02-29",
+    ]
+    np.testing.assert_allclose(out["mean_ndvi"], [0.3, np.nan, 0.6, 0.9])
+
+
+def test_fill_gaps_matches_per_polygon_interpolation():
+    df = pd.DataFrame(
+        {
+            "id": [2, 2, 2, 2, 1, 1, 1, 1, 1, 3],
+            "date": pd.to_datetime(
+                [
+                    "2020-01-01",
+                    "2020-01-02",
+                    "2020-01-10",
+                    "2020-02-01",
+                    "2020-03-01",
+                    "2020-01-01",
+                    "2020-01-31",
+                    "2020-02-01",
+                    "2020-04-01",
+                    "2020-01-01",
+                ]
+            ),
+            "mean_ndvi": [None, 0.2, None, 0.8, None, 0.1, None, None, 0.7, None],
+        }
+    )
+    ts = TimeSeries.from_dataframe(df, index="ndvi")
+    for method in ("time", "linear", "nearest"):
+        out = ts.fill_gaps(method=method).df
+        for pid, grp in df.groupby("id"):
+            grp = grp.sort_values("date").set_index("date")["mean_ndvi"]
+            expected = grp.interpolate(method=method).ffill().bfill()
+            got = out[out["id"] == pid]
+            np.testing.assert_allclose(got["mean_ndvi"], expected.to_numpy())
+            assert got["date"].tolist() == expected.index.tolist()
+        assert out["gapfilled"].sum() == 6
+        assert list(out.columns) == ["date", "id", "mean_ndvi", "gapfilled"]
+
+
+def test_fill_gaps_without_gaps_only_sorts():
+    df = pd.DataFrame(
+        {
+            "id": [2, 1, 1],
+            "date": pd.to_datetime(["2020-01-01", "2020-02-01", "2020-01-01"]),
+            "mean_ndvi": [0.5, 0.2, 0.1],
+        }
+    )
+    out = TimeSeries.from_dataframe(df, index="ndvi").fill_gaps(method="nearest").df
+    assert out["mean_ndvi"].tolist() == [0.1, 0.2, 0.5]
+    assert out["gapfilled"].dtype == bool and not out["gapfilled"].any()
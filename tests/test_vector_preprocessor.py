@@ -148,3 +148,14 @@ def test_no_supported_files(tmp_path):
     with pytest.raises(RuntimeError) as exc:
         VectorPreprocessor(str(dir_path)).run()
     assert "No supported vector files" in str(exc.value)
+
+
+def test_drop_z_keeps_crs():
+    """drop_z flattens 3D geometries without losing the CRS."""
+    vp = VectorPreprocessor("unused")
+    vp.gdf = gpd.GeoDataFrame(
+        geometry=[Polygon([(0, 0, 5), (0, 1, 5), (1, 1, 5)])], crs="EPSG:4326"
+    )
+    vp.drop_z()
+    assert not vp.gdf.geometry.has_z.any()
+    assert vp.gdf.crs == "EPSG:4326"
@@ -45,3 +45,94 @@ def test_collect_gallery_groups_images(tmp_path):
     gallery = viz.collect_gallery(str(tmp_path))
     assert set(gallery.keys()) == {1, 2}
     assert len(gallery[1]) == 2
+
+
+def test_plot_timeseries_html_uses_webgl_for_large_inputs(tmp_path, monkeypatch):
+    import plotly.graph_objects as go
+
+    dates = pd.date_range("2000-01-01", periods=300, freq="D")
+    df = pd.concat(
+        pd.DataFrame({"id": pid, "date": dates, "ndvi": range(300)}) for pid in (1, 2)
+    )
+    figs = []
+    monkeypatch.setattr(
+        go.Figure, "write_html", lambda self, *a, **k: figs.append(self)
+    )
+    monkeypatch.setattr(Visualizer, "WEBGL_THRESHOLD", 100)
+    viz = Visualizer()
+    viz.plot_timeseries_html(df, "ndvi", str(tmp_path / "big.html"))
+    viz.plot_timeseries_html(df.head(50), "ndvi", str(tmp_path / "small.html"))
+
+    big, small = figs
+    assert {t.type for t in big.data} == {"scattergl"}
+    assert sum(len(t.x) for t in big.data) <= 100
+    assert max(max(t.y) for t in big.data) == 299
+    assert {t.type for t in small.data} == {"scatter"}
+
+
+def test_plot_decomposition_reuses_figure(tmp_path):
+    import numpy as np
+    from statsmodels.tsa.seasonal import seasonal_decompose
+
+    idx = pd.date_range("2020-01-01", periods=36, freq="ME")
+    viz = Visualizer()
+    for pid in (1, 2):
+        series = pd.Series(np.random.default_rng(pid).random(36), index=idx, name=pid)
+        viz.plot_decomposition(
+            seasonal_decompose(series, period=12), str(tmp_path / f"{pid}.png")
+        )
+        if pid == 1:
+            fig = viz._decomposition_figure(4)
+    assert viz._decomposition_figure(4) is fig
+    assert fig.axes[0].get_title() == "2"
+    assert [ax.get_ylabel() for ax in fig.axes[1:]] == ["Trend", "Seasonal", "Resid"]
+    assert Image.open(tmp_path / "1.png").size == Image.open(tmp_path / "2.png").size
+
+
+def test_plot_decomposition_uses_one_figure_per_thread(tmp_path):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    viz = Visualizer()
+    barrier = threading.Barrier(2)
+
+    def _figure(_):
+        fig = viz._decomposition_figure(4)
+        barrier.wait(timeout=5)  # keep both tasks on separate threads
+        return fig
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first, second = pool.map(_figure, range(2))
+    assert first is not second
+    assert viz._decomposition_figure(4) not in (first, second)
+
+
+def test_make_gifs_per_site_parallel_matches_sequential(tmp_path):
+    img_dir = tmp_path / "imgs"
+    img_dir.mkdir()
+    for site in (1, 2, 3):
+        for date in ("2020-01-01", "2020-02-01"):
+            Image.new("RGB", (128, 64), (site * 40, 90, 10)).save(
+                img_dir / f"NDVI_{site}_{date}.png"
+            )
+    viz = Visualizer()
+    viz.make_gifs_per_site(img_dir, "*.png", str(tmp_path / "seq"), workers=1)
+    viz.make_gifs_per_site(img_dir, "*.png", str(tmp_path / "par"), workers=2)
+    for site in (1, 2, 3):
+        name = f"{site}__png.gif"
+        seq = Image.open(tmp_path / "seq" / name)
+        assert seq.n_frames == 2
+        assert (tmp_path / "par" / name).read_bytes() == (
+            tmp_path / "seq" / name
+        ).read_bytes()
+
+
+def test_build_gallery_reuses_template_environment(tmp_path):
+    from verdesat.visualization.visualizer import _jinja_env
+
+    Image.new("RGB", (10, 10)).save(tmp_path / "1_2020-01-01.png")
+    _jinja_env.cache_clear()
+    for viz in (Visualizer(), Visualizer()):
+        viz.build_gallery(str(tmp_path), "gallery.html", title="Chips")
+    assert _jinja_env.cache_info().hits == 1
+    assert "Chips" in (tmp_path / "gallery.html").read_text()
@@ -195,8 +195,10 @@ def test_compute_uses_cache(monkeypatch):
     assert not chip_service.calls
 
 
-def test_compute_recomputes_legacy_cache(monkeypatch):
+def test_compute_recomputes_legacy_cache(tmp_path, monkeypatch):
     """Older cache tuples trigger recomputation so VI stats are present."""
+    # The recomputed result is persisted under ./cache; keep it out of the repo.
+    monkeypatch.chdir(tmp_path)
     project = make_project()
     chip_service = DummyChipService()
     svc = ProjectComputeService(
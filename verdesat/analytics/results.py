@@ -5,6 +5,8 @@ from typing import List, Dict
 
 import pandas as pd
 
+from verdesat.core.tabular import write_csv
+
 
 @dataclass
 class TrendResult:
@@ -18,7 +20,7 @@ class TrendResult:
 
     def to_csv(self, path: str) -> None:
         """Write the trend values to CSV."""
-        self.df.to_csv(path, index=False)
+        write_csv(self.df, path)
 
 
 @dataclass
@@ -33,4 +35,4 @@ class StatsResult:
 
     def to_csv(self, path: str) -> None:
         """Write the summary statistics to CSV."""
-        self.to_dataframe().to_csv(path, index=False)
+        write_csv(self.to_dataframe(), path)
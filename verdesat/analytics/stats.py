@@ -7,9 +7,9 @@ from typing import IO, Mapping, Optional, cast
 import numpy as np
 import pandas as pd
 from pandas import Timestamp
-from scipy.stats import kendalltau, theilslopes
 
 from verdesat.core.config import ConfigManager
+from verdesat.core.tabular import read_table
 from .results import StatsResult
 
 
@@ -26,16 +26,34 @@ def compute_summary_stats(
 
     ``timeseries_csv`` may be a path, file-like object or DataFrame. ``decomp_dir``
     accepts either a directory path or a mapping of site IDs to in-memory CSV
-    buffers/DataFrames containing decomposition results.
+    buffers/DataFrames containing decomposition results; a directory holding a
+    combined ``decomposition.parquet`` is read once instead of per-site CSVs,
+    unless any of those CSVs is newer than it.
+    Paths are read with :func:`verdesat.core.tabular.read_table`.
     """
     # 1) Load and pivot
     if isinstance(timeseries_csv, pd.DataFrame):
         df = timeseries_csv.copy()
         if not pd.api.types.is_datetime64_any_dtype(df["date"]):
             df["date"] = pd.to_datetime(df["date"])
+    elif isinstance(timeseries_csv, (str, Path)):
+        df = read_table(timeseries_csv)
     else:
         df = pd.read_csv(timeseries_csv, parse_dates=["date"])
 
+    if isinstance(decomp_dir, (str, Path)):
+        combined = Path(decomp_dir) / "decomposition.parquet"
+        if combined.exists() and not any(
+            # Per-site CSVs written after the parquet (e.g. a later
+            # ``decompose --format csv``) take precedence.
+            p.stat().st_mtime > combined.stat().st_mtime
+            for p in Path(decomp_dir).glob("*_decomposition.csv")
+        ):
+            decomp_dir = {
+                pid: frame.drop(columns="id")
+                for pid, frame in read_table(combined).groupby("id")
+            }
+
     stats: list[dict[str, float | int | str | None]] = []
     for pid, grp in df.groupby("id"):
         grp = grp.sort_values("date").set_index("date")
@@ -70,9 +88,7 @@ def compute_summary_stats(
             else:
                 decomp_path = Path(decomp_dir) / f"{pid}_decomposition.csv"
                 if decomp_path.exists():
-                    ddf = pd.read_csv(decomp_path, parse_dates=["date"]).set_index(
-                        "date"
-                    )
+                    ddf = read_table(decomp_path).set_index("date")
 
         if ddf is not None and period is not None and len(ddf) >= 2 * period:
             seasonal = ddf["seasonal"]
@@ -93,6 +109,8 @@ def compute_summary_stats(
         if ddf is not None and period is not None and len(ddf) >= 2 * period:
             trend_series = ddf["trend"].dropna()
             if not trend_series.empty:
+                from scipy.stats import kendalltau, theilslopes
+
                 t = (trend_series.index - trend_series.index[0]).days / 365.25
                 sen_slope, _, _, _ = theilslopes(trend_series.values, t)
                 _, p_value = kendalltau(t, trend_series.values)
@@ -3,12 +3,18 @@ Module `analytics.timeseries` provides the TimeSeries class, which wraps
 a pandas DataFrame of spectral index time series and supports aggregation.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Dict, Literal
+from typing import TYPE_CHECKING, Dict, Hashable, Literal, Mapping
 from verdesat.core.config import ConfigManager
+from verdesat.core.tabular import write_csv
 
+import numpy as np
 import pandas as pd
-from statsmodels.tsa.seasonal import DecomposeResult, seasonal_decompose
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from statsmodels.tsa.seasonal import DecomposeResult
 
 
 @dataclass
@@ -24,10 +30,12 @@ class TimeSeries:
     ) -> "TimeSeries":
         """
         Create a TimeSeries from a DataFrame with columns ['id', 'date', f'mean_{index}'].
-        Ensures 'date' column is parsed as datetime.
+        Ensures 'date' column is parsed as datetime; already-typed columns
+        (e.g. from :func:`verdesat.core.tabular.read_table`) are kept as-is.
         """
         df_copy = df.copy()
-        df_copy["date"] = pd.to_datetime(df_copy["date"])
+        if not pd.api.types.is_datetime64_any_dtype(df_copy["date"]):
+            df_copy["date"] = pd.to_datetime(df_copy["date"])
         return cls(df_copy, index)
 
     def aggregate(self, freq: Literal["D", "ME", "YE"]) -> "TimeSeries":
@@ -37,34 +45,83 @@ class TimeSeries:
         Returns a new TimeSeries.
         """
         col_name = f"mean_{self.index}"
-        df_indexed = self.df.set_index(["id", "date"])
-        aggregated = (
-            df_indexed[col_name]
-            .groupby(level=0)
-            .resample(freq, level=1)
-            .mean()
-            .reset_index()
+        # One grouped reduction over (id, period) instead of a resample per
+        # polygon; empty periods are restored below as resample would.
+        grouped = self.df.groupby(["id", pd.Grouper(key="date", freq=freq)])[
+            col_name
+        ].mean()
+        if grouped.empty:
+            return TimeSeries(grouped.reset_index(), self.index)
+        bounds = (
+            grouped.index.to_frame(index=False)
+            .groupby("id", sort=False)["date"]
+            .agg(["min", "max"])
+        )
+        # Every polygon's bins are a contiguous run of one shared calendar.
+        calendar = pd.date_range(bounds["min"].min(), bounds["max"].max(), freq=freq)
+        starts = calendar.searchsorted(bounds["min"].to_numpy())
+        lengths = calendar.searchsorted(bounds["max"].to_numpy()) - starts + 1
+        offsets = np.arange(lengths.sum()) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths
         )
+        full_index = pd.MultiIndex.from_arrays(
+            [
+                np.repeat(bounds.index.to_numpy(), lengths),
+                calendar[np.repeat(starts, lengths) + offsets],
+            ],
+            names=["id", "date"],
+        )
+        aggregated = grouped.reindex(full_index).reset_index()
         return TimeSeries(aggregated, self.index)
 
-    def fill_gaps(self, method: Literal["linear", "time"] = "time") -> "TimeSeries":
-        """Interpolate missing values per polygon ID."""
+    def fill_gaps(self, method: str = "time") -> "TimeSeries":
+        """Interpolate missing values per polygon ID.
+
+        For ``"time"`` and ``"linear"`` each gap is interpolated between its
+        polygon's neighbouring valid observations (by date or by position) in
+        one grouped pass; other pandas methods run per polygon with gaps.
+        Leading and trailing gaps take the nearest value; gap-free input is
+        returned sorted without interpolating.
+        """
 
         value_col = f"mean_{self.index}"
-        filled_parts = []
-        for pid, grp in self.df.groupby("id"):
-            grp = grp.copy()
-            grp = grp.sort_values("date")
-            grp = grp.set_index("date")
-            original_missing = grp[value_col].isna()
-            grp[value_col] = grp[value_col].interpolate(method=method).ffill().bfill()
-            grp["gapfilled"] = original_missing
-            grp = grp.reset_index()
-            grp["id"] = pid
-            filled_parts.append(grp)
-
-        filled_df = pd.concat(filled_parts, ignore_index=True)
-        return TimeSeries(filled_df, self.index)
+        df = self.df.loc[self.df["id"].notna()]
+        df = df.sort_values(["id", "date"], kind="stable").reset_index(drop=True)
+        df = df[["date"] + [c for c in df.columns if c != "date"]]
+
+        ids = df["id"]
+        y = df[value_col]
+        missing = y.isna()
+        if not missing.any():
+            df["gapfilled"] = False
+            return TimeSeries(df, self.index)
+        if method not in ("time", "linear"):
+            gappy = missing.groupby(ids).transform("any").to_numpy()
+            dated = pd.Series(y.to_numpy(), index=pd.DatetimeIndex(df["date"]))
+            filled = y.to_numpy().copy()
+            filled[gappy] = (
+                dated[gappy]
+                .groupby(ids.to_numpy()[gappy])
+                .transform(lambda s: s.interpolate(method=method).ffill().bfill())
+                .to_numpy()
+            )
+        else:
+            if method == "time":
+                x = pd.Series(df["date"].to_numpy().astype("datetime64[ns]"))
+                x = x.astype(np.int64).astype(np.float64)
+            else:
+                x = df.groupby("id").cumcount().astype(np.float64)
+            valid_x = x.where(~missing)
+            x0, x1 = valid_x.groupby(ids).ffill(), valid_x.groupby(ids).bfill()
+            y0, y1 = y.groupby(ids).ffill(), y.groupby(ids).bfill()
+            span = (x1 - x0).where(lambda d: d != 0)
+            filled = (
+                (y0 + (y1 - y0) * ((x - x0) / span).fillna(0)).fillna(y0).fillna(y1)
+            )
+
+        df[value_col] = y.where(~missing, filled)
+        df["gapfilled"] = missing.to_numpy()
+        return TimeSeries(df, self.index)
 
     def decompose(
         self,
@@ -72,20 +129,93 @@ class TimeSeries:
         model: Literal["additive", "multiplicative"] = "additive",
     ) -> Dict[str, DecomposeResult]:
         """Perform seasonal decomposition for each polygon."""
+        # statsmodels is slow to import; only pay for it when decomposing.
+        from statsmodels.tsa.seasonal import seasonal_decompose
 
         value_col = f"mean_{self.index}"
-        df_pivot = self.df.pivot(index="date", columns="id", values=value_col)
+        # Split the long frame per polygon instead of pivoting to a wide
+        # (date x id) block that is mostly NaN for ragged series.
+        df = self.df.loc[self.df[value_col].notna(), ["id", "date", value_col]]
+        df = df.sort_values(["id", "date"], kind="stable")
+        wide = _decompose_aligned(df, value_col, period, model)
+        if wide is not None:
+            return wide
         results = {}
-        for pid in df_pivot.columns:
-            series = df_pivot[pid].dropna()
-            if len(series) < period * 2:
+        for pid, grp in df.groupby("id", sort=True):
+            if len(grp) < period * 2:
                 continue
-            res = seasonal_decompose(series, model=model, period=period)
-            results[pid] = res
+            series = pd.Series(
+                grp[value_col].to_numpy(),
+                index=pd.DatetimeIndex(grp["date"], name="date"),
+                name=pid,
+            )
+            results[pid] = seasonal_decompose(series, model=model, period=period)
 
         return results
 
     def to_csv(self, path: str) -> None:
         """Write the underlying DataFrame to CSV."""
 
-        self.df.to_csv(path, index=False)
+        write_csv(self.df, path)
+
+
+DECOMPOSITION_COLUMNS = ("observed", "trend", "seasonal", "resid")
+
+
+def _decompose_aligned(
+    df: pd.DataFrame,
+    value_col: str,
+    period: int,
+    model: Literal["additive", "multiplicative"],
+) -> Dict[Hashable, DecomposeResult] | None:
+    """Decompose all polygons in one call when they share the same dates.
+
+    *df* must be sorted by ``id`` then ``date``. The values are reshaped into
+    a ``(date, id)`` array and passed to ``seasonal_decompose`` once, which
+    works column-wise. Returns ``None`` for ragged series so the caller can
+    fall back to per-polygon decomposition.
+    """
+    from statsmodels.tsa.seasonal import DecomposeResult, seasonal_decompose
+
+    sizes = df.groupby("id", sort=True).size()
+    n_dates = int(sizes.iloc[0]) if len(sizes) else 0
+    if len(sizes) < 2 or n_dates < period * 2 or not (sizes == n_dates).all():
+        return None
+    dates = df["date"].to_numpy().reshape(len(sizes), n_dates)
+    if not (dates == dates[0]).all():
+        return None
+    values = df[value_col].to_numpy(dtype=np.float64).reshape(len(sizes), n_dates).T
+    res = seasonal_decompose(values, model=model, period=period)
+    index = pd.DatetimeIndex(dates[0], name="date")
+    return {
+        pid: DecomposeResult(
+            observed=pd.Series(values[:, i], index=index, name=pid),
+            seasonal=pd.Series(res.seasonal[:, i], index=index, name="seasonal"),
+            trend=pd.Series(res.trend[:, i], index=index, name="trend"),
+            resid=pd.Series(res.resid[:, i], index=index, name="resid"),
+        )
+        for i, pid in enumerate(sizes.index)
+    }
+
+
+def decomposition_frame(results: Mapping[Hashable, DecomposeResult]) -> pd.DataFrame:
+    """Return all decomposition *results* as one long ``id``/``date`` frame.
+
+    Component arrays are concatenated once per column instead of building a
+    DataFrame per polygon.
+    """
+    columns = ["id", "date", *DECOMPOSITION_COLUMNS]
+    if not results:
+        return pd.DataFrame(columns=columns)
+    pids = list(results)
+    parts = list(results.values())
+    lengths = [len(res.observed) for res in parts]
+    data = {
+        "id": np.repeat(np.asarray(pids, dtype=object), lengths),
+        "date": np.concatenate([res.observed.index.to_numpy() for res in parts]),
+    }
+    for name in DECOMPOSITION_COLUMNS:
+        data[name] = np.concatenate(
+            [np.asarray(getattr(res, name), dtype=np.float64) for res in parts]
+        )
+    return pd.DataFrame(data, columns=columns)
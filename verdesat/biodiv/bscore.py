@@ -2,6 +2,7 @@ from __future__ import annotations
 
 """Composite biodiversity score calculator."""
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 import yaml
@@ -20,9 +21,13 @@ class WeightsConfig:
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> "WeightsConfig":
-        """Load weights from a YAML file."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        """Load weights from a YAML file.
+
+        Parsed files are cached by resolved path and mtime, so edits to the
+        file are picked up automatically.
+        """
+        resolved = Path(path).resolve()
+        data = _load_weights(str(resolved), resolved.stat().st_mtime)
         return cls(
             intactness=float(data.get("intactness", 1.0)),
             shannon=float(data.get("shannon", 1.0)),
@@ -31,6 +36,13 @@ class WeightsConfig:
         )
 
 
+@functools.lru_cache(maxsize=16)
+def _load_weights(path: str, mtime: float) -> dict:
+    """Parse ``path``; ``mtime`` is part of the cache key so edits reload."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
 DEFAULT_WEIGHTS_PATH = (
     Path(__file__).resolve().parent.parent / "config" / "bscore_weights.yaml"
 )
@@ -6,6 +6,7 @@ from typing import Iterable
 import os
 import logging
 import datetime
+import numpy as np
 import pandas as pd
 import geopandas as gpd
 from shapely.geometry import shape, Point
@@ -14,10 +15,9 @@ from shapely.ops import unary_union
 
 from verdesat.geo.aoi import AOI
 
-try:
-    from pygbif import occurrences as gbif_occ
-except Exception:  # pragma: no cover - optional
-    gbif_occ = None
+#: ``pygbif.occurrences``, imported on first use by :func:`_gbif_occurrences`
+#: because ``pygbif`` eagerly loads ``matplotlib.pyplot``.
+gbif_occ = None
 
 try:
     from ebird.api.requests import get_nearby_observations
@@ -37,15 +37,20 @@ logger = logging.getLogger(__name__)
 
 
 def _to_geometry(
-    aoi_geojson: dict | str | gpd.GeoDataFrame | BaseGeometry | AOI,
+    aoi_geojson: dict | str | gpd.GeoDataFrame | gpd.GeoSeries | BaseGeometry | AOI,
 ) -> BaseGeometry:
     """Return WGS84 geometry from various AOI representations."""
 
     if isinstance(aoi_geojson, AOI):
         return _to_geometry(aoi_geojson.geometry)
     if isinstance(aoi_geojson, BaseGeometry):
-        gdf = gpd.GeoDataFrame({"geometry": [aoi_geojson]}, crs="EPSG:4326")
-    elif isinstance(aoi_geojson, gpd.GeoDataFrame):
+        # Bare geometries are already WGS84; skip the GeoDataFrame round-trip.
+        return unary_union([aoi_geojson])
+    if isinstance(aoi_geojson, gpd.GeoSeries):
+        if aoi_geojson.crs and aoi_geojson.crs.to_epsg() != 4326:
+            aoi_geojson = aoi_geojson.to_crs(epsg=4326)
+        return unary_union(aoi_geojson.to_numpy())
+    if isinstance(aoi_geojson, gpd.GeoDataFrame):
         gdf = aoi_geojson
     elif isinstance(aoi_geojson, str):
         gdf = gpd.read_file(aoi_geojson)
@@ -87,6 +92,17 @@ def _records_to_gdf(records: Iterable[dict], source: str) -> gpd.GeoDataFrame:
     )
 
 
+def _gbif_occurrences():
+    """Return ``pygbif.occurrences`` (or a patched stand-in), or ``None``."""
+    global gbif_occ  # pylint: disable=global-statement
+    if gbif_occ is None:
+        try:
+            from pygbif import occurrences as gbif_occ
+        except Exception:  # pragma: no cover - optional
+            return None
+    return gbif_occ
+
+
 class OccurrenceService(BaseService):
     """Fetch species occurrences from citizen-science portals."""
 
@@ -96,7 +112,7 @@ class OccurrenceService(BaseService):
 
     def fetch_occurrences(
         self,
-        aoi_geojson: dict | str | gpd.GeoDataFrame | BaseGeometry | AOI,
+        aoi_geojson: dict | str | gpd.GeoDataFrame | gpd.GeoSeries | BaseGeometry | AOI,
         start_year: int = 2000,
     ) -> gpd.GeoDataFrame:
         """Return occurrences for *aoi_geojson* since *start_year*.
@@ -122,12 +138,11 @@ class OccurrenceService(BaseService):
 
         gbif_gdf: gpd.GeoDataFrame
         gbif_count = 0
-        if gbif_occ is not None:
+        gbif = _gbif_occurrences()
+        if gbif is not None:
             year_param = f"{start_year},{datetime.date.today().year}"
             try:
-                res = gbif_occ.search(
-                    geometry=gbif_geom.wkt, year=year_param, limit=300
-                )
+                res = gbif.search(geometry=gbif_geom.wkt, year=year_param, limit=300)
             except Exception as exc:  # pragma: no cover - optional broad catch
                 if not use_bbox:
                     self.logger.warning(
@@ -138,7 +153,7 @@ class OccurrenceService(BaseService):
                     gbif_geom = box(*bbox)
                     use_bbox = True
                     try:
-                        res = gbif_occ.search(
+                        res = gbif.search(
                             geometry=gbif_geom.wkt, year=year_param, limit=300
                         )
                     except Exception as exc2:  # pragma: no cover - optional broad catch
@@ -224,6 +239,17 @@ class OccurrenceService(BaseService):
             return 0.0
         return float(len(gdf) / aoi_area_km2)
 
+    @staticmethod
+    def occurrence_densities_km2(
+        counts: np.ndarray, areas_km2: np.ndarray
+    ) -> np.ndarray:
+        """Vectorised :meth:`occurrence_density_km2` over many AOIs."""
+        counts = np.asarray(counts, dtype=np.float64)
+        areas_km2 = np.asarray(areas_km2, dtype=np.float64)
+        out = np.zeros_like(areas_km2)
+        np.divide(counts, areas_km2, out=out, where=areas_km2 > 0)
+        return out
+
 
 def plot_score_vs_density(
     scores: list[float], densities: list[float], out_png: str
@@ -45,6 +45,20 @@ class MetricsResult:
     fragmentation: FragmentStats
     msa: float = 0.0
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MetricsResult":
+        """Build a result from a parsed metrics JSON mapping."""
+        frag = data["fragmentation"]
+        return cls(
+            intactness=float(data["intactness"]),
+            shannon=float(data["shannon"]),
+            fragmentation=FragmentStats(
+                edge_density=float(frag["edge_density"]),
+                normalised_density=float(frag["normalised_density"]),
+            ),
+            msa=float(data.get("msa", 0.0)),
+        )
+
 
 class MetricEngine(BaseService):
     """Compute biodiversity metrics from land-cover rasters."""
@@ -5,69 +5,289 @@ and basic workflows. Dynamically loads available indices from the registry.
 
 import os
 import sys
-import json
+import glob
+import hashlib
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Collection
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
-import geopandas as gpd
 import click  # type: ignore
 from click import echo
-from verdesat.ingestion.vector_preprocessor import VectorPreprocessor
-from verdesat.ingestion.sensorspec import SensorSpec
-from verdesat.ingestion import create_ingestor
 from verdesat.ingestion.indices import INDEX_REGISTRY
-from verdesat.analytics.timeseries import TimeSeries
-from verdesat.analytics.trend import compute_trend
+from verdesat.analytics.timeseries import TimeSeries, decomposition_frame
 from verdesat.core.logger import Logger
 from verdesat.core.config import ConfigManager
 from verdesat.geo.aoi import AOI
-from verdesat.ingestion.eemanager import ee_manager
-from verdesat.services.timeseries import download_timeseries as svc_download_timeseries
-from verdesat.services.report import build_report as svc_build_report
 from verdesat.services.landcover import LandcoverService
 from verdesat.core.storage import LocalFS
-from verdesat.visualization._chips_config import ChipsConfig
-from verdesat.visualization.chips import ChipService
-from verdesat.visualization.visualizer import Visualizer
-from verdesat.core.pipeline import ReportPipeline
-from verdesat.biodiv.bscore import BScoreCalculator, WeightsConfig
-from verdesat.biodiv.metrics import MetricsResult, FragmentStats
+from verdesat.core.tabular import read_table, write_csv, write_table
+from verdesat.core.utils import load_json
+from verdesat.biodiv.bscore import (
+    DEFAULT_WEIGHTS_PATH,
+    BScoreCalculator,
+    WeightsConfig,
+)
+from verdesat.biodiv.metrics import MetricsResult
 from verdesat.biodiv.gbif_validator import OccurrenceService
 from verdesat.services import (
     compute_bscores as svc_compute_bscores,
     compute_msa_means as svc_compute_msa_means,
 )
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from verdesat.visualization.visualizer import Visualizer
+
 logger = Logger.get_logger(__name__)
-viz = Visualizer()
+
+
+@functools.lru_cache(maxsize=1)
+def _viz() -> "Visualizer":
+    """Return the shared, lazily constructed :class:`Visualizer`.
+
+    The plotting stack is imported here rather than at module level so that
+    ``verdesat --help`` and non-plotting commands start quickly.
+    """
+    from verdesat.visualization.visualizer import Visualizer
+
+    return Visualizer(logger=logger)
+
+
+def _cli_command(fn):
+    """Turn unexpected errors in a command into a one-line message and exit 1.
+
+    Tracebacks are only logged when ``VERDESAT_DEBUG`` is set; click's own
+    usage errors and aborts propagate untouched.
+    """
+    label = fn.__name__.removesuffix("_cmd").replace("_", " ")
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except (click.ClickException, click.exceptions.Exit, click.exceptions.Abort):
+            raise
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            if os.environ.get("VERDESAT_DEBUG"):
+                logger.error("%s command failed", label, exc_info=True)
+            else:
+                logger.error("%s command failed: %s", label, e)
+            echo(f"❌  {label} failed: {e}", err=True)
+            sys.exit(1)
+
+    return wrapper
+
+
+def _map_workers(fn, items, workers: int) -> list:
+    """Apply *fn* to *items* in order, using a thread pool when ``workers > 1``."""
+    if workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, items))
+
+
+def _init_plot_worker() -> None:
+    """Pin matplotlib to Agg and build the visualizer once per worker process."""
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    _viz()
+
+
+def _write_decomposition(job: tuple) -> list[str]:
+    """Write one polygon's decomposition CSV and/or PNG; returns the paths.
+
+    The CSV is skipped when ``df_out`` is ``None``. Module-level so it can
+    run in :class:`ProcessPoolExecutor` workers.
+    """
+    pid, df_out, result, output_dir, plot = job
+    paths = []
+    if df_out is not None:
+        csv_path = str(output_dir / f"{pid}_decomposition.csv")
+        write_csv(df_out.drop(columns="id"), csv_path)
+        paths.append(csv_path)
+    if plot:
+        plot_path = str(output_dir / f"{pid}_decomposition.png")
+        _viz().plot_decomposition(result, plot_path)
+        paths.append(plot_path)
+    return paths
+
+
+_WORKERS_HELP = "Concurrent network requests (1 = sequential)."
+# Below this many polygons, worker start-up (and its matplotlib import)
+# costs more than ``stats decompose`` saves by fanning out.
+_DECOMPOSE_MIN_PARALLEL = 16
+_INDEX_CHOICE = click.Choice(tuple(INDEX_REGISTRY))
+_DEFAULT_WEIGHTS = str(DEFAULT_WEIGHTS_PATH)
+_INDEX_HELP = f"Spectral index to compute (choices: {', '.join(INDEX_REGISTRY)})"
+
+
+def _require_paths(**paths: str | None) -> None:
+    """Check that all given paths exist with one ``os.scandir`` per parent.
+
+    Raises a single :class:`click.BadParameter` listing every missing path.
+    ``None`` values are treated as unset optional arguments.
+    """
+    by_parent: dict[str, dict[str, str]] = {}
+    for name, path in paths.items():
+        if path:
+            parent, base = os.path.split(os.path.abspath(path))
+            by_parent.setdefault(parent, {})[base] = name
+    missing = []
+    for parent, wanted in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                present = {entry.name for entry in it if entry.name in wanted}
+        except FileNotFoundError:
+            present = set()
+        missing.extend(
+            f"{name}={paths[name]!r}"
+            for base, name in wanted.items()
+            if base not in present
+        )
+    if missing:
+        raise click.BadParameter(f"Path(s) do not exist: {', '.join(missing)}")
+
+
+def _newest_mtime(path: str, exclude: Collection[str] = ()) -> float:
+    """Return the newest mtime of *path* or, for a directory, of its entries."""
+    mtime = os.path.getmtime(path)
+    if os.path.isdir(path):
+        with os.scandir(path) as it:
+            for entry in it:
+                if os.path.abspath(entry.path) not in exclude:
+                    mtime = max(mtime, entry.stat().st_mtime)
+    return mtime
+
+
+_ANIM_CACHE = ".verdesat_anim_cache"
+_CHIPS_CACHE = ".verdesat_chips_cache"
+
+
+def _glob_signature(images_dir: str, pattern: str, *params: object) -> str:
+    """Hash the files matching *pattern* (name + mtime) and extra *params*."""
+    digest = hashlib.sha1(repr(params).encode())
+    for path in sorted(glob.iglob(os.path.join(images_dir, pattern))):
+        digest.update(f"{path}\0{os.path.getmtime(path)}\n".encode())
+    return digest.hexdigest()
+
+
+def _file_listing(directory: str, exclude: str) -> str:
+    """Return the sorted relative paths of files under *directory* except *exclude*."""
+    names = []
+    for root, _, files in os.walk(directory):
+        names.extend(
+            os.path.relpath(os.path.join(root, f), directory)
+            for f in files
+            if f != exclude
+        )
+    return "\n".join(sorted(names))
+
+
+def _options_file(output: str) -> str:
+    """Return the hidden file next to *output* that records its build options."""
+    head, tail = os.path.split(os.path.abspath(output))
+    return os.path.join(head, f".{tail}.verdesat_opts")
+
+
+def _options_digest(params: tuple) -> str:
+    """Hash the command options an output depends on."""
+    return hashlib.sha1(repr(params).encode()).hexdigest()
+
+
+def _record_options(output: str, params: tuple) -> None:
+    """Remember the *params* that *output* was built with; see :func:`_is_stale`."""
+    Path(_options_file(output)).write_text(_options_digest(params))
+
+
+def _is_stale(inputs: list[str | None], output: str, params: tuple = ()) -> bool:
+    """Return ``True`` when *output* is missing or older than any of *inputs*.
+
+    Directories are compared by their newest entry (inputs) or oldest file
+    (outputs); ``None`` inputs are ignored. With *params*, *output* is also
+    stale unless :func:`_record_options` stored the same values for it.
+    """
+    if not os.path.exists(output):
+        return True
+    options_file = _options_file(output)
+    if params:
+        try:
+            recorded = Path(options_file).read_text()
+        except OSError:
+            return True
+        if recorded != _options_digest(params):
+            return True
+    if os.path.isdir(output):
+        with os.scandir(output) as it:
+            mtimes = [e.stat().st_mtime for e in it if e.is_file()]
+        if not mtimes:
+            return True
+        out_mtime = min(mtimes)
+    else:
+        out_mtime = os.path.getmtime(output)
+    exclude = {os.path.abspath(output), options_file}
+    return any(_newest_mtime(p, exclude) > out_mtime for p in inputs if p)
+
+
+def _prefer_parquet() -> bool:
+    """Return whether ``verdesat --prefer-parquet`` was given for this run."""
+    ctx = click.get_current_context(silent=True)
+    return bool(ctx and ctx.find_root().params.get("prefer_parquet"))
+
+
+def _read_aois(geojson: str) -> list[AOI]:
+    """Load the AOIs in *geojson*, honouring ``--prefer-parquet``."""
+    return AOI.from_geojson(geojson, id_col="id", prefer_parquet=_prefer_parquet())
 
 
 @click.group()
-def cli():
+@click.option(
+    "--prefer-parquet/--no-prefer-parquet",
+    default=False,
+    help=(
+        "Read an up-to-date .parquet file next to each AOI GeoJSON (as written "
+        "by 'prepare') instead of the GeoJSON."
+    ),
+)
+def cli(prefer_parquet):
     """VerdeSat: remote-sensing analytics toolkit."""
     Logger.setup()
+    # Plots are only ever written to files; matplotlib is not imported yet, so
+    # it picks this up on first use unless the user chose a backend.
+    os.environ.setdefault("MPLBACKEND", "Agg")
 
 
 @cli.command()
 @click.argument("input_dir", type=click.Path(exists=True))
-def prepare(input_dir):
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["geojson", "parquet", "both"]),
+    default="both",
+    help="Output format; other commands read the .parquet with --prefer-parquet.",
+)
+@_cli_command
+def prepare(input_dir, fmt):
     """Process all vector files in INPUT_DIR into a single, clean GeoJSON."""
-    try:
-        vp = VectorPreprocessor(input_dir, logger=logger)
-        gdf = vp.run()
-        output_path = os.path.join(
-            input_dir, f"{os.path.basename(input_dir)}_processed.geojson"
-        )
+    from verdesat.ingestion.vector_preprocessor import VectorPreprocessor
+
+    vp = VectorPreprocessor(input_dir, logger=logger)
+    gdf = vp.run()
+    base = Path(input_dir) / f"{Path(input_dir).name}_processed"
+    if fmt in ("geojson", "both"):
+        output_path = f"{base}.geojson"
         gdf.to_file(output_path, driver="GeoJSON")
         echo(f"✅  GeoJSON written to `{output_path}`")
-    # pylint: disable=broad-exception-caught
-    except Exception as e:
-        echo(f"❌  Processing failed: {e}", err=True)
-        sys.exit(1)
+    if fmt in ("parquet", "both"):
+        parquet_path = f"{base}.parquet"
+        gdf.to_parquet(parquet_path, write_covering_bbox=True, compression="zstd")
+        echo(f"✅  GeoParquet written to `{parquet_path}`")
 
 
 @cli.command()
+@_cli_command
 def forecast():
     """Run forecasting pipelines (Prophet, LSTM, etc.)."""
     echo("Forecasting…")
@@ -92,9 +312,9 @@ def download():
 @click.option(
     "--index",
     "-i",
-    type=click.Choice(list(INDEX_REGISTRY.keys())),
+    type=_INDEX_CHOICE,
     default=ConfigManager.DEFAULT_INDEX,
-    help=f"Spectral index to compute (choices: {', '.join(INDEX_REGISTRY.keys())})",
+    help=_INDEX_HELP,
 )
 @click.option(
     "--value-col",
@@ -121,7 +341,7 @@ def download():
     "-o",
     type=click.Path(),
     default="timeseries.csv",
-    help="Output CSV path",
+    help="Output path (.csv, or .parquet for a typed columnar file)",
 )
 @click.option(
     "--backend",
@@ -129,6 +349,27 @@ def download():
     default="ee",
     help="Data ingestion backend (e.g. 'ee').",
 )
+@click.option(
+    "--workers",
+    "-w",
+    "n_jobs",
+    type=int,
+    default=8,
+    help="Parallel download workers (-1 = all cores, 1 = sequential).",
+)
+@click.option(
+    "--high-volume/--standard-endpoint",
+    default=True,
+    help="Use the Earth Engine high-volume endpoint (default).",
+)
+@click.option(
+    "--tile-scale",
+    type=click.FloatRange(min=1, max=16),
+    default=1,
+    show_default=True,
+    help="EE reduceRegions tileScale; raise for large AOIs that hit memory limits.",
+)
+@_cli_command
 def timeseries(
     geojson,
     collection,
@@ -141,31 +382,37 @@ def timeseries(
     agg,
     output,
     backend,
+    n_jobs,
+    high_volume,
+    tile_scale,
 ):
     """
     Download and aggregate spectral index timeseries for polygons in GEOJSON.
     """
-    try:
-        svc_download_timeseries(
-            geojson=geojson,
-            collection=collection,
-            start=start,
-            end=end,
-            scale=scale,
-            index=index,
-            value_col=value_col,
-            chunk_freq=chunk_freq,
-            agg=agg,
-            output=output,
-            backend=backend,
-            logger=logger,
-        )
-        echo(f"✅  Results saved to {output}")
-    # pylint: disable=broad-exception-caught
-    except Exception as e:
-        logger.error("Timeseries command failed", exc_info=True)
-        echo(f"❌  Timeseries download failed: {e}", err=True)
-        sys.exit(1)
+    from verdesat.services.timeseries import (
+        download_timeseries as svc_download_timeseries,
+    )
+
+    svc_download_timeseries(
+        geojson=geojson,
+        collection=collection,
+        start=start,
+        end=end,
+        scale=scale,
+        index=index,
+        value_col=value_col,
+        chunk_freq=chunk_freq,
+        agg=agg,
+        output=output,
+        backend=backend,
+        logger=logger,
+        n_jobs=n_jobs,
+        high_volume=high_volume,
+        tile_scale=tile_scale,
+        return_df=False,
+        prefer_parquet=_prefer_parquet(),
+    )
+    echo(f"✅  Results saved to {output}")
 
 
 @download.command(name="chips")
@@ -259,8 +506,9 @@ def timeseries(
     "--format",
     "-f",
     "fmt",
+    type=click.Choice(["png", "geotiff"], case_sensitive=False),
     default="png",
-    help="Output file format ('png' or 'geotiff').",
+    help="Output file format: 'png' thumbnails or 'geotiff' (written as a COG).",
 )
 @click.option("--out-dir", "-o", default="chips", help="Output directory.")
 @click.option(
@@ -275,6 +523,18 @@ def timeseries(
     default=None,
     help="Override Earth Engine project (GCP).",
 )
+@click.option(
+    "--high-volume/--standard-endpoint",
+    default=True,
+    help="Use the Earth Engine high-volume endpoint (default).",
+)
+@click.option("--workers", "-w", type=int, default=16, help=_WORKERS_HELP)
+@click.option(
+    "--force/--no-force",
+    default=False,
+    help="Re-export even when OUT_DIR already holds chips for these inputs.",
+)
+@_cli_command
 def chips(
     mask_clouds,
     geojson,
@@ -296,6 +556,9 @@ def chips(
     out_dir,
     backend,
     _ee_project,
+    high_volume,
+    workers,
+    force,
 ):
     """
     Download per-polygon image chips (monthly/yearly composites).
@@ -303,53 +566,87 @@ def chips(
     CHIP_TYPE may be:
       • a comma-separated list of sensor band aliases (e.g. 'red,green,blue'), or
       • the name of any index defined in INDEX_REGISTRY (e.g. 'ndvi', 'evi').
+
+    Re-running with the same GEOJSON and options skips Earth Engine entirely
+    while the chips written by the previous run are still in OUT_DIR.
     """
-    try:
-        # 1) Load AOIs (list of AOI objects) from GeoJSON path
-        echo(f"Loading AOIs from {geojson}...")
-        aois = AOI.from_geojson(geojson, id_col="id")
-
-        # 2) Build a SensorSpec from the chosen collection ID
-        sensor_spec = SensorSpec.from_collection_id(collection)
-
-        # 3) Build a ChipsConfig from all CLI options
-        chips_cfg = ChipsConfig.from_cli(
-            collection=collection,
-            start=start,
-            end=end,
-            period=period,
-            chip_type=chip_type,
-            scale=scale,
-            buffer=buffer,
-            buffer_percent=buffer_percent,
-            min_val=min_val,
-            max_val=max_val,
-            gamma=gamma,
-            percentile_low=percentile_low,
-            percentile_high=percentile_high,
-            palette_arg=palette_arg,
-            fmt=fmt,
-            out_dir=out_dir,
-            mask_clouds=mask_clouds,
-        )
+    sig = _glob_signature(
+        os.path.dirname(geojson) or ".",
+        glob.escape(os.path.basename(geojson)),
+        collection,
+        start,
+        end,
+        period,
+        chip_type.lower(),
+        scale,
+        min_val,
+        max_val,
+        buffer,
+        buffer_percent,
+        gamma,
+        percentile_low,
+        percentile_high,
+        palette_arg,
+        fmt.lower(),
+        mask_clouds,
+        backend,
+    )
+    cache_path = Path(out_dir) / _CHIPS_CACHE
+    if not force and cache_path.is_file():
+        listing = _file_listing(out_dir, _CHIPS_CACHE)
+        if listing and cache_path.read_text() == f"{sig}\n{listing}":
+            echo(f"⏭  Chips in {out_dir}/ are up to date")
+            return
+
+    from verdesat.ingestion import create_ingestor
+    from verdesat.ingestion.eemanager import ee_manager
+    from verdesat.ingestion.sensorspec import SensorSpec
+    from verdesat.visualization._chips_config import ChipsConfig
+
+    # 1) Load AOIs (list of AOI objects) from GeoJSON path
+    echo(f"Loading AOIs from {geojson}...")
+    aois = _read_aois(geojson)
+
+    # 2) Build a SensorSpec from the chosen collection ID
+    sensor_spec = SensorSpec.from_collection_id(collection)
+
+    # 3) Build a ChipsConfig from all CLI options
+    chips_cfg = ChipsConfig.from_cli(
+        collection=collection,
+        start=start,
+        end=end,
+        period=period,
+        chip_type=chip_type,
+        scale=scale,
+        buffer=buffer,
+        buffer_percent=buffer_percent,
+        min_val=min_val,
+        max_val=max_val,
+        gamma=gamma,
+        percentile_low=percentile_low,
+        percentile_high=percentile_high,
+        palette_arg=palette_arg,
+        fmt=fmt,
+        out_dir=out_dir,
+        mask_clouds=mask_clouds,
+        high_volume=high_volume,
+        workers=workers,
+    )
 
-        echo("→ Building composites and exporting chips…")
+    echo("→ Building composites and exporting chips…")
 
-        # 4) Instantiate ingestor via factory and run chip export
-        ingestor = create_ingestor(
-            backend,
-            sensor_spec,
-            ee_manager_instance=ee_manager,
-            logger=logger,
-        )
-        ingestor.download_chips(aois=aois, config=chips_cfg)
+    # 4) Instantiate ingestor via factory and run chip export
+    ingestor = create_ingestor(
+        backend,
+        sensor_spec,
+        ee_manager_instance=ee_manager,
+        logger=logger,
+    )
+    ingestor.download_chips(aois=aois, config=chips_cfg)
 
-        echo(f"✅  Chips written under {out_dir}/")
-    # pylint: disable=broad-exception-caught
-    except Exception as e:
-        logger.error("Chips command failed", exc_info=True)
-        echo(f"❌  Chips download failed: {e}", err=True)
-        sys.exit(1)
+    if os.path.isdir(out_dir):
+        cache_path.write_text(f"{sig}\n{_file_listing(out_dir, _CHIPS_CACHE)}")
+    echo(f"✅  Chips written under {out_dir}/")
 
 
 @download.command(name="landcover")
@@ -362,21 +659,16 @@ def chips(
     default="landcover",
     help="Output directory",
 )
-def landcover(geojson, year, out_dir):
+@click.option("--workers", "-w", type=int, default=8, help=_WORKERS_HELP)
+@_cli_command
+def landcover(geojson, year, out_dir, workers):
     """Download 10 m land-cover rasters for all polygons in GEOJSON."""
-    try:
-        aois = AOI.from_geojson(geojson, id_col="id")
-        if not aois:
-            raise ValueError("No AOIs found")
-        svc = LandcoverService(logger=logger, storage=LocalFS())
-        for aoi in aois:
-            svc.download(aoi, year, out_dir)
-        echo(f"✅  Landcover rasters written under {out_dir}/")
-    # pylint: disable=broad-exception-caught
-    except Exception as e:
-        logger.error("Landcover command failed", exc_info=True)
-        echo(f"❌  Landcover download failed: {e}", err=True)
-        sys.exit(1)
+    aois = _read_aois(geojson)
+    if not aois:
+        raise ValueError("No AOIs found")
+    svc = LandcoverService(logger=logger, storage=LocalFS())
+    _map_workers(lambda aoi: svc.download(aoi, year, out_dir), aois, workers)
+    echo(f"✅  Landcover rasters written under {out_dir}/")
 
 
 @cli.group()
@@ -389,7 +681,7 @@ def stats():
 @click.option(
     "--index",
     "-i",
-    type=click.Choice(list(INDEX_REGISTRY.keys())),
+    type=_INDEX_CHOICE,
     default=ConfigManager.DEFAULT_INDEX,
     help="Spectral index that was computed (e.g., ndvi, evi)",
 )
@@ -405,20 +697,22 @@ def stats():
     "-o",
     type=click.Path(),
     default="aggregated.csv",
-    help="Output path for the aggregated CSV",
+    help="Output path for the aggregated table (.csv or .parquet)",
 )
+@_cli_command
 def aggregate(input_csv, index, freq, output):
     """
     Aggregate a raw daily time-series CSV to the specified frequency.
     """
 
     echo(f"Loading {input_csv}...")
-    df = pd.read_csv(input_csv, parse_dates=["date"])
+    value_col = ConfigManager.VALUE_COL_TEMPLATE.format(index=index)
+    df = read_table(input_csv, columns=["id", "date", value_col])
     echo(f"Aggregating by frequency '{freq}' for index '{index}'...")
     ts = TimeSeries.from_dataframe(df, index=index)
     df_agg = ts.aggregate(freq).df
     echo(f"Saving aggregated data to {output}...")
-    df_agg.to_csv(output, index=False)
+    write_table(df_agg, output)
     echo("Done.")
 
 
@@ -445,17 +739,18 @@ def preprocess():
     default="filled.csv",
     help="Output path for gap-filled CSV",
 )
+@_cli_command
 def fill_gaps_cmd(input_csv, value_col, method, output):
     """Interpolate missing values in a time-series CSV."""
 
     echo(f"Loading {input_csv}...")
-    df = pd.read_csv(input_csv, parse_dates=["date"])
+    df = read_table(input_csv)
     echo(f"Filling gaps in '{value_col}', method '{method}'...")
     index_name = value_col.replace("mean_", "")
     ts = TimeSeries.from_dataframe(df, index=index_name)
     filled_ts = ts.fill_gaps(method=method)
     echo(f"Saving filled data to {output}...")
-    filled_ts.to_csv(output)
+    write_table(filled_ts.df, output)
     echo("Done.")
 
 
@@ -480,7 +775,7 @@ def fill_gaps_cmd(input_csv, value_col, method, output):
 @click.option(
     "--output-dir",
     "-o",
-    type=click.Path(),
+    type=click.Path(file_okay=False, path_type=Path),
     default="decomposition",
     help="Directory to save outputs",
 )
@@ -489,38 +784,62 @@ def fill_gaps_cmd(input_csv, value_col, method, output):
     default=True,
     help="Whether to generate PNG plots for each polygon (default: True)",
 )
-def decompose(input_csv, index_col, model, period, output_dir, plot):
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=8,
+    help="Worker processes writing CSVs/plots (-1 = all cores, 1 = sequential).",
+)
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["csv", "parquet"]),
+    default="csv",
+    help=(
+        "'csv' writes <id>_decomposition.csv per polygon; 'parquet' writes all "
+        "polygons to a single decomposition.parquet."
+    ),
+)
+@_cli_command
+def decompose(input_csv, index_col, model, period, output_dir, plot, jobs, fmt):
     """
-    Perform seasonal decomposition on a pivoted CSV and save plot.
+    Perform seasonal decomposition per polygon and save CSVs (and plots).
     """
     echo(f"Loading {input_csv}...")
-    df = pd.read_csv(input_csv, parse_dates=["date"])
+    df = read_table(input_csv, columns=["id", "date", index_col])
     index_name = index_col.replace("mean_", "")
     ts = TimeSeries.from_dataframe(df, index=index_name)
     echo("Decomposing time series...")
 
     results = ts.decompose(period=period, model=model)
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Save decomposition components for each polygon
-    for pid, res in results.items():
-        df_out = pd.DataFrame(
-            {
-                "date": res.observed.index,
-                "observed": res.observed.values,
-                "trend": res.trend.values,
-                "seasonal": res.seasonal.values,
-                "resid": res.resid.values,
-            }
-        )
-        csv_path = os.path.join(output_dir, f"{pid}_decomposition.csv")
-        df_out.to_csv(csv_path, index=False)
-        echo(f"✅  Decomposition data saved to {csv_path}")
-
-        if plot:
-            plot_path = os.path.join(output_dir, f"{pid}_decomposition.png")
-            viz.plot_decomposition(res, plot_path)
-            echo(f"✅  Decomposition plot saved to {plot_path}")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Save decomposition components (and plots) for each polygon; every
+    # polygon is independent, so CSV formatting and rendering fan out.
+    decomp_df = decomposition_frame(results)
+    combined = fmt == "parquet"
+    if combined:
+        table_path = str(output_dir / "decomposition.parquet")
+        write_table(decomp_df, table_path)
+        echo(f"✅  Decomposition data saved to {table_path}")
+    tasks = [
+        (pid, None if combined else df_out, results[pid], output_dir, plot)
+        for pid, df_out in decomp_df.groupby("id", sort=False)
+        if plot or not combined
+    ]
+    workers = min(len(tasks), jobs if jobs > 0 else os.cpu_count() or 1)
+    if workers <= 1 or len(tasks) < _DECOMPOSE_MIN_PARALLEL:
+        written = [_write_decomposition(task) for task in tasks]
+    else:
+        chunk = max(1, len(tasks) // (workers * 4))
+        init = _init_plot_worker if plot else None
+        with ProcessPoolExecutor(max_workers=workers, initializer=init) as pool:
+            written = list(pool.map(_write_decomposition, tasks, chunksize=chunk))
+    for paths in written:
+        for path in paths:
+            kind = "plot" if path.endswith(".png") else "data"
+            echo(f"✅  Decomposition {kind} saved to {path}")
 
 
 @stats.command(name="trend")
@@ -538,16 +857,19 @@ def decompose(input_csv, index_col, model, period, output_dir, plot):
     default="trend.csv",
     help="Output CSV path for trend values",
 )
+@_cli_command
 def trend(input_csv, index_col, output):
     """
     Compute linear trend for each polygon in a time-series CSV.
     """
+    from verdesat.analytics.trend import compute_trend
+
     echo(f"Loading {input_csv}...")
-    df = pd.read_csv(input_csv, parse_dates=["date"])
+    df = read_table(input_csv, columns=["id", "date", index_col])
     echo("Computing trend...")
     trend_res = compute_trend(df, column=index_col)
     echo(f"Saving trend data to {output}...")
-    trend_res.to_csv(output)
+    write_table(trend_res.to_dataframe(), output)
     echo(f"✅  Trend data saved to {output}")
 
 
@@ -558,29 +880,18 @@ def bscore():
 
 
 @bscore.command(name="compute")
-@click.argument("metrics_json", type=click.Path(exists=True))
+@click.argument("metrics_json", type=click.File("rb"))
 @click.option(
     "--weights",
     "-w",
     type=click.Path(exists=True),
-    default=str(
-        Path(__file__).resolve().parent.parent / "config" / "bscore_weights.yaml"
-    ),
+    default=_DEFAULT_WEIGHTS,
     help="Path to weights YAML",
 )
+@_cli_command
 def compute_bscore(metrics_json, weights):
     """Compute biodiversity score from a metrics JSON file."""
-    with open(metrics_json, "r", encoding="utf-8") as fh:
-        data = json.load(fh)
-    metrics = MetricsResult(
-        intactness=float(data["intactness"]),
-        shannon=float(data["shannon"]),
-        fragmentation=FragmentStats(
-            edge_density=float(data["fragmentation"]["edge_density"]),
-            normalised_density=float(data["fragmentation"]["normalised_density"]),
-        ),
-        msa=float(data.get("msa", 0.0)),
-    )
+    metrics = MetricsResult.from_dict(load_json(metrics_json))
     calc = BScoreCalculator(WeightsConfig.from_yaml(weights))
     score = calc.score(metrics)
     echo(f"{score:.2f}")
@@ -593,9 +904,7 @@ def compute_bscore(metrics_json, weights):
     "--weights",
     "-w",
     type=click.Path(exists=True),
-    default=str(
-        Path(__file__).resolve().parent.parent / "config" / "bscore_weights.yaml"
-    ),
+    default=_DEFAULT_WEIGHTS,
     help="Path to weights YAML",
 )
 @click.option(
@@ -612,6 +921,7 @@ def compute_bscore(metrics_json, weights):
     default=50_000_000,
     help="Maximum bytes to read from the dataset",
 )
+@_cli_command
 def bscore_from_geojson(geojson, year, weights, output, dataset_uri, budget_bytes):
     """Compute B-Score for polygons in GEOJSON."""
     df = svc_compute_bscores(
@@ -641,6 +951,7 @@ def bscore_from_geojson(geojson, year, weights, output, dataset_uri, budget_byte
 @click.option(
     "--output", "-o", type=click.Path(), default="msa.csv", help="Output CSV path"
 )
+@_cli_command
 def msa_cmd(geojson, dataset_uri, budget_bytes, output):
     """Compute mean MSA for polygons in GEOJSON."""
     df = svc_compute_msa_means(
@@ -675,26 +986,40 @@ def validate():
     type=click.Path(),
     help="CSV output path",
 )
-def validate_occurrence_density(geojson, start_year, output):
+@click.option("--workers", "-w", type=int, default=8, help=_WORKERS_HELP)
+@click.option(
+    "--single-query/--per-aoi",
+    default=False,
+    help="Fetch occurrences once for the union of all AOIs and assign them "
+    "locally (fewer requests, but subject to the per-query record cap).",
+)
+@_cli_command
+def validate_occurrence_density(geojson, start_year, output, workers, single_query):
     """Compute occurrence density for AOIs in GEOJSON."""
     svc = OccurrenceService(logger=logger)
-    aois = AOI.from_geojson(geojson, id_col="id")
-
-    rows = []
-    for aoi in aois:
-        aoi_gdf = gpd.GeoDataFrame({"geometry": [aoi.geometry]}, crs="EPSG:4326")
-        occ = svc.fetch_occurrences(aoi_gdf, start_year=start_year)
-        area_km2 = (
-            gpd.GeoSeries([aoi.geometry], crs="EPSG:4326")
-            .to_crs(epsg=6933)
-            .area.iloc[0]
-            / 1e6
-        )
-        dens = svc.occurrence_density_km2(occ, area_km2)
-        rows.append({"id": aoi.static_props.get("id"), "density": dens})
+    aois = _read_aois(geojson)
+
+    import geopandas as gpd
+
+    ids = [aoi.static_props.get("id") for aoi in aois]
+    geoms = gpd.GeoSeries([aoi.geometry for aoi in aois], crs="EPSG:4326")
+    areas_km2 = geoms.to_crs(epsg=6933).area.to_numpy() / 1e6
+
+    if single_query:
+        occ_all = svc.fetch_occurrences(geoms, start_year=start_year)
+        hits = occ_all.sindex.query(geoms, predicate="intersects")
+        counts = np.bincount(hits[0], minlength=len(aois))
+    else:
 
-    df = pd.DataFrame.from_records(rows)
-    df.to_csv(output, index=False)
+        def _fetch(geom):
+            return svc.fetch_occurrences(geom, start_year=start_year)
+
+        occurrences = _map_workers(_fetch, list(geoms.to_numpy()), workers)
+        counts = np.fromiter((len(o) for o in occurrences), np.int64, len(aois))
+    densities = svc.occurrence_densities_km2(counts, areas_km2)
+
+    df = pd.DataFrame({"id": ids, "density": densities})
+    write_table(df, output)
     echo(f"✅  Occurrence densities saved to {output}")
 
 
@@ -737,19 +1062,30 @@ def visualize():
     default="timeseries",
     help="Output path for plot (HTML if interactive, PNG otherwise)",
 )
-def plot(datafile, index_col, agg_freq, interactive, output):
+@click.option(
+    "--force/--no-force",
+    default=False,
+    help="Regenerate outputs even when they are newer than the inputs.",
+)
+@_cli_command
+def plot(datafile, index_col, agg_freq, interactive, output, force):
     """
     Plot time-series from CSV: interactive HTML or static PNG.
     """
-    df = pd.read_csv(datafile, parse_dates=["date"])
+    suffix = ".html" if interactive else ".png"
+    out_path = output if output.lower().endswith(suffix) else output + suffix
+    params = (os.path.abspath(datafile), index_col, agg_freq)
+    if not force and not _is_stale([datafile], out_path, params):
+        echo("⏭  Up to date")
+        return
+    df = read_table(datafile, columns=["id", "date", index_col])
     if interactive:
-        html_path = output if output.lower().endswith(".html") else output + ".html"
-        viz.plot_timeseries_html(df, index_col, html_path, agg_freq)
+        _viz().plot_timeseries_html(df, index_col, out_path, agg_freq)
         echo(f"✅  Interactive plot saved to {output}")
     else:
-        png_path = output if output.lower().endswith(".png") else output + ".png"
-        viz.plot_time_series(df, index_col, png_path, agg_freq)
-        echo(f"✅  Static plot saved to {png_path}")
+        _viz().plot_time_series(df, index_col, out_path, agg_freq)
+        echo(f"✅  Static plot saved to {out_path}")
+    _record_options(out_path, params)
 
 
 # ---- Animate command ----
@@ -779,24 +1115,42 @@ def plot(datafile, index_col, agg_freq, interactive, output):
     default=0,
     help="Number of loops (0 = infinite)",
 )
-def animate(images_dir, pattern, output_dir, duration, loop):
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=-1,
+    help="Worker processes encoding GIFs (-1 = all cores, 1 = sequential).",
+)
+@click.option(
+    "--force/--no-force",
+    default=False,
+    help="Regenerate outputs even when they are newer than the inputs.",
+)
+@_cli_command
+def animate(images_dir, pattern, output_dir, duration, loop, workers, force):
     """
     Generate one animated GIF per site by scanning IMAGES_DIR for files matching PATTERN.
     """
-    try:
-        viz.make_gifs_per_site(
-            images_dir=images_dir,
-            pattern=pattern,
-            output_dir=output_dir,
-            duration=duration,
-            loop=loop,
-        )
-        echo(f"✅  Animated GIFs written under {output_dir}")
-    # pylint: disable=broad-exception-caught
-    except Exception as e:
-        logger.error("Animate command failed", exc_info=True)
-        echo(f"❌  Animation generation failed: {e}", err=True)
-        sys.exit(1)
+    sig = _glob_signature(images_dir, pattern, duration, loop)
+    cache_path = Path(output_dir) / _ANIM_CACHE
+    if not force and cache_path.is_file():
+        # Like ``chips``, only skip while the GIFs from that run are still there.
+        listing = _file_listing(output_dir, _ANIM_CACHE)
+        if listing and cache_path.read_text() == f"{sig}\n{listing}":
+            echo("⏭  Up to date")
+            return
+    _viz().make_gifs_per_site(
+        images_dir=images_dir,
+        pattern=pattern,
+        output_dir=output_dir,
+        duration=duration,
+        loop=loop,
+        workers=workers,
+    )
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(f"{sig}\n{_file_listing(output_dir, _ANIM_CACHE)}")
+    echo(f"✅  Animated GIFs written under {output_dir}")
 
 
 # ---- Gallery command ----
@@ -821,53 +1175,59 @@ def animate(images_dir, pattern, output_dir, duration, loop):
     default=None,
     help="Title for the gallery page",
 )
-def gallery(chips_dir, template, output, title):
+@click.option(
+    "--force/--no-force",
+    default=False,
+    help="Regenerate outputs even when they are newer than the inputs.",
+)
+@_cli_command
+def gallery(chips_dir, template, output, title, force):
     """
     Build a static HTML image gallery from a directory of chips.
     """
-    try:
-        viz.build_gallery(
-            chips_dir=chips_dir,
-            output_html=output,
-            title=title,
-            template_path=template,
-        )
-        echo(f"✅  Gallery written to {output}")
-    # pylint: disable=broad-exception-caught
-    except Exception as e:
-        logger.error("Gallery command failed", exc_info=True)
-        echo(f"❌  Gallery generation failed: {e}", err=True)
-        sys.exit(1)
+    html_path = os.path.join(chips_dir, output)
+    params = (template and os.path.abspath(template), title)
+    if not force and not _is_stale([chips_dir, template], html_path, params):
+        echo("⏭  Up to date")
+        return
+    _viz().build_gallery(
+        chips_dir=chips_dir,
+        output_html=output,
+        title=title,
+        template_path=template,
+    )
+    _record_options(html_path, params)
+    echo(f"✅  Gallery written to {output}")
 
 
 @cli.command(name="report")
-@click.argument("geojson", type=click.Path(exists=True))
-@click.argument("timeseries_csv", type=click.Path(exists=True))
-@click.argument("timeseries_html", type=click.Path(exists=True))
+@click.argument("geojson", type=click.Path())
+@click.argument("timeseries_csv", type=click.Path())
+@click.argument("timeseries_html", type=click.Path())
 @click.option(
     "--gifs-dir",
     "-g",
-    type=click.Path(exists=True),
+    type=click.Path(),
     default=None,
     help="Directory of per-site animated GIFs",
 )
 @click.option(
     "--decomposition-dir",
     "-d",
-    type=click.Path(exists=True),
+    type=click.Path(),
     required=True,
     help="Directory containing per-site decomposition PNGs",
 )
 @click.option(
     "--chips-dir",
     "-c",
-    type=click.Path(exists=True),
+    type=click.Path(),
     required=True,
     help="Directory containing per-site image chips",
 )
 @click.option(
     "--map-png",
-    type=click.Path(exists=True),
+    type=click.Path(),
     default=None,
     help="Optional static PNG of project area to embed in report",
 )
@@ -884,6 +1244,12 @@ def gallery(chips_dir, template, output, title):
     default="report.html",
     help="Output HTML report path",
 )
+@click.option(
+    "--force/--no-force",
+    default=False,
+    help="Regenerate outputs even when they are newer than the inputs.",
+)
+@_cli_command
 def report(
     geojson: str,
     timeseries_csv: str,
@@ -894,29 +1260,44 @@ def report(
     map_png: str,
     title: str,
     output: str,
+    force: bool,
 ):
     """
     Generate a one‑page HTML report summarizing statistics, time‑series, decomposition, and image gallery.
     """
+    inputs = {
+        "geojson": geojson,
+        "timeseries_csv": timeseries_csv,
+        "timeseries_html": timeseries_html,
+        "gifs_dir": gifs_dir,
+        "decomposition_dir": decomposition_dir,
+        "chips_dir": chips_dir,
+        "map_png": map_png,
+    }
+    _require_paths(**inputs)
+    params = (
+        tuple((k, v and os.path.abspath(v)) for k, v in inputs.items()),
+        title,
+    )
+    if not force and not _is_stale(list(inputs.values()), output, params):
+        echo("⏭  Up to date")
+        return
     echo(f"Building report '{output}'...")
-
-    try:
-        svc_build_report(
-            geojson_path=geojson,
-            timeseries_csv=timeseries_csv,
-            timeseries_html=timeseries_html,
-            gifs_dir=gifs_dir,
-            decomposition_dir=decomposition_dir,
-            chips_dir=chips_dir,
-            map_png=map_png,
-            output_path=output,
-            title=title,
-        )
-        echo(f"✅  Report saved to {output}")
-    # pylint: disable=broad-exception-caught
-    except Exception as e:
-        echo(f"❌  Failed to build report: {e}")
-        sys.exit(1)
+    from verdesat.services.report import build_report as svc_build_report
+
+    svc_build_report(
+        geojson_path=geojson,
+        timeseries_csv=timeseries_csv,
+        timeseries_html=timeseries_html,
+        gifs_dir=gifs_dir,
+        decomposition_dir=decomposition_dir,
+        chips_dir=chips_dir,
+        map_png=map_png,
+        output_path=output,
+        title=title,
+    )
+    _record_options(output, params)
+    echo(f"✅  Report saved to {output}")
 
 
 @cli.group()
@@ -942,34 +1323,123 @@ def pipeline():
     default="NASA/HLS/HLSL30/v002",
     help="Earth Engine ImageCollection ID",
 )
-def pipeline_report(geojson, start, end, out_dir, map_png, title, collection):
+@click.option(
+    "--concurrency",
+    "-j",
+    type=int,
+    default=4,
+    help="Concurrent Earth Engine requests for time series and chips.",
+)
+@click.option(
+    "--rate-limit",
+    type=float,
+    default=None,
+    help=(
+        "Cap Earth Engine requests per second across time series and chip "
+        "exports (default: unthrottled)."
+    ),
+)
+@_cli_command
+def pipeline_report(
+    geojson, start, end, out_dir, map_png, title, collection, concurrency, rate_limit
+):
     """Run full NDVI → report pipeline in one go."""
     if not os.path.isdir(out_dir):
         os.makedirs(out_dir, exist_ok=True)
 
-    aois = AOI.from_geojson(geojson, id_col="id")
+    from verdesat.core.pipeline import ReportPipeline
+    from verdesat.core.utils import RateLimiter
+    from verdesat.ingestion import create_ingestor
+    from verdesat.ingestion.eemanager import ee_manager
+    from verdesat.ingestion.sensorspec import SensorSpec
+
+    aois = _read_aois(geojson)
     sensor = SensorSpec.from_collection_id(collection)
+    # One limiter for the time-series requests and both chip exports.
+    limiter = RateLimiter(rate_limit) if rate_limit else None
     ingestor = create_ingestor(
-        "ee", sensor, ee_manager_instance=ee_manager, logger=logger
+        "ee",
+        sensor,
+        ee_manager_instance=ee_manager,
+        logger=logger,
+        rate_limiter=limiter,
     )
-    viz = Visualizer()
 
-    pipeline = ReportPipeline(aois=aois, ingestor=ingestor, visualizer=viz)
+    pipeline = ReportPipeline(
+        aois=aois,
+        ingestor=ingestor,
+        visualizer=_viz(),
+        concurrency=concurrency,
+        rate_limiter=limiter,
+    )
     report_path = pipeline.run(
         start=start, end=end, out_dir=out_dir, map_png=map_png, title=title
     )
     click.echo(f"\n✅  All done! Your full report is here: {report_path}")
 
 
+def _resolve_step(ctx: click.Context, name: str) -> click.Command:
+    """Return the leaf command for a space-separated step such as ``stats trend``."""
+    cmd: click.Command = cli
+    for part in name.split():
+        sub = cmd.get_command(ctx, part) if isinstance(cmd, click.Group) else None
+        if sub is None:
+            raise click.UsageError(f"Unknown pipeline step: {name!r}")
+        cmd = sub
+    if isinstance(cmd, click.Group):
+        raise click.UsageError(f"Pipeline step {name!r} is a group, not a command")
+    return cmd
+
+
+@cli.command(name="run")
+@click.argument("spec_yaml", type=click.Path(exists=True, dir_okay=False))
+@click.pass_context
+@_cli_command
+def run_spec(ctx, spec_yaml):
+    """Run several commands from SPEC_YAML in one process.
+
+    SPEC_YAML holds a ``steps`` list of ``{command: {param: value}}`` mappings,
+    e.g. ``- stats trend: {input_csv: ts.csv, output: trend.csv}``. Parameter
+    names are the command's Python argument names; values are converted and
+    validated as if given on the command line. Running the steps together
+    shares imports, Earth Engine initialisation and cached AOIs between them.
+    """
+    import yaml
+
+    with open(spec_yaml, "r", encoding="utf-8") as fh:
+        spec = yaml.safe_load(fh) or {}
+    steps = spec.get("steps", []) if isinstance(spec, dict) else spec
+    for step in steps:
+        if not isinstance(step, dict) or len(step) != 1:
+            raise click.UsageError(f"Each step must be a one-key mapping: {step!r}")
+        ((name, args),) = step.items()
+        cmd = _resolve_step(ctx, name)
+        kwargs = {str(k).replace("-", "_"): v for k, v in (args or {}).items()}
+        unknown = sorted(set(kwargs) - {p.name for p in cmd.params})
+        if unknown:
+            raise click.UsageError(
+                f"Unknown parameter(s) for step {name!r}: {', '.join(unknown)}"
+            )
+        echo(f"▶  {name}")
+        # Feeding the values through default_map runs Click's type conversion,
+        # defaults and validation, just like options given on the command line.
+        with cmd.make_context(name, [], parent=ctx, default_map=kwargs) as sub_ctx:
+            cmd.invoke(sub_ctx)
+
+
 @cli.command()
+@_cli_command
 def webapp():
     """Run local Streamlit dashboard."""
-    import subprocess, sys, pathlib, importlib
+    import importlib.util
 
-    app_path = pathlib.Path(importlib.import_module("verdesat.webapp.app").__file__)
-    subprocess.run(
-        [sys.executable, "-m", "streamlit", "run", str(app_path)], check=True
-    )
+    from streamlit.web import cli as stcli
+
+    # Resolve the app without importing it; Streamlit executes it itself.
+    spec = importlib.util.find_spec("verdesat.webapp.app")
+    app_path = Path(spec.origin)
+    # Run Streamlit in this interpreter instead of spawning a second one.
+    stcli.main(args=["run", str(app_path)], prog_name="streamlit")
 
 
 if __name__ == "__main__":
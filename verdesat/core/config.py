@@ -53,6 +53,14 @@ class ConfigManager:
         "brown-green": ("brown", "green"),
         "blue-white-green": ("blue", "white", "green"),
     }
+    # CSS hex codes (as Earth Engine resolves the names) for palette colours
+    PALETTE_HEX: dict[str, str] = {
+        "white": "ffffff",
+        "green": "008000",
+        "red": "ff0000",
+        "brown": "a52a2a",
+        "blue": "0000ff",
+    }
 
     # Default spectral index and output column naming
     DEFAULT_INDEX: str = "ndvi"
@@ -1,28 +1,42 @@
 from __future__ import annotations
 
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import pandas as pd
 
 from verdesat.geo.aoi import AOI
-from verdesat.analytics.timeseries import TimeSeries
+from verdesat.analytics.timeseries import TimeSeries, decomposition_frame
 from verdesat.ingestion.base import BaseDataIngestor
-from verdesat.visualization.visualizer import Visualizer
 from verdesat.visualization._chips_config import ChipsConfig
 from verdesat.core.config import ConfigManager
+from verdesat.core.tabular import write_csv
+from verdesat.core.utils import RateLimiter
 import geopandas as gpd
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from verdesat.visualization.visualizer import Visualizer
+
 
 @dataclass
 class ReportPipeline:
-    """Encapsulate the NDVI report workflow."""
+    """Encapsulate the NDVI report workflow.
+
+    Per-AOI time-series requests run on *concurrency* threads; the
+    ingestor's downloader retries failed chunks. *rate_limiter* throttles
+    both chip stages; hand the same limiter to the ingestor so its time-series
+    requests draw from one budget.
+    """
 
     aois: List[AOI]
     ingestor: BaseDataIngestor
     visualizer: Visualizer
+    concurrency: int = 1
+    rate_limiter: Optional[RateLimiter] = None
 
     def _export_geojson(self, out_dir: str) -> str:
         """Write AOIs to GeoJSON and return the file path."""
@@ -35,29 +49,13 @@ class ReportPipeline:
         gdf.to_file(path, driver="GeoJSON")
         return path
 
-    def run(
-        self,
-        start: str,
-        end: str,
-        out_dir: str,
-        map_png: Optional[str] = None,
-        title: str = ConfigManager.DEFAULT_REPORT_TITLE,
-        index: str | None = None,
-        value_col: str | None = None,
-    ) -> str:
-        """Execute the full pipeline and return path to report."""
-        os.makedirs(out_dir, exist_ok=True)
-        self._export_geojson(out_dir)
-
-        index_name = index or ConfigManager.DEFAULT_INDEX
-        value_column = value_col or ConfigManager.VALUE_COL_TEMPLATE.format(
-            index=index_name
-        )
+    def _download_timeseries(
+        self, start: str, end: str, index_name: str, value_column: str
+    ) -> pd.DataFrame:
+        """Download monthly time-series for all AOIs."""
 
-        # 1. Download monthly time-series for all AOIs
-        df_list: List[pd.DataFrame] = []
-        for aoi in self.aois:
-            df = self.ingestor.download_timeseries(
+        def _download(aoi: AOI) -> pd.DataFrame:
+            return self.ingestor.download_timeseries(
                 aoi,
                 start_date=start,
                 end_date=end,
@@ -67,16 +65,34 @@ class ReportPipeline:
                 chunk_freq="YE",
                 freq="ME",
             )
-            df_list.append(df)
-        timeseries_df = pd.concat(df_list, ignore_index=True)
+
+        if self.concurrency > 1:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                df_list = list(pool.map(_download, self.aois))
+        else:
+            df_list = [_download(aoi) for aoi in self.aois]
+        return pd.concat(df_list, ignore_index=True)
+
+    def _timeseries_stage(
+        self,
+        start: str,
+        end: str,
+        out_dir: str,
+        index_name: str,
+        value_column: str,
+    ) -> Tuple[str, TimeSeries]:
+        """Download, aggregate, gap-fill and decompose; return filled CSV path."""
+        # 1. Download monthly time-series for all AOIs
+        timeseries_df = self._download_timeseries(start, end, index_name, value_column)
         timeseries_csv = os.path.join(out_dir, "timeseries.csv")
-        timeseries_df.to_csv(timeseries_csv, index=False)
+        write_csv(timeseries_df, timeseries_csv)
 
         # 2. Aggregate & fill gaps
         ts = TimeSeries.from_dataframe(timeseries_df, index=index_name)
         monthly_csv = os.path.join(out_dir, "timeseries_monthly.csv")
-        ts.aggregate("ME").to_csv(monthly_csv)
-        filled_ts = ts.aggregate("ME").fill_gaps()
+        monthly_ts = ts.aggregate("ME")
+        monthly_ts.to_csv(monthly_csv)
+        filled_ts = monthly_ts.fill_gaps()
         filled_csv = os.path.join(out_dir, "timeseries_filled.csv")
         filled_ts.to_csv(filled_csv)
 
@@ -84,30 +100,25 @@ class ReportPipeline:
         decomp_dir = os.path.join(out_dir, "decomp")
         os.makedirs(decomp_dir, exist_ok=True)
         results = filled_ts.decompose()
-        for pid, res in results.items():
-            df_out = pd.DataFrame(
-                {
-                    "date": res.observed.index,
-                    "observed": res.observed.values,
-                    "trend": res.trend.values,
-                    "seasonal": res.seasonal.values,
-                    "resid": res.resid.values,
-                }
-            )
-            df_out.to_csv(
-                os.path.join(decomp_dir, f"{pid}_decomposition.csv"), index=False
+        decomp_df = decomposition_frame(results)
+        for pid, df_out in decomp_df.groupby("id", sort=False):
+            write_csv(
+                df_out.drop(columns="id"),
+                os.path.join(decomp_dir, f"{pid}_decomposition.csv"),
             )
             self.visualizer.plot_decomposition(
-                res, os.path.join(decomp_dir, f"{pid}_decomposition.png")
+                results[pid], os.path.join(decomp_dir, f"{pid}_decomposition.png")
             )
+        return filled_csv, filled_ts
 
-        # 4. Export image chips
-        chips_dir = os.path.join(out_dir, "chips")
-        yearly_cfg = ChipsConfig.from_cli(
+    def _chips_config(
+        self, start: str, end: str, period: str, index_name: str, out_dir: str
+    ) -> ChipsConfig:
+        config = ChipsConfig.from_cli(
             collection=self.ingestor.sensor.collection_id,
             start=start,
             end=end,
-            period="Y",
+            period=period,
             chip_type=index_name,
             scale=30,
             buffer=0,
@@ -119,32 +130,61 @@ class ReportPipeline:
             percentile_high=None,
             palette_arg="white-green",
             fmt="png",
-            out_dir=chips_dir,
+            out_dir=out_dir,
             mask_clouds=True,
+            workers=self.concurrency,
         )
-        self.ingestor.download_chips(self.aois, yearly_cfg)
+        # Chip exports draw from the same request budget as the time series.
+        config.rate_limiter = self.rate_limiter
+        return config
+
+    def run(
+        self,
+        start: str,
+        end: str,
+        out_dir: str,
+        map_png: Optional[str] = None,
+        title: str = ConfigManager.DEFAULT_REPORT_TITLE,
+        index: str | None = None,
+        value_col: str | None = None,
+    ) -> str:
+        """Execute the full pipeline and return path to report.
 
+        The time-series stage and both chip exports are independent, so they
+        overlap on worker threads; GIFs and the report follow once all of
+        them have finished. Safe to call from inside a running event loop.
+        """
+        os.makedirs(out_dir, exist_ok=True)
+        self._export_geojson(out_dir)
+
+        index_name = index or ConfigManager.DEFAULT_INDEX
+        value_column = value_col or ConfigManager.VALUE_COL_TEMPLATE.format(
+            index=index_name
+        )
+
+        # 1-4. Time-series analytics and image chips
+        chips_dir = os.path.join(out_dir, "chips")
         monthly_chips_dir = os.path.join(out_dir, "chips_monthly")
-        monthly_cfg = ChipsConfig.from_cli(
-            collection=self.ingestor.sensor.collection_id,
-            start=start,
-            end=end,
-            period="ME",
-            chip_type=index_name,
-            scale=30,
-            buffer=0,
-            buffer_percent=None,
-            min_val=None,
-            max_val=None,
-            gamma=None,
-            percentile_low=None,
-            percentile_high=None,
-            palette_arg="white-green",
-            fmt="png",
-            out_dir=monthly_chips_dir,
-            mask_clouds=True,
+        yearly_cfg = self._chips_config(start, end, "Y", index_name, chips_dir)
+        monthly_cfg = self._chips_config(
+            start, end, "ME", index_name, monthly_chips_dir
         )
-        self.ingestor.download_chips(self.aois, monthly_cfg)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            stage = pool.submit(
+                self._timeseries_stage,
+                start,
+                end,
+                out_dir,
+                index_name,
+                value_column,
+            )
+            chips = [
+                pool.submit(self.ingestor.download_chips, self.aois, cfg)
+                for cfg in (yearly_cfg, monthly_cfg)
+            ]
+            filled_csv, filled_ts = stage.result()
+            for future in chips:
+                future.result()
 
         # 5. Animated GIFs per year
         gifs_dir = os.path.join(out_dir, "gifs")
@@ -173,3 +213,25 @@ class ReportPipeline:
             timeseries_csv=filled_csv,
             index_name=index_name,
         )
+
+    async def run_async(
+        self,
+        start: str,
+        end: str,
+        out_dir: str,
+        map_png: Optional[str] = None,
+        title: str = ConfigManager.DEFAULT_REPORT_TITLE,
+        index: str | None = None,
+        value_col: str | None = None,
+    ) -> str:
+        """Awaitable :meth:`run` that keeps the event loop free meanwhile."""
+        return await asyncio.to_thread(
+            self.run,
+            start,
+            end,
+            out_dir,
+            map_png=map_png,
+            title=title,
+            index=index,
+            value_col=value_col,
+        )
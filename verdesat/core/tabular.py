@@ -0,0 +1,387 @@
+"""Fast tabular I/O helpers shared by the CLI and services."""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+from pathlib import Path
+from typing import IO, Sequence
+
+import pandas as pd
+
+try:  # pragma: no cover - optional dependency
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as pa_ds
+    import pyarrow.fs as pa_fs
+    import pyarrow.parquet as pa_pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None  # type: ignore[assignment]
+    pc = None  # type: ignore[assignment]
+    pa_csv = None  # type: ignore[assignment]
+    pa_ds = None  # type: ignore[assignment]
+    pa_fs = None  # type: ignore[assignment]
+    pa_pq = None  # type: ignore[assignment]
+
+_PARQUET_SUFFIXES = (".parquet", ".pq")
+_REMOTE_SCHEMES = ("s3://", "r2://")
+
+
+def _fast_io() -> bool:
+    """Return whether the pyarrow CSV paths may be used.
+
+    Set ``VERDESAT_FAST_IO=0`` to force the plain pandas reader/writer, e.g.
+    when comparing outputs byte-for-byte with older runs.
+    """
+    return pa is not None and os.environ.get("VERDESAT_FAST_IO", "1") != "0"
+
+
+def _arrow_table(df: pd.DataFrame) -> "pa.Table":
+    """Convert *df* to Arrow so pyarrow writes the same CSV text as pandas.
+
+    Midnight-only timestamps become dates; other timestamps, floats and
+    booleans are pre-formatted with pandas' ``str`` (``1.0``, ``True``,
+    ``2024-01-01 12:30:00``), which Arrow renders differently. Anything
+    pandas would quote, and other column types, raise ``TypeError`` so the
+    caller falls back to pandas.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for idx, name in enumerate(df.columns):
+        col = df.iloc[:, idx]
+        typ = table.schema.field(idx).type
+        if pa.types.is_string(typ):
+            if pc.any(pc.match_substring_regex(table.column(idx), '[,"\r\n]')).as_py():
+                raise TypeError(f"column {name!r} needs CSV quoting")
+            continue
+        if pa.types.is_integer(typ) or pa.types.is_null(typ):
+            continue
+        if pd.api.types.is_datetime64_dtype(col) and col.dt.normalize().equals(col):
+            column = table.column(idx).cast(pa.date32())
+        elif (
+            pa.types.is_floating(typ)
+            or pa.types.is_boolean(typ)
+            or pa.types.is_timestamp(typ)
+        ):
+            column = pa.array(
+                col.astype(str).to_numpy(dtype=object),
+                mask=col.isna().to_numpy(),
+                type=pa.string(),
+            )
+        else:
+            raise TypeError(f"column {name!r} of type {typ} has no CSV mapping")
+        table = table.set_column(idx, str(name), column)
+    if table.num_columns == 1 and table.column(0).null_count:
+        # The csv module writes a lone empty field as "" to keep the row.
+        raise TypeError("single nullable column")
+    return table
+
+
+def _datetime_formats(df: pd.DataFrame) -> dict[str, bool]:
+    """Map each naive datetime column of *df* to whether it holds dates only."""
+    return {
+        name: bool(df[name].dt.normalize().equals(df[name]))
+        for name in df.columns
+        if pd.api.types.is_datetime64_dtype(df[name])
+    }
+
+
+def _format_datetimes(df: pd.DataFrame, dates_only: dict[str, bool]) -> pd.DataFrame:
+    """Render the datetime columns in *dates_only* as text, leaving NaT empty.
+
+    Date-only columns are written as ``YYYY-MM-DD``; the rest keep pandas'
+    full timestamp rendering.
+    """
+    out = df.copy(deep=False)
+    for name, date_only in dates_only.items():
+        if name not in out.columns or not pd.api.types.is_datetime64_dtype(out[name]):
+            continue
+        col = out[name]
+        if date_only:
+            text = col.dt.strftime("%Y-%m-%d")
+        elif (col.dropna() == col.dropna().dt.floor("s")).all():
+            # astype(str) would drop the time of an all-midnight chunk.
+            text = col.dt.strftime("%Y-%m-%d %H:%M:%S")
+        else:
+            text = col.astype(str)
+        out[name] = text.where(col.notna(), None).astype(object)
+    return out
+
+
+def _csv_options() -> "pa_csv.WriteOptions":
+    """Arrow CSV options for tables prepared by :func:`_arrow_table`."""
+    return pa_csv.WriteOptions(include_header=False, quoting_style="none")
+
+
+def _csv_header(df: pd.DataFrame) -> bytes:
+    """Return the header line pandas writes for *df*."""
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator=os.linesep).writerow([str(c) for c in df.columns])
+    return buf.getvalue().encode()
+
+
+def _write_arrow_csv(
+    df: pd.DataFrame, table: "pa.Table", fh: IO[bytes], header: bool
+) -> None:
+    """Write *table* to *fh* unquoted, with the header pandas writes for *df*."""
+    if header:
+        fh.write(_csv_header(df))
+    pa_csv.write_csv(table, fh, write_options=_csv_options())
+
+
+def _write_csv(df: pd.DataFrame, sink: str | IO[bytes], header: bool = True) -> None:
+    """Write *df* to a path or binary handle, preferring pyarrow's writer.
+
+    The output is byte-for-byte what :meth:`pandas.DataFrame.to_csv` writes.
+    """
+    if _fast_io():
+        try:
+            table = _arrow_table(df)
+        except (
+            pa.ArrowInvalid,
+            pa.ArrowTypeError,
+            pa.ArrowNotImplementedError,
+            TypeError,
+        ):
+            # Mixed or quoted values are left to pandas.
+            pass
+        else:
+            if isinstance(sink, str):
+                with open(sink, "wb") as fh:
+                    _write_arrow_csv(df, table, fh, header)
+            else:
+                _write_arrow_csv(df, table, sink, header)
+            return
+    df.to_csv(sink, index=False, header=header)
+
+
+def write_csv(df: pd.DataFrame | pd.Series, path: str) -> None:
+    """Write *df* to *path* as CSV without the index.
+
+    Uses pyarrow's multithreaded writer when available (see :func:`_fast_io`)
+    and falls back to :meth:`pandas.DataFrame.to_csv` otherwise.
+    """
+    if isinstance(df, pd.Series):
+        df = df.to_frame()
+    _write_csv(df, path)
+
+
+def write_table(df: pd.DataFrame | pd.Series, path: str) -> None:
+    """Write *df* to *path*, as ZSTD Parquet for ``.parquet``/``.pq`` and CSV otherwise."""
+    if Path(path).suffix.lower() in _PARQUET_SUFFIXES:
+        if isinstance(df, pd.Series):
+            df = df.to_frame()
+        df.to_parquet(path, index=False, compression="zstd")
+        return
+    write_csv(df, path)
+
+
+class TableWriter:
+    """Append DataFrames to a CSV or Parquet file one chunk at a time.
+
+    Only the chunk being written is held in memory. Columns follow the first
+    chunk that has any, even if it has no rows; use as a context manager so the file is always closed.
+    CSV chunks share one Arrow ``CSVWriter`` while their schema matches the
+    first chunk's.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.rows = 0
+        self._parquet = Path(path).suffix.lower() in _PARQUET_SUFFIXES
+        self._columns: list | None = None
+        self._schema: "pa.Schema | None" = None
+        self._writer: "pa_pq.ParquetWriter | None" = None
+        self._csv_writer: "pa_csv.CSVWriter | None" = None
+        self._fh: IO[bytes] | None = None
+        self._dates_only: dict[str, bool] | None = None
+        self._pending: list[pd.DataFrame] = []
+        self._closed = False
+
+    def __enter__(self) -> "TableWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(self, df: pd.DataFrame | pd.Series) -> None:
+        """Append *df* to the output."""
+        if isinstance(df, pd.Series):
+            df = df.to_frame()
+        if self._columns is None:
+            if df.columns.empty:
+                return
+            # Recorded even for empty chunks so a zero-row output keeps its header.
+            self._columns = list(df.columns)
+        elif list(df.columns) != self._columns:
+            df = df.reindex(columns=self._columns)
+        if df.empty:
+            return
+        self.rows += len(df)
+        if not self._parquet:
+            self._write_csv_chunk(df)
+        elif pa is None:
+            self._pending.append(df)
+        else:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._writer is None:
+                self._schema = table.schema
+                self._writer = pa_pq.ParquetWriter(
+                    self.path, self._schema, compression="zstd"
+                )
+            else:
+                table = table.cast(self._schema)
+            self._writer.write_table(table)
+
+    def _write_csv_chunk(self, df: pd.DataFrame) -> None:
+        """Append *df* to the CSV output, reusing the open Arrow writer.
+
+        Datetime columns keep the format chosen for the first chunk, so a
+        midnight-only first chunk writes dates for the whole file.
+        """
+        first = self._fh is None
+        if self._dates_only is None:
+            self._dates_only = _datetime_formats(df)
+        df = _format_datetimes(df, self._dates_only)
+        if self._fh is None:
+            self._fh = open(self.path, "wb")
+        if _fast_io() and (first or self._csv_writer is not None):
+            try:
+                table = _arrow_table(df)
+            except (
+                pa.ArrowInvalid,
+                pa.ArrowTypeError,
+                pa.ArrowNotImplementedError,
+                TypeError,
+            ):
+                table = None
+            if table is not None and first:
+                self._schema = table.schema
+                self._fh.write(_csv_header(df))
+                self._csv_writer = pa_csv.CSVWriter(
+                    self._fh, table.schema, write_options=_csv_options()
+                )
+            writer = self._csv_writer
+            if table is not None and writer is not None:
+                if table.schema.equals(self._schema):
+                    writer.write_table(table)
+                    return
+        # Chunks whose types drifted (e.g. an all-NaN column) are formatted
+        # on their own; rows still land in order on the same handle.
+        _write_csv(df, self._fh, header=first)
+
+    def close(self) -> None:
+        """Flush and close the output, creating it if nothing was written."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None:
+            self._writer.close()
+        elif self._fh is not None:
+            if self._csv_writer is not None:
+                self._csv_writer.close()
+            self._fh.close()
+        else:
+            frames = self._pending or [pd.DataFrame(columns=self._columns)]
+            write_table(pd.concat(frames, ignore_index=True), self.path)
+            self._pending = []
+
+
+def _coerce_dates(df: pd.DataFrame, date_col: str) -> pd.DataFrame:
+    """Parse *date_col* to ``datetime64[ns]`` once, skipping typed columns."""
+    if date_col not in df.columns:
+        return df
+    col = df[date_col]
+    if pd.api.types.is_datetime64_dtype(col):
+        if col.dtype != "datetime64[ns]":
+            df[date_col] = col.astype("datetime64[ns]")
+    else:
+        df[date_col] = pd.to_datetime(col, format="ISO8601", cache=True)
+    return df
+
+
+def _remote_filesystem(uri: str) -> tuple["pa_fs.FileSystem", str]:
+    """Return a pyarrow filesystem and bucket path for an ``s3://``/``r2://`` URI.
+
+    ``r2://`` uses Cloudflare R2 via ``R2_ENDPOINT`` with ``R2_KEY`` and
+    ``R2_SECRET`` (anonymous when unset); ``s3://`` uses the usual AWS
+    credential chain.
+    """
+    scheme, _, bucket_path = uri.partition("://")
+    if scheme == "s3":
+        return pa_fs.S3FileSystem(), bucket_path
+    endpoint = os.environ.get("R2_ENDPOINT")
+    if not endpoint:
+        raise ValueError("Set R2_ENDPOINT to read r2:// URIs")
+    key, secret = os.environ.get("R2_KEY"), os.environ.get("R2_SECRET")
+    fs = pa_fs.S3FileSystem(
+        endpoint_override=endpoint,
+        region="auto",
+        access_key=key,
+        secret_key=secret,
+        anonymous=not (key and secret),
+    )
+    return fs, bucket_path
+
+
+def _read_remote(uri: str, columns: list[str] | None) -> "pa.Table":
+    """Read a remote Parquet dataset or CSV object into an Arrow table."""
+    if pa is None:
+        raise ImportError("pyarrow is required to read remote tables")
+    fs, bucket_path = _remote_filesystem(uri)
+    if Path(bucket_path).suffix.lower() in _PARQUET_SUFFIXES:
+        # Datasets coalesce ranged reads and only fetch projected columns.
+        dataset = pa_ds.dataset(bucket_path, format="parquet", filesystem=fs)
+        return dataset.to_table(columns=columns, use_threads=True)
+    with fs.open_input_stream(bucket_path) as stream:
+        return pa_csv.read_csv(
+            stream,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=columns, strings_can_be_null=True
+            ),
+        )
+
+
+def read_table(
+    path: str | Path,
+    columns: Sequence[str] | None = None,
+    date_col: str = "date",
+) -> pd.DataFrame:
+    """Read a CSV or Parquet table and parse its *date_col*.
+
+    Parquet files are read column-wise with pre-buffered I/O; CSVs go
+    through pyarrow's multithreaded parser when available and pandas
+    otherwise. ``s3://`` and ``r2://`` URIs are read through pyarrow's S3
+    filesystem. Only *columns* are loaded when given.
+    """
+    suffix = Path(path).suffix.lower()
+    cols = list(columns) if columns is not None else None
+    if isinstance(path, str) and path.startswith(_REMOTE_SCHEMES):
+        df = _read_remote(path, cols).to_pandas(date_as_object=False)
+    elif suffix in _PARQUET_SUFFIXES:
+        if pa_pq is not None:
+            # Pre-buffering coalesces column-chunk reads; split blocks let the
+            # Arrow buffers be released while converting.
+            table = pa_pq.read_table(
+                path, columns=cols, pre_buffer=True, use_threads=True
+            )
+            df = table.to_pandas(
+                date_as_object=False, split_blocks=True, self_destruct=True
+            )
+        else:
+            df = pd.read_parquet(path, columns=cols)
+    elif _fast_io():
+        try:
+            table = pa_csv.read_csv(
+                path,
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=cols, strings_can_be_null=True
+                ),
+            )
+            df = table.to_pandas(date_as_object=False)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            df = pd.read_csv(path, usecols=cols)
+    else:
+        df = pd.read_csv(path, usecols=cols)
+    return _coerce_dates(df, date_col)
@@ -2,8 +2,21 @@
 
 from __future__ import annotations
 
+import importlib.util
 import os
 import re
+import sys
+import threading
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Any
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+    import json
 
 
 def sanitize_identifier(identifier: str) -> str:
@@ -16,3 +29,58 @@ def sanitize_identifier(identifier: str) -> str:
     base = os.path.basename(identifier)
     sanitized = re.sub(r"[^A-Za-z0-9_]", "_", base)
     return sanitized or "unknown"
+
+
+class RateLimiter:
+    """Space calls at least ``1 / rate`` seconds apart across threads."""
+
+    def __init__(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may issue its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return module *name*, deferring its import until an attribute is used.
+
+    Modules bind heavy dependencies such as ``ee`` this way so commands that
+    never touch them start quickly, while ``module.ee`` stays patchable.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def load_json(path: str | Path | IO[bytes]) -> Any:
+    """Parse the JSON document at ``path``, using ``orjson`` when installed.
+
+    ``path`` may also be an already open binary file object.
+    """
+    if hasattr(path, "read"):
+        raw = path.read()
+    else:
+        with open(path, "rb") as fh:
+            raw = fh.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -3,15 +3,44 @@ Module `geo.aoi` defines the AOI (Area of Interest) class, which holds a single
 geographic feature (Polygon/MultiPolygon), its static properties, and associated time series.
 """
 
-import json
+from __future__ import annotations
+
+import functools
+import logging
 import math
+import os
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import geopandas as gpd
-import ee
 from shapely.geometry import MultiPolygon, Polygon, mapping, shape
 from verdesat.analytics.timeseries import TimeSeries
+from verdesat.core.utils import lazy_import, load_json
+
+ee = lazy_import("ee")
+logger = logging.getLogger(__name__)
+
+
+def _parquet_sibling(path: str, prefer_parquet: bool = False) -> Optional[str]:
+    """Return the GeoParquet file to read for *path*, if any.
+
+    ``.parquet`` paths are returned as-is. With *prefer_parquet*, other paths
+    resolve to their ``.parquet`` sibling when it exists and is not older
+    than *path*.
+    """
+    p = Path(path)
+    if p.suffix.lower() == ".parquet":
+        return path
+    if not prefer_parquet:
+        return None
+    sibling = p.with_suffix(".parquet")
+    try:
+        if os.path.getmtime(sibling) >= os.path.getmtime(p):
+            return str(sibling)
+    except OSError:
+        pass
+    return None
 
 
 @dataclass
@@ -36,15 +65,35 @@ class AOI:
         return cls.from_gdf(gdf, id_col)
 
     @classmethod
-    def from_geojson(cls, geojson: Union[str, dict], id_col: str = "id") -> List["AOI"]:
+    def from_geojson(
+        cls,
+        geojson: Union[str, dict],
+        id_col: str = "id",
+        prefer_parquet: bool = False,
+    ) -> List["AOI"]:
         """
         Parse a GeoJSON object (or path to a GeoJSON file) and return AOI instances.
+
+        ``.parquet`` paths are read as GeoParquet. With ``prefer_parquet``, a
+        GeoJSON path with an up-to-date ``.parquet`` sibling (as written by
+        ``verdesat prepare``) is read from the sibling instead. Parsed files
+        are cached per path and modification time, so repeated loads in one
+        process are cheap.
         """
         if isinstance(geojson, str):
-            with open(geojson, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        else:
-            data = geojson
+            sibling = _parquet_sibling(geojson, prefer_parquet)
+            if sibling is not None and sibling != geojson:
+                logger.info("Reading AOIs from %s instead of %s", sibling, geojson)
+            # Absolute paths so "aoi.geojson" and "./aoi.geojson" share an entry.
+            source = os.path.abspath(sibling or geojson)
+            cached = _load_aois(source, os.path.getmtime(source), id_col)
+            # Hand out fresh AOIs so callers can mutate props/timeseries freely.
+            return [cls(a.geometry, dict(a.static_props)) for a in cached]
+        return cls._from_geojson_data(geojson, id_col)
+
+    @classmethod
+    def _from_geojson_data(cls, data: dict, id_col: str = "id") -> List["AOI"]:
+        """Build AOIs from an in-memory GeoJSON FeatureCollection."""
         features = data.get("features", [])
         gdf = gpd.GeoDataFrame(
             [
@@ -55,6 +104,22 @@ class AOI:
         )
         return cls.from_gdf(gdf, id_col)
 
+    @classmethod
+    def from_parquet(
+        cls,
+        path: str,
+        id_col: str = "id",
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+    ) -> List["AOI"]:
+        """
+        Load AOIs from a GeoParquet file, optionally limited to features
+        intersecting *bbox* (minx, miny, maxx, maxy).
+        """
+        gdf = gpd.read_parquet(path, bbox=bbox)
+        if gdf.crs is not None and gdf.crs.to_epsg() != 4326:
+            gdf = gdf.to_crs(epsg=4326)
+        return cls.from_gdf(gdf, id_col)
+
     @classmethod
     def from_gdf(cls, gdf: gpd.GeoDataFrame, id_col: str = "id") -> List["AOI"]:
         """
@@ -124,3 +189,11 @@ class AOI:
         extent_max = max(abs(width_m), abs(height_m))
 
         return extent_max * (buffer_percent / 100.0)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_aois(path: str, mtime: float, id_col: str) -> Tuple[AOI, ...]:
+    """Parse *path* once per (path, mtime, id_col); see :meth:`AOI.from_geojson`."""
+    if Path(path).suffix.lower() == ".parquet":
+        return tuple(AOI.from_parquet(path, id_col))
+    return tuple(AOI._from_geojson_data(load_json(path), id_col))
@@ -1,7 +1,8 @@
 """Ingestion package with backend factory."""
 
+from importlib import import_module
+
 from .base import BaseDataIngestor
-from .earthengine_ingestor import EarthEngineIngestor
 from .sensorspec import SensorSpec
 
 
@@ -9,8 +10,18 @@ def create_ingestor(backend: str, sensor: SensorSpec, **kwargs) -> BaseDataInges
     """Factory returning an ingestor instance based on backend name."""
     name = backend.lower()
     if name in {"ee", "earthengine"}:
+        from .earthengine_ingestor import EarthEngineIngestor
+
         return EarthEngineIngestor(sensor, **kwargs)
     raise ValueError(f"Unknown ingestor backend '{backend}'")
 
 
+def __getattr__(name):
+    # The Earth Engine backend pulls in the chip exporter and rasterio, so it
+    # is only imported when actually requested.
+    if name == "EarthEngineIngestor":
+        return import_module(".earthengine_ingestor", __name__).EarthEngineIngestor
+    raise AttributeError(name)
+
+
 __all__ = ["BaseDataIngestor", "EarthEngineIngestor", "create_ingestor"]
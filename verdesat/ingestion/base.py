@@ -3,7 +3,7 @@ from __future__ import annotations
 """Abstract base class for data ingestion backends."""
 
 from abc import ABC, abstractmethod
-from typing import Literal, Optional, List
+from typing import Literal, Optional, List, Sequence
 
 import pandas as pd
 
@@ -35,6 +35,29 @@ class BaseDataIngestor(ABC):
     ) -> pd.DataFrame:
         """Download and optionally aggregate an index time series for an AOI."""
 
+    def download_timeseries_batch(
+        self,
+        aois: Sequence[AOI],
+        start_date: str,
+        end_date: str,
+        scale: int,
+        index: str,
+        value_col: str | None = None,
+        chunk_freq: Literal["D", "ME", "YE"] = "YE",
+        freq: Optional[Literal["D", "ME", "YE"]] = None,
+    ) -> List[pd.DataFrame]:
+        """Download time series for several AOIs; one frame per AOI, in order.
+
+        Backends that can serve many AOIs per request override this; the
+        default simply calls :meth:`download_timeseries` for each AOI.
+        """
+        return [
+            self.download_timeseries(
+                aoi, start_date, end_date, scale, index, value_col, chunk_freq, freq
+            )
+            for aoi in aois
+        ]
+
     @abstractmethod
     def download_chips(
         self,
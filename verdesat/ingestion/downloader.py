@@ -4,13 +4,14 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
 import time
 
 import pandas as pd
 import ee
 
 from verdesat.core.logger import Logger
+from verdesat.core.utils import RateLimiter
 from verdesat.geo.aoi import AOI
 from .sensorspec import SensorSpec
 from .eemanager import EarthEngineManager, ee_manager as default_manager
@@ -18,11 +19,21 @@ from ..analytics.ee_masking import mask_collection
 
 
 class BaseDownloader(ABC):
-    """Abstract downloader with chunking and retry logic."""
+    """Abstract downloader with chunking and retry logic.
 
-    def __init__(self, max_retries: int = 3, logger=None) -> None:
+    When a *rate_limiter* is given, every chunk request (including retries)
+    waits on it first.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        logger=None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
         self.max_retries = max_retries
         self.logger = logger or Logger.get_logger(__name__)
+        self.rate_limiter = rate_limiter
 
     @staticmethod
     def build_chunks(start: str, end: str, freq: str) -> List[Tuple[str, str]]:
@@ -49,6 +60,8 @@ class BaseDownloader(ABC):
         results = []
         for s, e in bounds:
             for attempt in range(1, self.max_retries + 1):
+                if self.rate_limiter is not None:
+                    self.rate_limiter.wait()
                 try:
                     result = self.download_chunk(s, e, *args, **kwargs)
                     results.append(result)
@@ -91,7 +104,12 @@ class BaseDownloader(ABC):
 
 
 class EarthEngineDownloader(BaseDownloader):
-    """Downloader that fetches index values from Earth Engine."""
+    """Downloader that fetches index values from Earth Engine.
+
+    ``tile_scale`` is forwarded to ``reduceRegions``; values above 1 split
+    the reduction into smaller tiles so large AOIs stay within EE's per-request
+    memory limit, at the cost of some speed.
+    """
 
     def __init__(
         self,
@@ -99,26 +117,43 @@ class EarthEngineDownloader(BaseDownloader):
         ee_manager: EarthEngineManager = default_manager,
         max_retries: int = 3,
         logger=None,
+        tile_scale: float = 1,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> None:
-        super().__init__(max_retries=max_retries, logger=logger)
+        super().__init__(
+            max_retries=max_retries, logger=logger, rate_limiter=rate_limiter
+        )
         self.sensor = sensor
         self.ee = ee_manager
+        self.tile_scale = tile_scale
 
     def download_chunk(
         self,
         start: str,
         end: str,
-        aoi: AOI,
+        aoi: AOI | Sequence[AOI],
         scale: int,
         index: str,
         value_col: str | None,
     ) -> pd.DataFrame:
+        """Return index means for *aoi* between *start* and *end*.
+
+        A list of AOIs is served by one request: each image is reduced over
+        the AOIs it overlaps, and rows carry an ``_aoi`` column holding the
+        AOI's position in the list.
+        """
         self.ee.initialize()
 
-        geom_geojson = aoi.geometry.__geo_interface__
-        ee_geom = ee.Geometry(geom_geojson)
-        feature = ee.Feature(ee_geom, {"id": aoi.static_props.get("id")})
-        region = ee.FeatureCollection([feature])
+        batched = isinstance(aoi, (list, tuple))
+        aois = list(aoi) if batched else [aoi]
+        features = []
+        for pos, item in enumerate(aois):
+            props = {"id": item.static_props.get("id")}
+            if batched:
+                props["_aoi"] = pos
+            ee_geom = ee.Geometry(item.geometry.__geo_interface__)
+            features.append(ee.Feature(ee_geom, props))
+        region = ee.FeatureCollection(features)
 
         coll = self.ee.get_image_collection(
             self.sensor.collection_id, start, end, region, mask_clouds=False
@@ -127,20 +162,22 @@ class EarthEngineDownloader(BaseDownloader):
 
         def _reduce(img):
             idx_img = self.sensor.compute_index(img, index)
-            stats = idx_img.reduceRegions(region, ee.Reducer.mean(), scale=scale)
+            # Only AOIs under this scene, so spread-out batches don't multiply
+            # the row count by every image in the collection.
+            targets = region.filterBounds(img.geometry()) if batched else region
+            stats = idx_img.reduceRegions(
+                targets, ee.Reducer.mean(), scale=scale, tileScale=self.tile_scale
+            )
             date = ee.Date(img.get("system:time_start")).format("YYYY-MM-dd")
             return stats.map(lambda f: f.set("date", date))
 
         features = coll.map(_reduce).flatten().getInfo().get("features", [])
         col = value_col or f"mean_{index}"
-        rows = [
-            {
-                "id": feat["properties"].get("id"),
-                "date": feat["properties"].get("date"),
-                col: feat["properties"].get("mean"),
-            }
-            for feat in features
-        ]
-        df = pd.DataFrame(rows)
+        columns = ["id", "date", col]
+        if batched:
+            columns.insert(0, "_aoi")
+        keys = ["_aoi", "id", "date", "mean"] if batched else ["id", "date", "mean"]
+        rows = [[feat["properties"].get(k) for k in keys] for feat in features]
+        df = pd.DataFrame(rows, columns=columns)
         df["date"] = pd.to_datetime(df["date"])
         return df
@@ -1,6 +1,6 @@
 """Earth Engine backend for data ingestion."""
 
-from typing import Literal, Optional, List
+from typing import Literal, Optional, List, Sequence
 
 
 import ee
@@ -16,6 +16,7 @@ from .downloader import EarthEngineDownloader
 from ..analytics.ee_masking import mask_collection
 from ..analytics.ee_chipping import export_chips
 from verdesat.core.storage import StorageAdapter
+from verdesat.core.utils import RateLimiter
 from ..visualization._chips_config import ChipsConfig
 
 
@@ -29,12 +30,26 @@ class EarthEngineIngestor(BaseDataIngestor):
         sensor: SensorSpec,
         ee_manager_instance=None,
         logger=None,
+        tile_scale: float = 1,
+        aois_per_request: int = 10,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
-        """Create an ingestor using the given sensor and EE manager."""
+        """Create an ingestor using the given sensor and EE manager.
+
+        *tile_scale* is passed to ``reduceRegions`` for time-series downloads.
+        :meth:`download_timeseries_batch` reduces up to *aois_per_request*
+        AOIs in one Earth Engine request per time chunk. *rate_limiter*, if
+        given, spaces those requests.
+        """
         super().__init__(sensor, logger=logger)
         self.ee = ee_manager_instance or ee_manager
+        self.aois_per_request = max(1, aois_per_request)
         self.downloader = EarthEngineDownloader(
-            sensor=sensor, ee_manager=self.ee, logger=logger
+            sensor=sensor,
+            ee_manager=self.ee,
+            logger=logger,
+            tile_scale=tile_scale,
+            rate_limiter=rate_limiter,
         )
 
     def download_timeseries(
@@ -79,6 +94,60 @@ class EarthEngineIngestor(BaseDataIngestor):
             return aggregated.df
         return raw_df
 
+    def download_timeseries_batch(
+        self,
+        aois: Sequence[AOI],
+        start_date: str,
+        end_date: str,
+        scale: int,
+        index: str,
+        value_col: str | None = None,
+        chunk_freq: Literal["D", "ME", "YE"] = "YE",
+        freq: Optional[Literal["D", "ME", "YE"]] = None,
+    ) -> List[pd.DataFrame]:
+        """Download time series for *aois* with one request per group and chunk.
+
+        AOIs are grouped by ``aois_per_request``; each group is reduced with a
+        single ``reduceRegions`` per image instead of one request per AOI. As
+        in the base class, one frame is returned per AOI, in AOI order and
+        sorted by date.
+        """
+        frames: List[pd.DataFrame] = []
+        step = self.aois_per_request
+        for i in range(0, len(aois), step):
+            group = list(aois[i : i + step])
+            if len(group) == 1:
+                frames.append(
+                    self.download_timeseries(
+                        group[0],
+                        start_date,
+                        end_date,
+                        scale,
+                        index,
+                        value_col,
+                        chunk_freq,
+                        freq,
+                    )
+                )
+                continue
+            raw_df = self.downloader.download_with_chunks(
+                start=start_date,
+                end=end_date,
+                chunk_freq=chunk_freq,
+                aoi=group,
+                scale=scale,
+                index=index,
+                value_col=value_col,
+            )
+            raw_df = raw_df.sort_values(["_aoi", "date"], kind="stable")
+            positions = raw_df.pop("_aoi").to_numpy()
+            for pos in range(len(group)):
+                df = raw_df[positions == pos].reset_index(drop=True)
+                if freq:
+                    df = TimeSeries.from_dataframe(df, index=index).aggregate(freq).df
+                frames.append(df)
+        return frames
+
     def download_chips(
         self,
         aois: List[AOI],
@@ -86,7 +155,7 @@ class EarthEngineIngestor(BaseDataIngestor):
         storage: StorageAdapter | None = None,
     ) -> None:
         """Export chips for the supplied AOIs using the given configuration."""
-        self.ee.initialize()
+        self.ee.initialize(high_volume=config.high_volume)
         export_chips(
             aois=aois,
             config=config,
@@ -3,51 +3,91 @@ Module `ingestion.eemanager` provides the EarthEngineManager class to
 encapsulate Google Earth Engine initialization, retries, and image collection retrieval.
 """
 
+from __future__ import annotations
+
 import os
 import json
 import tempfile
+import threading
 import time
-from typing import Optional, Any
+from typing import Any, ClassVar, Optional
 
 from verdesat.core.logger import Logger
+from verdesat.core.utils import lazy_import
 from google.oauth2.credentials import Credentials
 
-import ee
-from ee import EEException
 from .sensorspec import SensorSpec
 
+ee = lazy_import("ee")
+
 
 class EarthEngineManager:
     """
     Manages interaction with Google Earth Engine: initialization, retries, and collection retrieval.
     """
 
+    #: Endpoint designed for many concurrent, automated requests.
+    HIGH_VOLUME_URL = "https://earthengine-highvolume.googleapis.com"
+
+    # ee.Initialize configures the whole process, so the settings of the last
+    # successful call are shared by every manager; see ``initialize``.
+    _session: ClassVar[Optional[tuple]] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         credential_path: Optional[str] = None,
         project: Optional[str] = None,
         logger=None,
+        high_volume: bool = False,
     ):
         self.credential_path = credential_path
         # Allow non-interactive auth using a refresh token passed via env.
         self.token_env = os.getenv("EARTHENGINE_TOKEN")
         self.project = project or os.getenv("VERDESAT_EE_PROJECT")
         self.logger = logger or Logger.get_logger(__name__)
+        self.high_volume = high_volume
 
-    def initialize(self) -> None:
+    def initialize(
+        self, high_volume: Optional[bool] = None, force: bool = False
+    ) -> None:
         """
         Authenticate & initialize Earth Engine.
         If a service‑account JSON path is given, use it; otherwise prompt.
         Supports inline service-account JSON via EARTHENGINE_TOKEN environment variable.
+        When *high_volume* (or ``self.high_volume``) is set, requests are sent
+        to the high-volume endpoint.
+
+        Calls with the credentials and project of the last initialization in
+        this process (by any manager) reuse that session; pass *force* to
+        re-initialize regardless. The endpoint is not part of that check: a
+        high-volume session serves standard callers too, so switching to it
+        re-initializes once and never back. Initialize before starting
+        worker threads so they only ever hit the cached session.
         """
-        project = self.project
+        key = (self.credential_path, self.token_env, self.project)
+        with self._lock:
+            session = EarthEngineManager._session
+            same = session is not None and session[0] == key
+            use_hv = bool(self.high_volume if high_volume is None else high_volume)
+            if not force and same and (session[1] or not use_hv):
+                return
+            use_hv = use_hv or (same and session[1])
+            opts: dict[str, Any] = {"project": self.project}
+            if use_hv:
+                opts["opt_url"] = self.HIGH_VOLUME_URL
+            self._connect(opts)
+            EarthEngineManager._session = (key, use_hv)
+
+    def _connect(self, opts: dict[str, Any]) -> None:
+        """Run ``ee.Initialize`` with the configured credentials and *opts*."""
         try:
             if self.credential_path:
                 # type: ignore[arg-type]
                 sa_credentials: Any = ee.ServiceAccountCredentials(
                     None, self.credential_path  # type: ignore[arg-type]
                 )
-                ee.Initialize(sa_credentials, project=project)
+                ee.Initialize(sa_credentials, **opts)
             elif self.token_env:
                 creds_data: Optional[dict[str, Any]] = None
                 if os.path.exists(self.token_env):
@@ -71,7 +111,7 @@ class EarthEngineManager:
                         scopes=creds_data.get("scopes", ee.oauth.SCOPES),
                         quota_project_id=creds_data.get("project"),
                     )
-                    ee.Initialize(token_credentials, project=project)
+                    ee.Initialize(token_credentials, **opts)
 
                 elif (
                     creds_data is not None
@@ -87,7 +127,7 @@ class EarthEngineManager:
                         creds_data.get("client_email"), temp_path  # type: ignore[arg-type]
                     )
                     try:
-                        ee.Initialize(sa_inline_credentials, project=project)
+                        ee.Initialize(sa_inline_credentials, **opts)
                     finally:
                         os.remove(temp_path)
                         self.logger.debug(
@@ -95,12 +135,12 @@ class EarthEngineManager:
                         )
                     return
                 else:
-                    ee.Initialize(project=project)
+                    ee.Initialize(**opts)
             else:
-                ee.Initialize(project=project)
-        except EEException:
+                ee.Initialize(**opts)
+        except ee.EEException:
             ee.Authenticate()
-            ee.Initialize(project=project)
+            ee.Initialize(**opts)
 
     def safe_get_info(self, obj, max_retries: int = 3):
         """
@@ -112,7 +152,7 @@ class EarthEngineManager:
         for attempt in range(1, max_retries + 1):
             try:
                 return obj.getInfo()
-            except EEException as e:
+            except ee.EEException as e:
                 msg = str(e)
                 # Permission issue: ask user to re-auth
                 if "PERMISSION_DENIED" in msg:
@@ -120,7 +160,7 @@ class EarthEngineManager:
                         "Earth Engine permission denied. Re-authenticating..."
                     )
                     ee.Authenticate()  # opens browser/window once
-                    self.initialize()  # re-init via our wrapper with credentials/project
+                    self.initialize(force=True)  # re-init with credentials/project
                     # only retry once after auth
                     if attempt == 1:
                         continue
@@ -3,9 +3,14 @@ Module `ingestion.indices` provides generic spectral index computation
 by loading formulas from `resources/index_formulas.json`.
 """
 
+from __future__ import annotations
+
 import json
 from pathlib import Path
-from ee import Image
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ee import Image
 
 # Load index formulas from resources
 _FORMULA_PATH = (
@@ -19,6 +24,9 @@ def compute_index(img: Image, index: str) -> Image:
     """
     Compute a named spectral index on the given EE Image using the JSON formula.
 
+    Formulas listing a ``normalized_difference`` band pair use EE's native
+    ``normalizedDifference`` instead of evaluating the expression string.
+
     Args:
         img: ee.Image with bands already renamed to standard aliases (lowercase).
         index: one of the keys in INDEX_REGISTRY (case-insensitive).
@@ -32,6 +40,9 @@ def compute_index(img: Image, index: str) -> Image:
             f"Index '{index}' not supported. Choose from: {list(INDEX_REGISTRY)}"
         )
     formula = INDEX_REGISTRY[key]
+    pair = formula.get("normalized_difference")
+    if pair:
+        return img.normalizedDifference(list(pair)).rename(key)
     expr = formula["expr"]
     bands = formula["bands"]
     params = formula.get("params", {})
@@ -4,12 +4,17 @@ sensor metadata (band mappings, resolutions, and mask strategies) and provides
 cloud masking and spectral index computation.
 """
 
+from __future__ import annotations
+
+import functools
 import json
 from pathlib import Path
-from typing import Optional
-import ee
+from typing import TYPE_CHECKING, Optional
 from .indices import compute_index
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import ee
+
 
 class SensorSpec:
     """
@@ -84,18 +89,33 @@ class SensorSpec:
     def from_collection_id(cls, collection_id: str) -> "SensorSpec":
         """
         Factory method: create a SensorSpec from a collection ID by reading the registry.
+        Lookups are cached per collection ID; each call still returns a fresh
+        instance with its own band map and exclusion lists.
         """
-        registry = cls._load_registry()
-        spec = registry.get(collection_id)
-        if spec is None:
-            raise ValueError(
-                f"Collection ID '{collection_id}' not found in sensor_specs.json"
-            )
+        spec = _cached_spec(collection_id)
         return cls(
             collection_id=collection_id,
-            bands=spec["bands"],
-            native_resolution=spec["native_resolution"],
-            cloud_mask_method=spec["cloud_mask_method"],
-            fmask_exclude=spec.get("fmask_exclude"),
-            scl_exclude=spec.get("scl_exclude"),
+            bands=dict(spec.bands),
+            native_resolution=spec.native_resolution,
+            cloud_mask_method=spec.cloud_mask_method,
+            fmask_exclude=list(spec.fmask_exclude),
+            scl_exclude=list(spec.scl_exclude),
+        )
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_spec(collection_id: str) -> SensorSpec:
+    """Build the registry entry for *collection_id* once; never handed out."""
+    spec = SensorSpec._load_registry().get(collection_id)
+    if spec is None:
+        raise ValueError(
+            f"Collection ID '{collection_id}' not found in sensor_specs.json"
         )
+    return SensorSpec(
+        collection_id=collection_id,
+        bands=spec["bands"],
+        native_resolution=spec["native_resolution"],
+        cloud_mask_method=spec["cloud_mask_method"],
+        fmask_exclude=spec.get("fmask_exclude"),
+        scl_exclude=spec.get("scl_exclude"),
+    )
@@ -6,10 +6,20 @@ which processes a directory of vector files into a cleaned GeoDataFrame.
 import os
 import zipfile
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 import geopandas as gpd
-from shapely import wkb
+
+try:  # pragma: no cover - optional dependency
+    import pyogrio
+except ImportError:  # pragma: no cover - optional dependency
+    pyogrio = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency
+    import pyarrow
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None  # type: ignore[assignment]
 
 from verdesat.core.config import ConfigManager
 from verdesat.core.logger import Logger
@@ -56,6 +66,13 @@ class VectorPreprocessor:
                     paths.append(os.path.join(root, fname))
         return paths
 
+    @staticmethod
+    def _read_kwargs() -> dict:
+        """Return ``read_file`` options, using pyogrio's Arrow reader when available."""
+        if pyogrio is None:
+            return {}
+        return {"engine": "pyogrio", "use_arrow": pyarrow is not None}
+
     def _read_file(self, filepath: str) -> gpd.GeoDataFrame:
         """Read a single file, handling KMZ/KML if needed."""
         if filepath.lower().endswith(".kmz"):
@@ -76,7 +93,11 @@ class VectorPreprocessor:
                                 tmp.flush()
                                 temp_paths.append(tmp.name)
                         # Read after the temp file handle is closed
-                        gdfs.append(gpd.read_file(temp_paths[-1], driver="KML"))
+                        gdfs.append(
+                            gpd.read_file(
+                                temp_paths[-1], driver="KML", **self._read_kwargs()
+                            )
+                        )
                 finally:
                     # Ensure all temp files are removed even if read fails
                     for p in temp_paths:
@@ -86,7 +107,20 @@ class VectorPreprocessor:
                             pass
             return gpd.GeoDataFrame(pd.concat(gdfs, ignore_index=True))
         else:
-            return gpd.read_file(filepath)
+            return gpd.read_file(filepath, **self._read_kwargs())
+
+    def _load_one(self, fp: str) -> gpd.GeoDataFrame | None:
+        """Read and reproject *fp*, returning ``None`` when it cannot be loaded."""
+        try:
+            gdf = self._read_file(fp)
+            if gdf.crs is None:
+                self.logger.warning("No CRS on %s, assuming %s", fp, self.target_crs)
+                gdf = gdf.set_crs(self.target_crs)
+            return gdf.to_crs(self.target_crs)
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            self.logger.warning("Skipping file %s: %s", fp, e)
+            return None
 
     def load_and_reproject(self) -> None:
         """Read all files and reproject to target CRS."""
@@ -95,20 +129,10 @@ class VectorPreprocessor:
             raise RuntimeError(f"No supported vector files found in {self.input_dir}")
         self.logger.info("Loading vector files: %s", files)
 
-        gdfs = []
-        for fp in files:
-            try:
-                gdf = self._read_file(fp)
-                if gdf.crs is None:
-                    self.logger.warning(
-                        "No CRS on %s, assuming %s", fp, self.target_crs
-                    )
-                    gdf = gdf.set_crs(self.target_crs)
-                gdf = gdf.to_crs(self.target_crs)
-                gdfs.append(gdf)
-            # pylint: disable=broad-exception-caught
-            except Exception as e:
-                self.logger.warning("Skipping file %s: %s", fp, e)
+        # GDAL releases the GIL while reading, so files load concurrently.
+        workers = min(len(files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            gdfs = [g for g in pool.map(self._load_one, files) if g is not None]
 
         if not gdfs:
             raise RuntimeError("All vector files failed to load or no valid geometries")
@@ -168,9 +192,7 @@ class VectorPreprocessor:
         """Drop the Z dimension from geometries."""
         if self.gdf is None:
             return
-        self.gdf["geometry"] = self.gdf["geometry"].apply(
-            lambda geom: wkb.loads(wkb.dumps(geom, output_dimension=2))
-        )
+        self.gdf["geometry"] = self.gdf.geometry.force_2d()
 
     def run(self) -> gpd.GeoDataFrame:
         """Execute the full preprocessing pipeline and return a GeoDataFrame."""
@@ -8,6 +8,7 @@ import pandas as pd
 
 from verdesat.core.logger import Logger
 from verdesat.core.storage import LocalFS, StorageAdapter
+from verdesat.core.tabular import write_table
 from verdesat.geo.aoi import AOI
 from verdesat.biodiv.metrics import MetricEngine
 from verdesat.biodiv.bscore import BScoreCalculator, WeightsConfig
@@ -88,5 +89,5 @@ def compute_bscores(
     df = pd.DataFrame.from_records(records)
     if output:
         log.info("Writing results to %s", output)
-        df.to_csv(output, index=False)
+        write_table(df, output)
     return df
@@ -5,8 +5,6 @@ from __future__ import annotations
 from typing import Dict
 import logging
 
-import ee
-from ee import ee_exception
 import requests
 
 from verdesat.services.raster_utils import convert_to_cog
@@ -14,9 +12,11 @@ from verdesat.services.raster_utils import convert_to_cog
 from verdesat.geo.aoi import AOI
 from verdesat.ingestion.eemanager import EarthEngineManager, ee_manager
 from verdesat.core.storage import LocalFS, StorageAdapter
-from verdesat.core.utils import sanitize_identifier
+from verdesat.core.utils import lazy_import, sanitize_identifier
 from .base import BaseService
 
+ee = lazy_import("ee")
+
 
 class LandcoverService(BaseService):
     """Retrieve annual land-cover rasters from Earth Engine."""
@@ -113,7 +113,7 @@ class LandcoverService(BaseService):
             url = img.getDownloadURL(
                 {"scale": scale, "region": region, "format": "GEOTIFF"}
             )
-        except ee_exception.EEException as err:
+        except ee.ee_exception.EEException as err:
             if (
                 dataset.startswith(self.ESRI_COLLECTION)
                 and "not found" in str(err).lower()
@@ -10,6 +10,7 @@ from shapely.geometry import mapping
 import shapely.geometry
 
 from verdesat.core.storage import LocalFS, StorageAdapter
+from verdesat.core.tabular import write_table
 from verdesat.services.base import BaseService
 from verdesat.core.logger import Logger
 from verdesat.geo.aoi import AOI
@@ -130,5 +131,5 @@ def compute_msa_means(
     df = pd.DataFrame.from_records(records)
     if output:
         log.info("Writing results to %s", output)
-        df.to_csv(output, index=False)
+        write_table(df, output)
     return df
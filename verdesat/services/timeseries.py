@@ -2,17 +2,31 @@ from __future__ import annotations
 
 """Service functions for time-series operations."""
 
-from typing import List, Optional, Literal
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Literal, Sequence
 
 import pandas as pd
 
 import logging
 from verdesat.core.logger import Logger
 from verdesat.core.config import ConfigManager
+from verdesat.core.tabular import TableWriter
 from verdesat.geo.aoi import AOI
 from verdesat.ingestion.sensorspec import SensorSpec
 from verdesat.ingestion import create_ingestor
-from verdesat.ingestion.eemanager import ee_manager
+from verdesat.ingestion.eemanager import EarthEngineManager, ee_manager
+
+
+def _resolve_workers(n_jobs: int) -> int:
+    """Translate a joblib-style ``n_jobs`` (``-1`` = all cores) to a count."""
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, n_jobs)
+
+
+def _chunked(items: Sequence[AOI], size: int) -> List[Sequence[AOI]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
 
 
 def download_timeseries(
@@ -28,42 +42,89 @@ def download_timeseries(
     output: str | None = None,
     backend: str = "ee",
     logger: logging.Logger | None = None,
-) -> pd.DataFrame:
+    n_jobs: int = 1,
+    aois_per_request: int = 10,
+    high_volume: bool = False,
+    tile_scale: float = 1,
+    return_df: bool = True,
+    ee_manager_instance: EarthEngineManager | None = None,
+    prefer_parquet: bool = False,
+) -> pd.DataFrame | None:
     """Download spectral index time series for polygons in *geojson*.
 
     Parameters largely mirror the ``verdesat`` CLI ``download timeseries``
     command. When *output* is provided the resulting DataFrame is written to
-    CSV. The concatenated DataFrame is always returned.
+    it (Parquet for ``.parquet`` paths, CSV otherwise). The concatenated
+    DataFrame is always returned.
+
+    AOIs are split into groups of *aois_per_request*, each fetched with one
+    request per time chunk, and the groups are downloaded by *n_jobs* worker
+    threads (``-1`` uses all cores, ``1`` runs sequentially).
+    Set *high_volume* to send Earth Engine requests to the high-volume
+    endpoint, which suits many concurrent automated calls; the session is
+    opened before any worker starts. *ee_manager_instance* defaults to the
+    shared :data:`~verdesat.ingestion.eemanager.ee_manager`. *tile_scale* is
+    passed to Earth Engine's ``reduceRegions``; raise it (e.g. to 4) when
+    large AOIs fail with "User memory limit exceeded". *prefer_parquet* is
+    forwarded to :meth:`AOI.from_geojson`.
+
+    With ``return_df=False`` and an *output* path, each chunk is appended to
+    *output* as soon as it is downloaded and nothing is kept in memory; the
+    function then returns ``None``.
     """
 
     log = logger or Logger.get_logger(__name__)
     log.info("Loading AOIs from %s", geojson)
 
-    aois = AOI.from_geojson(geojson, id_col="id")
+    aois = AOI.from_geojson(geojson, id_col="id", prefer_parquet=prefer_parquet)
     sensor = SensorSpec.from_collection_id(collection)
+    manager = ee_manager_instance or ee_manager
+    if high_volume and backend == "ee":
+        manager.initialize(high_volume=True)
     ingestor = create_ingestor(
-        backend, sensor, ee_manager_instance=ee_manager, logger=log
+        backend,
+        sensor,
+        ee_manager_instance=manager,
+        logger=log,
+        tile_scale=tile_scale,
+        aois_per_request=aois_per_request,
     )
 
     value_column = value_col or ConfigManager.VALUE_COL_TEMPLATE.format(index=index)
-    df_list: List[pd.DataFrame] = []
 
-    for aoi in aois:
-        df = ingestor.download_timeseries(
-            aoi,
-            start,
-            end,
-            scale,
-            index,
-            value_column,
-            chunk_freq,
-            agg,
+    def _process_chunk(chunk: Sequence[AOI]) -> List[pd.DataFrame]:
+        return ingestor.download_timeseries_batch(
+            chunk, start, end, scale, index, value_column, chunk_freq, agg
         )
-        df_list.append(df)
-
-    result = pd.concat(df_list, ignore_index=True)
 
-    if output:
+    workers = _resolve_workers(n_jobs)
+    # One task per request group keeps the batching the ingestor relies on.
+    chunks = _chunked(aois, max(1, aois_per_request))
+    df_list: List[pd.DataFrame] = []
+    writer = TableWriter(output) if output else None
+    if writer is not None:
         log.info("Writing results to %s", output)
-        result.to_csv(output, index=False)
-    return result
+
+    def _collect(dfs: List[pd.DataFrame]) -> None:
+        if writer is not None:
+            for df in dfs:
+                writer.write(df)
+        if return_df:
+            df_list.extend(dfs)
+
+    try:
+        if workers == 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                _collect(_process_chunk(chunk))
+        else:
+            log.info("Downloading %d AOIs with %d workers", len(aois), workers)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for dfs in pool.map(_process_chunk, chunks):
+                    _collect(dfs)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if not return_df:
+        return None
+    return pd.concat(df_list, ignore_index=True)
@@ -3,10 +3,14 @@ Module `visualization._chips_config` defines `ChipsConfig`, a container for CLI
 needed to generate per-AOI image chips.
 """
 
+import re
 from dataclasses import dataclass, field
 from typing import Optional, Sequence, Tuple
 
 from verdesat.core.config import ConfigManager
+from verdesat.core.utils import RateLimiter
+
+_PALETTE_SPLIT_RE = re.compile(r"\s*,\s*")
 
 
 @dataclass
@@ -30,9 +34,16 @@ class ChipsConfig:
     fmt: str = "png"
     out_dir: str = "chips"
     mask_clouds: bool = True
+    high_volume: bool = False
+    workers: int = 1
+    #: Optional limiter every per-chip export waits on (shared across runs).
+    rate_limiter: Optional[RateLimiter] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        self.palette = tuple(self.palette) if self.palette is not None else None
+        if self.palette is not None:
+            # Resolve colour names to hex once rather than per rendered chip.
+            hex_map = ConfigManager.PALETTE_HEX
+            self.palette = tuple(hex_map.get(c.lower(), c) for c in self.palette)
         self.fmt = self.fmt.lower()
 
     @classmethod
@@ -55,16 +66,17 @@ class ChipsConfig:
         fmt: str,
         out_dir: str,
         mask_clouds: bool,
+        high_volume: bool = False,
+        workers: int = 1,
     ):
         """
         Helper to parse palette_arg into a list of colors and then forward to init.
         """
         palette = None
         if palette_arg:
-            if palette_arg in ConfigManager.PRESET_PALETTES:
-                palette = ConfigManager.PRESET_PALETTES[palette_arg]
-            else:
-                palette = tuple(c.strip() for c in palette_arg.split(",") if c.strip())
+            palette = ConfigManager.PRESET_PALETTES.get(palette_arg) or tuple(
+                filter(None, _PALETTE_SPLIT_RE.split(palette_arg.strip()))
+            )
 
         return cls(
             collection_id=collection,
@@ -84,4 +96,6 @@ class ChipsConfig:
             fmt=fmt,
             out_dir=out_dir,
             mask_clouds=mask_clouds,
+            high_volume=high_volume,
+            workers=workers,
         )
@@ -1,6 +1,9 @@
 """Module implementing ChipExporter and ChipService for exporting image chips via GEE."""
 
-from typing import Any, Dict, List, Optional, Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 import ee
 import requests
@@ -26,6 +29,11 @@ class ChipExporter:
     converting them to COG).
     """
 
+    #: Retries after an HTTP 429 response before giving up.
+    MAX_RETRIES = 4
+    #: Initial backoff in seconds; doubled after each rate-limited attempt.
+    BACKOFF_SECONDS = 1.0
+
     def __init__(
         self,
         ee_manager: EarthEngineManager,
@@ -45,18 +53,56 @@ class ChipExporter:
         self.storage = storage or LocalFS()
         self.logger = logger or Logger.get_logger(__name__)
 
+    @staticmethod
+    def _bbox(info: Dict[str, Any]) -> List[float]:
+        """Return ``[xmin, ymin, xmax, ymax]`` of a GeoJSON polygon ``info``."""
+        coords = info.get("coordinates", [[]])[0]
+        xs = [pt[0] for pt in coords]
+        ys = [pt[1] for pt in coords]
+        return [min(xs), min(ys), max(xs), max(ys)]
+
+    def region_bboxes(
+        self, aois: List[AOI], buffer_m: float
+    ) -> List[Optional[List[float]]]:
+        """Return the buffered bounding box of every AOI using one ``getInfo``.
+
+        Entries are ``None`` where a box could not be computed; ``export_one``
+        then falls back to resolving that AOI on its own.
+        """
+        bounds = []
+        for aoi in aois:
+            try:
+                bounds.append(aoi.buffered_ee_geometry(buffer_m).bounds())
+            except (EEException, ValueError):
+                bounds.append(None)
+        valid = [b for b in bounds if b is not None]
+        try:
+            infos = iter(self.ee_manager.safe_get_info(ee.List(valid)) or [])
+        except EEException as ee_err:
+            self.logger.warning("Batched bbox lookup failed: %s", ee_err)
+            return [None] * len(aois)
+        out: List[Optional[List[float]]] = []
+        for b in bounds:
+            info = next(infos, None) if b is not None else None
+            try:
+                out.append(self._bbox(info) if info else None)
+            except (KeyError, ValueError):
+                out.append(None)
+        return out
+
     def _build_viz_params(
         self,
         bands: List[str],
         min_val: Union[float, List[float]],
         max_val: Union[float, List[float]],
         scale: int,
-        palette: Optional[tuple[str, ...]],
+        palette: Optional[str | Sequence[str]],
         gamma: Optional[float],
     ) -> Dict[str, Any]:
         """
         Construct the Earth Engine visualization parameters dict for a single image.
         Matches the original `build_viz_params` logic: fixed dimensions for PNG.
+        *palette* may be a list of colours or an already joined ``"c1,c2"`` string.
         """
         params: Dict[str, Any] = {
             "bands": bands,
@@ -73,7 +119,9 @@ class ChipExporter:
             params.pop("scale", None)
             params["dimensions"] = 512
             if palette is not None and len(bands) == 1 and gamma is None:
-                params["palette"] = palette
+                params["palette"] = (
+                    palette if isinstance(palette, str) else ",".join(palette)
+                )
             elif palette is not None and len(bands) > 1:
                 self.logger.warning("Palette ignored when visualizing multiple bands")
             elif palette is not None and gamma is not None:
@@ -86,6 +134,21 @@ class ChipExporter:
 
         return params
 
+    def _download(self, url: str) -> bytes:
+        """Fetch *url*, backing off exponentially while Earth Engine returns 429."""
+        delay = self.BACKOFF_SECONDS
+        for attempt in range(self.MAX_RETRIES + 1):
+            resp = requests.get(url, timeout=60)
+            if resp.status_code != 429 or attempt == self.MAX_RETRIES:
+                break
+            self.logger.warning(
+                "Rate limited by Earth Engine; retrying in %.1fs", delay
+            )
+            time.sleep(delay)
+            delay *= 2
+        resp.raise_for_status()
+        return resp.content
+
     def export_one(
         self,
         img: ee.Image,
@@ -93,15 +156,19 @@ class ChipExporter:
         date_str: str,
         com_type: str,
         bands: List[str],
-        palette: Optional[tuple[str, ...] | None],
+        palette: Optional[str | Sequence[str]],
         scale: int,
         buffer_m: float,
         gamma: Optional[float],
         min_val: Union[float, List[float]],
         max_val: Union[float, List[float]],
+        region_bbox: Optional[List[float]] = None,
     ) -> str | None:
         """Export a single composite for one AOI and return the output URI.
 
+        Pass *region_bbox* (see :meth:`region_bboxes`) to skip the per-call
+        ``getInfo`` round-trip for the AOI's bounding box.
+
         Steps:
           1) Clip the image by feature geometry + buffer
           2) Compute bounding box for ``region``
@@ -129,11 +196,10 @@ class ChipExporter:
         clipped = img.clip(geom)
 
         try:
-            bbox_info = self.ee_manager.safe_get_info(geom.bounds()) or {}
-            coords = bbox_info.get("coordinates", [[]])[0]
-            xs = [pt[0] for pt in coords]
-            ys = [pt[1] for pt in coords]
-            region_bbox = [min(xs), min(ys), max(xs), max(ys)]
+            if region_bbox is None:
+                region_bbox = self._bbox(
+                    self.ee_manager.safe_get_info(geom.bounds()) or {}
+                )
         except EEException as ee_err:
             self.logger.warning("Could not compute bbox for AOI %s: %s", pid, ee_err)
             return None
@@ -171,9 +237,7 @@ class ChipExporter:
         )
 
         try:
-            resp = requests.get(url, timeout=60)
-            resp.raise_for_status()
-            self.storage.write_bytes(out_path, resp.content)
+            self.storage.write_bytes(out_path, self._download(url))
             self.logger.info("✔ Wrote %s file: %s", ext, out_path)
         except requests.RequestException as dl_err:
             self.logger.error(
@@ -208,6 +272,9 @@ class ChipService:
       3) (Optional) map compute_index(based on index_formulas.json)
       4) Build composites via AnalyticsEngine
       5) For each composite & each feature, call ChipExporter.export_one()
+
+    With ``ChipsConfig.workers`` > 1 the per-feature exports run concurrently;
+    pair it with ``ChipsConfig.high_volume`` for large batches.
     """
 
     def __init__(
@@ -307,40 +374,66 @@ class ChipService:
             storage=self.storage,
         )
 
-        raw_count = self.ee_manager.safe_get_info(composites.size())
-        total_count = int(raw_count or 0)
+        # One round-trip for every composite date (and hence the count) and
+        # one for every AOI bounding box, instead of one per composite/AOI.
+        times = self.ee_manager.safe_get_info(
+            composites.aggregate_array("system:time_start")
+        )
+        total_count = len(times or [])
         if total_count <= 0:
             raise RuntimeError("No composites generated (empty EE collection)")
 
         image_list = composites.toList(total_count)
-        for i in range(total_count):
+        palette = ",".join(config.palette) if config.palette else None
+        bboxes = exporter.region_bboxes(aois, config.buffer)
+        jobs: List[tuple[ee.Image, AOI, str, Optional[List[float]]]] = []
+        for i, millis in enumerate(times):
+            if millis is None:
+                self.logger.error(
+                    "Skipping composite %d: it has no system:time_start", i
+                )
+                continue
+            img = ee.Image(image_list.get(i))
+            date_str = datetime.fromtimestamp(millis / 1000, tz=timezone.utc).strftime(
+                "%Y-%m-%d"
+            )
+            jobs.extend((img, aoi, date_str, bbox) for aoi, bbox in zip(aois, bboxes))
+
+        def _export(
+            job: tuple[ee.Image, AOI, str, Optional[List[float]]],
+        ) -> str | None:
+            img, aoi, date_str, bbox = job
+            if config.rate_limiter is not None:
+                config.rate_limiter.wait()
             try:
-                img = ee.Image(image_list.get(i))
-                date_obj = ee.Date(img.get("system:time_start")).format("YYYY-MM-dd")
-                date_str = self.ee_manager.safe_get_info(date_obj)
-
-                for aoi in aois:
-                    buffer_m = config.buffer
-                    exporter.export_one(  # noqa: E501
-                        img=img,
-                        aoi=aoi,
-                        date_str=date_str,
-                        com_type=com_type,
-                        bands=bands,
-                        palette=config.palette,
-                        scale=config.scale,
-                        buffer_m=buffer_m,
-                        gamma=config.gamma,
-                        min_val=min_val,
-                        max_val=max_val,
-                    )
+                return exporter.export_one(
+                    img=img,
+                    aoi=aoi,
+                    date_str=date_str,
+                    com_type=com_type,
+                    bands=bands,
+                    palette=palette,
+                    scale=config.scale,
+                    buffer_m=config.buffer,
+                    gamma=config.gamma,
+                    min_val=min_val,
+                    max_val=max_val,
+                    region_bbox=bbox,
+                )
             except EEException as ee_err:
                 self.logger.error(
-                    "Failed exporting composite #%d due to EE error: %s",
-                    i,
+                    "Failed exporting composite %s due to EE error: %s",
+                    date_str,
                     ee_err,
                     exc_info=True,
                 )
-                continue
+                return None
+
+        if config.workers > 1:
+            with ThreadPoolExecutor(max_workers=config.workers) as pool:
+                list(pool.map(_export, jobs))
+        else:
+            for job in jobs:
+                _export(job)
 
         self.logger.info("Finished exporting all chips to %s", config.out_dir)
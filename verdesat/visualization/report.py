@@ -1,4 +1,3 @@
-import json
 import os
 import re
 from pathlib import Path
@@ -25,9 +24,7 @@ def build_report(
 
     html_dir = Path(output_path).parent
 
-    # 1. Load data
-    with open(geojson_path) as f:
-        gj = json.load(f)
+    # 1. Run metadata (the AOI GeoJSON itself is not needed for rendering)
     run_date = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
     # 2. compute summary stats
     stats_table = compute_summary_stats(
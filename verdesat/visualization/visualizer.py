@@ -1,26 +1,85 @@
 from __future__ import annotations
 
+import functools
 import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Optional, Tuple, Union
 
 import imageio.v2 as imageio
 import matplotlib.pyplot as plt
 import pandas as pd
+from matplotlib.figure import Figure
 import plotly.express as px
 from jinja2 import Environment, FileSystemLoader
 from PIL import Image, ImageDraw, ImageFont
-from statsmodels.tsa.seasonal import DecomposeResult
 from verdesat.core.config import ConfigManager
 from verdesat.core.logger import Logger
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from statsmodels.tsa.seasonal import DecomposeResult
+
+
+def _write_site_gif(job: Tuple[List[Path], Path, float, int]) -> Path:
+    """Stamp each frame with its date and write one site's GIF; returns its path."""
+
+    paths, out_path, duration, loop = job
+    default_font = ImageFont.load_default()
+    ascent, descent = default_font.getmetrics()  # type: ignore[union-attr]
+    try:
+        font: ImageFont.FreeTypeFont | ImageFont.ImageFont = ImageFont.truetype(
+            "arial.ttf", (ascent + descent) * 2
+        )
+    except Exception:
+        font = default_font
+
+    frames: List[Image.Image] = []
+    for p in paths:
+        im = Image.fromarray(imageio.imread(str(p)))
+        draw = ImageDraw.Draw(im)
+        date_text = p.stem.split("_")[-1]
+        bbox = draw.textbbox((0, 0), date_text, font=font)
+        text_width, text_height = bbox[2] - bbox[0], bbox[3] - bbox[1]
+        draw.rectangle([3, 5, 45 + text_width, 20 + text_height], fill="black")
+        draw.text((5, 5), date_text, fill="white", font_size=18)
+        # Quantize once here so the GIF writer does not convert again.
+        if im.mode == "RGB":
+            im = im.convert("P", palette=Image.Palette.ADAPTIVE)
+        frames.append(im)
+
+    if frames:
+        frames[0].save(
+            str(out_path),
+            format="GIF",
+            save_all=True,
+            append_images=frames[1:],
+            duration=int(duration * 1000),
+            loop=loop,
+            optimize=False,
+        )
+    return out_path
+
+
+@functools.lru_cache(maxsize=8)
+def _jinja_env(template_dir: str) -> Environment:
+    """Return a Jinja environment for *template_dir*, reused across calls."""
+
+    return Environment(loader=FileSystemLoader(template_dir), autoescape=True)
+
 
 class Visualizer:
     """Utility class for all visualization helpers."""
 
+    # Above this many points HTML plots switch to WebGL and are decimated.
+    WEBGL_THRESHOLD: ClassVar[int] = 50_000
+
     def __init__(self, logger=None) -> None:
         self.logger = logger or Logger.get_logger(__name__)
+        # One decomposition figure per thread: a shared visualizer may be
+        # drawn from pipeline stages or web requests concurrently.
+        self._local = threading.local()
 
     # ------------------------------------------------------------------
     # Time-series plotting
@@ -32,7 +91,11 @@ class Visualizer:
         output_path: str,
         agg_freq: Optional[str] = None,
     ) -> None:
-        """Create an interactive HTML time-series plot."""
+        """Create an interactive HTML time-series plot.
+
+        Large inputs are rendered with WebGL (``scattergl``) and reduced to
+        per-bucket minima/maxima so the page stays responsive.
+        """
 
         if agg_freq and agg_freq != "D":
             df = (
@@ -43,6 +106,10 @@ class Visualizer:
                 .reset_index()
             )
 
+        large = len(df) > self.WEBGL_THRESHOLD
+        if large:
+            df = self._decimate(df, index_col, self.WEBGL_THRESHOLD)
+
         fig = px.line(
             df,
             x="date",
@@ -50,12 +117,27 @@ class Visualizer:
             color="id",
             title=f"Interactive {index_col.capitalize()} Time Series",
             labels={index_col: index_col, "date": "Date", "id": "Polygon ID"},
-            markers=True,
+            markers=not large,
+            render_mode="webgl" if large else "auto",
         )
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         fig.write_html(output_path, include_plotlyjs="cdn")
 
+    @staticmethod
+    def _decimate(df: pd.DataFrame, index_col: str, max_points: int) -> pd.DataFrame:
+        """Keep each bucket's min and max per polygon, about *max_points* rows total."""
+
+        df = df.sort_values(["id", "date"], kind="stable").reset_index(drop=True)
+        per_id = max(2, max_points // max(df["id"].nunique(), 1))
+        pos = df.groupby("id").cumcount()
+        size = df.groupby("id")["id"].transform("size")
+        bucket = pos * (per_id // 2) // size
+        values = df[index_col].fillna(df[index_col].mean())
+        grouped = values.groupby([df["id"], bucket])
+        keep = pd.Index(grouped.idxmin()).union(pd.Index(grouped.idxmax()))
+        return df.loc[keep]
+
     def plot_time_series(
         self,
         df: pd.DataFrame,
@@ -90,13 +172,55 @@ class Visualizer:
         plt.savefig(output_path)
         plt.close()
 
+    def _decomposition_figure(self, rows: int) -> Figure:
+        """Return this thread's reusable *rows*-panel decomposition figure."""
+
+        fig: Optional[Figure] = getattr(self._local, "decomp_fig", None)
+        if fig is None:
+            # Not registered with pyplot, so it is never shown or leaked. Fixed
+            # margins replace tight_layout, which costs an extra full draw.
+            fig = Figure()
+            fig.subplots(rows, 1, sharex=True)
+            fig.subplots_adjust(
+                left=0.14, right=0.97, bottom=0.07, top=0.93, hspace=0.25
+            )
+            self._local.decomp_fig = fig
+        return fig
+
     def plot_decomposition(self, result: DecomposeResult, output_path: str) -> None:
-        """Save seasonal decomposition components as a PNG."""
+        """Save seasonal decomposition components as a PNG.
+
+        Decomposition results are drawn like ``DecomposeResult.plot`` onto a
+        four-panel figure that is built once per visualizer and thread and
+        redrawn for each call; other objects are rendered with their own
+        ``plot()``.
+        """
 
-        fig = result.plot()
         os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        parts = ("observed", "trend", "seasonal", "resid")
+        if not all(isinstance(getattr(result, p, None), pd.Series) for p in parts):
+            fig = result.plot()
+            fig.savefig(output_path)
+            plt.close(fig)
+            return
+
+        fig = self._decomposition_figure(len(parts))
+        observed = result.observed
+        xlim = (observed.index[0], observed.index[-1])
+        for ax, part in zip(fig.axes, parts):
+            series = getattr(result, part)
+            ax.cla()
+            if part == "resid":
+                ax.plot(series, marker="o", linestyle="none")
+                ax.plot(xlim, (0, 0), color="#000000", zorder=-3)
+            else:
+                ax.plot(series)
+            if part == "observed":
+                ax.set_title(observed.name if observed.name is not None else "Observed")
+            else:
+                ax.set_ylabel(str(series.name or part).capitalize())
+            ax.set_xlim(xlim)
         fig.savefig(output_path)
-        plt.close(fig)
 
     # ------------------------------------------------------------------
     # Animated GIF helpers
@@ -156,8 +280,12 @@ class Visualizer:
         output_dir: str,
         duration: float = 2,
         loop: int = 0,
+        workers: int = 1,
     ) -> None:
-        """Generate one GIF per site, grouping files by site ID."""
+        """Generate one GIF per site, grouping files by site ID.
+
+        Sites are encoded in *workers* processes (``-1`` = all cores).
+        """
 
         images_dir = Path(images_dir)
         files = sorted(images_dir.glob(pattern))
@@ -174,41 +302,20 @@ class Visualizer:
                 groups[site].append(p)
 
         safe_pattern = re.sub(r"[^\w]+", "_", pattern)
-        for site, paths in groups.items():
-            out_name = f"{site}_{safe_pattern}.gif"
-            out_path = Path(output_dir) / out_name
-
-            frames: List[Image.Image] = []
-            for p in paths:
-                arr = imageio.imread(str(p))
-                im = Image.fromarray(arr)
-                draw = ImageDraw.Draw(im)
-                date_text = p.stem.split("_")[-1]
-                default_font = ImageFont.load_default()
-                ascent, descent = default_font.getmetrics()  # type: ignore[union-attr]
-                default_font_height = ascent + descent
-                try:
-                    font: ImageFont.FreeTypeFont | ImageFont.ImageFont = (
-                        ImageFont.truetype("arial.ttf", default_font_height * 2)
-                    )
-                except Exception:
-                    font = default_font
-                bbox = draw.textbbox((0, 0), date_text, font=font)
-                text_width, text_height = bbox[2] - bbox[0], bbox[3] - bbox[1]
-                draw.rectangle([3, 5, 45 + text_width, 20 + text_height], fill="black")
-                draw.text((5, 5), date_text, fill="white", font_size=18)
-                frames.append(im.copy())
-
-            os.makedirs(Path(output_dir), exist_ok=True)
-            if frames:
-                frames[0].save(
-                    str(out_path),
-                    format="GIF",
-                    save_all=True,
-                    append_images=frames[1:],
-                    duration=int(duration * 1000),
-                    loop=loop,
-                )
+        os.makedirs(Path(output_dir), exist_ok=True)
+        jobs = [
+            (paths, Path(output_dir) / f"{site}_{safe_pattern}.gif", duration, loop)
+            for site, paths in groups.items()
+        ]
+        workers = min(len(jobs), workers if workers > 0 else os.cpu_count() or 1)
+        if workers <= 1:
+            written = [_write_site_gif(job) for job in jobs]
+        else:
+            # Decoding frames and LZW-encoding GIFs is CPU bound, so sites
+            # are spread over processes rather than threads.
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                written = list(pool.map(_write_site_gif, jobs))
+        for site, out_path in zip(groups, written):
             self.logger.info("Wrote GIF for site %s → %s", site, out_path)
 
     # ------------------------------------------------------------------
@@ -265,8 +372,7 @@ class Visualizer:
             template_dir = Path(template_path)
         else:
             template_dir = Path(__file__).parent.parent / "templates"
-        env = Environment(loader=FileSystemLoader(str(template_dir)), autoescape=True)
-        template = env.get_template("gallery.html.j2")
+        template = _jinja_env(str(template_dir)).get_template("gallery.html.j2")
 
         html = template.render(title=title, gallery=gallery)
 
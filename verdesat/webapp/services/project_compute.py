@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any, Dict, Tuple, Protocol, Callable, cast
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 from shapely.geometry import mapping
 
@@ -229,15 +230,14 @@ def _ndvi_stats(
     if res is None:
         res = cast(dict[Any, Any], decomp).get(pid)
     if res is not None:
+        # Components share the observed index, so stack them as one float
+        # block instead of aligning four Series.
+        components = ["observed", "trend", "seasonal", "resid"]
         decomp_df = pd.DataFrame(
-            {
-                "date": res.observed.index,
-                "observed": res.observed.values,
-                "trend": res.trend.values,
-                "seasonal": res.seasonal.values,
-                "resid": res.resid.values,
-            }
+            np.column_stack([getattr(res, name).values for name in components]),
+            columns=components,
         )
+        decomp_df.insert(0, "date", np.asarray(res.observed.index))
         decomp_bytes = _df_to_bytes(decomp_df)
         decomp_dir: dict[int, io.BytesIO] | None = {pid: decomp_bytes}
     else: